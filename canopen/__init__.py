@@ -1,4 +1,4 @@
-from canopen.network import Network, NodeScanner
+from canopen.network import AsyncNetwork, Network, NodeScanner
 from canopen.node import LocalNode, RemoteNode
 from canopen.objectdictionary import (
     ObjectDictionary,
@@ -17,6 +17,7 @@ except ImportError:
 
 __all__ = [
     "Network",
+    "AsyncNetwork",
     "NodeScanner",
     "RemoteNode",
     "LocalNode",
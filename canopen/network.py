@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import itertools
 import logging
+import math
 import threading
-from collections.abc import Iterator, MutableMapping
+import time
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 from typing import Callable, Final, Optional, Union
 
 import can
@@ -12,6 +17,9 @@ from canopen.nmt import NmtMaster
 from canopen.node import LocalNode, RemoteNode
 from canopen.objectdictionary import ObjectDictionary
 from canopen.objectdictionary.eds import import_from_node
+from canopen.scheduler import Scheduler, TimerHandle
+from canopen.sdo import SdoClient
+from canopen.sdo.exceptions import SdoError
 from canopen.sync import SyncProducer
 from canopen.timestamp import TimeProducer
 
@@ -19,6 +27,10 @@ from canopen.timestamp import TimeProducer
 logger = logging.getLogger(__name__)
 
 Callback = Callable[[int, bytearray, float], None]
+BatchCallback = Callable[[int, list[tuple[bytearray, float]]], None]
+
+#: Number of distinct standard (11-bit) CAN identifiers
+_STD_ID_COUNT: Final[int] = 0x800
 
 
 class Network(MutableMapping):
@@ -26,6 +38,13 @@ class Network(MutableMapping):
 
     NOTIFIER_CYCLE: float = 1.0  #: Maximum waiting time for one notifier iteration.
     NOTIFIER_SHUTDOWN_TIMEOUT: float = 5.0  #: Maximum waiting time to stop notifiers.
+    #: Maximum number of messages per batch when receiving with a
+    #: :class:`BatchNotifier`.  Zero uses a plain :class:`can.Notifier` instead.
+    NOTIFIER_BATCH_SIZE: int = 0
+    #: How :meth:`send_periodic` transmits messages, ``"bus"`` for python-can's
+    #: cyclic tasks or ``"shared"`` for a :class:`PeriodicScheduler` sending
+    #: all periodic messages of the network from the :attr:`scheduler` thread.
+    PERIODIC_BACKEND: str = "bus"
 
     def __init__(self, bus: Optional[can.BusABC] = None):
         """
@@ -37,12 +56,27 @@ class Network(MutableMapping):
         self.bus = bus
         #: A :class:`~canopen.network.NodeScanner` for detecting nodes
         self.scanner = NodeScanner(self)
+        #: A :class:`~canopen.scheduler.Scheduler` for timed activities of
+        #: all nodes, sharing a single thread
+        self.scheduler = Scheduler()
+        #: A :class:`~canopen.network.PeriodicScheduler` transmitting the
+        #: periodic messages if :attr:`PERIODIC_BACKEND` is ``"shared"``
+        self.periodic_scheduler = PeriodicScheduler(self)
         #: List of :class:`can.Listener` objects.
         #: Includes at least MessageListener.
         self.listeners: list[can.Listener] = [MessageListener(self)]
-        self.notifier: Optional[can.Notifier] = None
+        self.notifier: Optional[Union[can.Notifier, BatchNotifier]] = None
         self.nodes: dict[int, Union[RemoteNode, LocalNode]] = {}
+        #: Callbacks per CAN ID, only modify via :meth:`subscribe` and
+        #: :meth:`unsubscribe` to keep the dispatch tables in sync
         self.subscribers: dict[int, list[Callback]] = {}
+        #: Callbacks per CAN ID receiving consecutive messages of a batch at once,
+        #: only modify via :meth:`subscribe_batch` and :meth:`unsubscribe`
+        self.batch_subscribers: dict[int, list[BatchCallback]] = {}
+        # Precompiled dispatch tables derived from subscribers, indexed
+        # directly by 11-bit CAN ID with a fallback for 29-bit IDs
+        self._dispatch: list[tuple[Callback, ...]] = [()] * _STD_ID_COUNT
+        self._dispatch_ext: dict[int, tuple[Callback, ...]] = {}
         self.send_lock = threading.Lock()
         self.sync = SyncProducer(self)
         self.time = TimeProducer(self)
@@ -64,6 +98,7 @@ class Network(MutableMapping):
         self.subscribers.setdefault(can_id, list())
         if callback not in self.subscribers[can_id]:
             self.subscribers[can_id].append(callback)
+        self._update_dispatch(can_id)
 
     def unsubscribe(self, can_id, callback=None) -> None:
         """Stop listening for message.
@@ -72,12 +107,53 @@ class Network(MutableMapping):
             The CAN ID from which to unsubscribe.
         :param callback:
             If given, remove only this callback.  Otherwise all callbacks for
-            the CAN ID.
+            the CAN ID, including batch callbacks.
         """
-        if callback is not None:
+        if callback is None:
+            if can_id not in self.subscribers and can_id not in self.batch_subscribers:
+                raise KeyError(can_id)
+            self.subscribers.pop(can_id, None)
+            self.batch_subscribers.pop(can_id, None)
+        elif callback in self.batch_subscribers.get(can_id, ()):
+            self.batch_subscribers[can_id].remove(callback)
+            if not self.batch_subscribers[can_id]:
+                del self.batch_subscribers[can_id]
+        else:
             self.subscribers[can_id].remove(callback)
-        if not self.subscribers[can_id] or callback is None:
-            del self.subscribers[can_id]
+            if not self.subscribers[can_id]:
+                del self.subscribers[can_id]
+        self._update_dispatch(can_id)
+
+    def subscribe_batch(self, can_id: int, callback: BatchCallback) -> None:
+        """Listen for messages with a specific CAN ID, delivered in batches.
+
+        When messages are fed through :meth:`notify_many`, the callback is
+        called once for each run of consecutive messages with this CAN ID.
+        Messages fed through :meth:`notify` are passed as a batch of one.
+
+        :param can_id:
+            The CAN ID to listen for.
+        :param callback:
+            Function to call with the CAN ID and a list of ``(data, timestamp)``
+            tuples in order of reception.
+        """
+        self.batch_subscribers.setdefault(can_id, list())
+        if callback not in self.batch_subscribers[can_id]:
+            self.batch_subscribers[can_id].append(callback)
+        self._update_dispatch(can_id)
+
+    def _update_dispatch(self, can_id: int) -> None:
+        """Recompile the dispatch table entry for one CAN ID from subscribers."""
+        callbacks = tuple(self.subscribers.get(can_id, ())) + tuple(
+            _single_message_batch(batch_callback)
+            for batch_callback in self.batch_subscribers.get(can_id, ())
+        )
+        if 0 <= can_id < _STD_ID_COUNT:
+            self._dispatch[can_id] = callbacks
+        elif callbacks:
+            self._dispatch_ext[can_id] = callbacks
+        else:
+            self._dispatch_ext.pop(can_id, None)
 
     def connect(self, *args, **kwargs) -> Network:
         """Connect to CAN bus using python-can.
@@ -108,17 +184,28 @@ class Network(MutableMapping):
             self.bus = can.Bus(*args, **kwargs)
         logger.info("Connected to '%s'", self.bus.channel_info)
         if self.notifier is None:
-            self.notifier = can.Notifier(self.bus, self.listeners, self.NOTIFIER_CYCLE)
+            self.notifier = self._create_notifier(self.bus)
         return self
 
+    def _create_notifier(self, bus: can.BusABC) -> Union[can.Notifier, BatchNotifier]:
+        if self.NOTIFIER_BATCH_SIZE:
+            return BatchNotifier(bus, self.listeners, self.NOTIFIER_CYCLE,
+                                 self.NOTIFIER_BATCH_SIZE)
+        return can.Notifier(bus, self.listeners, self.NOTIFIER_CYCLE)
+
     def disconnect(self) -> None:
         """Disconnect from the CAN bus.
 
         Must be overridden in a subclass if a custom interface is used.
         """
         for node in self.nodes.values():
+            if hasattr(node, "tpdo_producer"):
+                node.tpdo_producer.stop()
             if hasattr(node, "pdo"):
                 node.pdo.stop()
+        self.sync.stop()
+        self.periodic_scheduler.stop()
+        self.scheduler.stop()
         if self.notifier is not None:
             self.notifier.stop(self.NOTIFIER_SHUTDOWN_TIMEOUT)
         if self.bus is not None:
@@ -214,6 +301,49 @@ class Network(MutableMapping):
             self.bus.send(msg)
         self.check()
 
+    def send_messages(self, can_id: int, frames: Iterable[bytes]) -> None:
+        """Send several raw CAN messages with the same CAN-ID back to back.
+
+        The messages are handed to the bus in one go, without messages from
+        other threads in between.  If :meth:`send_message` has been overridden,
+        it is called for each message instead.
+
+        :param int can_id:
+            CAN-ID of the messages
+        :param frames:
+            Data of each message to be transmitted
+
+        :raises can.CanError:
+            When a message fails to be transmitted
+        """
+        self.send_batch([(can_id, data) for data in frames])
+
+    def send_batch(self, frames: Iterable[tuple[int, bytes]]) -> None:
+        """Send several raw CAN messages back to back.
+
+        Like :meth:`send_messages`, but each message has its own CAN-ID.
+
+        :param frames:
+            CAN-ID and data of each message to be transmitted
+
+        :raises can.CanError:
+            When a message fails to be transmitted
+        """
+        if getattr(self.send_message, "__func__", None) is not Network.send_message:
+            for can_id, data in frames:
+                self.send_message(can_id, data)
+            return
+        if not self.bus:
+            raise RuntimeError("Not connected to CAN bus")
+        messages = [can.Message(is_extended_id=can_id > 0x7FF,
+                                arbitration_id=can_id,
+                                data=data)
+                    for can_id, data in frames]
+        with self.send_lock:
+            for msg in messages:
+                self.bus.send(msg)
+        self.check()
+
     def send_periodic(
         self, can_id: int, data: bytes, period: float, remote: bool = False
     ) -> PeriodicMessageTask:
@@ -230,9 +360,115 @@ class Network(MutableMapping):
 
         :return:
             An task object with a ``.stop()`` method to stop the transmission
+        :raises ValueError:
+            If :attr:`PERIODIC_BACKEND` is not a known backend.
         """
+        if self.PERIODIC_BACKEND == "shared":
+            return ScheduledMessageTask(can_id, data, period, self.periodic_scheduler, remote)
+        if self.PERIODIC_BACKEND != "bus":
+            raise ValueError(f"Unknown periodic backend {self.PERIODIC_BACKEND!r}")
         return PeriodicMessageTask(can_id, data, period, self.bus, remote)
 
+    def sdo_read_many(
+        self,
+        index: int,
+        subindex: int = 0,
+        node_ids: Optional[Iterable[int]] = None,
+    ) -> dict[int, Union[bytes, Exception]]:
+        """Read the same object from several remote nodes concurrently.
+
+        The upload requests are sent to all nodes before waiting for any
+        response, so the whole operation takes roughly one SDO round-trip as
+        long as the objects fit in an expedited transfer.  Segmented
+        transfers are completed node by node afterwards.
+
+        :param index:
+            Index of object to read.
+        :param subindex:
+            Sub-index of object to read.
+        :param node_ids:
+            Nodes to read from, defaults to all remote nodes of the network.
+
+        :return:
+            Dictionary mapping each node ID to either the data read, or the
+            exception which occurred for this node.
+        """
+        clients = self._sdo_clients(node_ids)
+        results: dict[int, Union[bytes, Exception]] = {}
+        requests = {}
+        for node_id, sdo in clients.items():
+            try:
+                requests[node_id] = sdo._begin_upload(index, subindex)
+            except (SdoError, can.CanError) as exc:
+                results[node_id] = exc
+        for node_id, request in requests.items():
+            try:
+                results[node_id] = clients[node_id]._end_upload(index, subindex, request)
+            except (SdoError, can.CanError) as exc:
+                results[node_id] = exc
+        return {node_id: results[node_id] for node_id in clients}
+
+    def sdo_write_many(
+        self,
+        index: int,
+        subindex: int,
+        data: Union[bytes, Mapping[int, bytes]],
+        node_ids: Optional[Iterable[int]] = None,
+    ) -> dict[int, Optional[Exception]]:
+        """Write an object on several remote nodes concurrently.
+
+        Works like :meth:`sdo_read_many`, sending all download requests
+        before waiting for any response.
+
+        :param index:
+            Index of object to write.
+        :param subindex:
+            Sub-index of object to write.
+        :param data:
+            Data to write to all nodes, or a mapping of node IDs to the data
+            for each node.
+        :param node_ids:
+            Nodes to write to, defaults to the keys of *data* if it is a
+            mapping, otherwise all remote nodes of the network.
+
+        :return:
+            Dictionary mapping each node ID to ``None`` on success, or the
+            exception which occurred for this node.
+        """
+        if isinstance(data, Mapping):
+            clients = self._sdo_clients(data.keys() if node_ids is None else node_ids)
+            node_data = data
+        else:
+            clients = self._sdo_clients(node_ids)
+            node_data = dict.fromkeys(clients, data)
+        results: dict[int, Optional[Exception]] = {}
+        requests = {}
+        for node_id, sdo in clients.items():
+            try:
+                requests[node_id] = sdo._begin_download(index, subindex, node_data[node_id])
+            except (SdoError, can.CanError) as exc:
+                results[node_id] = exc
+        for node_id, request in requests.items():
+            try:
+                clients[node_id]._end_download(node_data[node_id], request)
+            except (SdoError, can.CanError) as exc:
+                results[node_id] = exc
+            else:
+                results[node_id] = None
+        return {node_id: results[node_id] for node_id in clients}
+
+    def _sdo_clients(self, node_ids: Optional[Iterable[int]]) -> dict[int, SdoClient]:
+        if node_ids is None:
+            return {node_id: node.sdo for node_id, node in self.nodes.items()
+                    if isinstance(node, RemoteNode)}
+        clients = {}
+        for node_id in node_ids:
+            node = self.nodes[node_id]
+            if not isinstance(node, RemoteNode):
+                raise TypeError(f"Node {node_id} is not a remote node")
+            clients[node_id] = node.sdo
+        return clients
+
     def notify(self, can_id: int, data: bytearray, timestamp: float) -> None:
         """Feed incoming message to this library.
 
@@ -246,11 +482,59 @@ class Network(MutableMapping):
         :param timestamp:
             Timestamp of the message, preferably as a Unix timestamp
         """
-        if can_id in self.subscribers:
-            callbacks = self.subscribers[can_id]
-            for callback in callbacks:
-                callback(can_id, data, timestamp)
-        self.scanner.on_message_received(can_id)
+        if can_id < _STD_ID_COUNT:
+            callbacks = self._dispatch[can_id]
+        else:
+            callbacks = self._dispatch_ext.get(can_id, ())
+        for callback in callbacks:
+            callback(can_id, data, timestamp)
+        if self.scanner.enabled:
+            self.scanner.on_message_received(can_id)
+
+    def notify_many(self, messages: Iterable[tuple[int, bytearray, float]]) -> None:
+        """Feed several incoming messages to this library at once.
+
+        Messages are dispatched in the order of reception.  Consecutive
+        messages with the same CAN ID form a run, callbacks registered with
+        :meth:`subscribe_batch` are called once per run and others once per
+        message.  An exception raised by a callback is logged and does not
+        keep the other callbacks from being called.
+
+        :param messages:
+            Iterable of ``(can_id, data, timestamp)`` tuples, as would be
+            passed to :meth:`notify`.
+        """
+        run_id = -1
+        run: list[tuple[bytearray, float]] = []
+        for can_id, data, timestamp in messages:
+            if can_id != run_id:
+                if run:
+                    self._notify_run(run_id, run)
+                run_id = can_id
+                run = []
+            run.append((data, timestamp))
+        if run:
+            self._notify_run(run_id, run)
+
+    def _notify_run(self, can_id: int, run: list[tuple[bytearray, float]]) -> None:
+        """Dispatch consecutive messages with the same CAN ID."""
+        callbacks = tuple(self.subscribers.get(can_id, ()))
+        if callbacks:
+            for data, timestamp in run:
+                for callback in callbacks:
+                    try:
+                        callback(can_id, data, timestamp)
+                    except Exception as e:
+                        logger.error(str(e))
+        batch_callbacks = self.batch_subscribers.get(can_id)
+        if batch_callbacks:
+            for batch_callback in tuple(batch_callbacks):
+                try:
+                    batch_callback(can_id, run)
+                except Exception as e:
+                    logger.error(str(e))
+        if self.scanner.enabled:
+            self.scanner.on_message_received(can_id)
 
     def check(self) -> None:
         """Check that no fatal error has occurred in the receiving thread.
@@ -286,6 +570,42 @@ class Network(MutableMapping):
         return len(self.nodes)
 
 
+class AsyncNetwork(Network):
+    """Representation of one CAN bus for use with :mod:`asyncio`.
+
+    Received messages are dispatched in the event loop thread, using the
+    asyncio support of :class:`can.Notifier`.  SDO transfers must then use
+    the asynchronous methods such as :meth:`canopen.sdo.SdoClient.aupload`,
+    as the blocking ones would stall the event loop waiting for responses.
+    """
+
+    def __init__(
+        self,
+        bus: Optional[can.BusABC] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        """
+        :param can.BusABC bus:
+            A python-can bus instance to re-use.
+        :param loop:
+            The event loop to dispatch messages in.  Defaults to the loop
+            running when :meth:`connect` is called.
+        """
+        super().__init__(bus)
+        self.loop = loop
+
+    def _create_notifier(self, bus: can.BusABC) -> can.Notifier:
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        return can.Notifier(bus, self.listeners, self.NOTIFIER_CYCLE, loop=self.loop)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        self.disconnect()
+
+
 class _UninitializedNetwork(Network):
     """Empty network implementation as a placeholder before actual initialization."""
 
@@ -356,6 +676,167 @@ class PeriodicMessageTask:
             self._start()
 
 
+class ScheduledMessageTask(PeriodicMessageTask):
+    """
+    Task object to transmit a message periodically using a
+    :class:`PeriodicScheduler` shared with other tasks
+    """
+
+    def __init__(
+        self,
+        can_id: int,
+        data: bytes,
+        period: float,
+        scheduler: PeriodicScheduler,
+        remote: bool = False,
+    ):
+        """
+        :param can_id:
+            CAN-ID of the message
+        :param data:
+            Data to be transmitted (anything that can be converted to bytes)
+        :param period:
+            Seconds between each message
+        :param scheduler:
+            Scheduler to use for transmission
+        """
+        self.scheduler = scheduler
+        # Number of the period of the next transmission
+        self._index = 0
+        self._active = False
+        # Order of tasks with the same deadline, renewed each time the task
+        # is added so entries left in the queue from before are ignored
+        self._seq = 0
+        super().__init__(can_id, data, period, scheduler.network.bus, remote)
+
+    def _start(self):
+        self.scheduler.add(self)
+
+    def stop(self):
+        """Stop transmission"""
+        self.scheduler.remove(self)
+
+    def update(self, data: bytes) -> None:
+        """Update data of message
+
+        :param data:
+            New data to transmit
+        """
+        # The message is read by the scheduler thread, so replace the data
+        # as a whole
+        self.msg.data = bytearray(data)
+
+
+class PeriodicScheduler:
+    """Transmits the periodic messages of a network using its scheduler.
+
+    Each message is transmitted at multiples of its period from a common
+    start time, so messages with equal or harmonic periods are due at the
+    same time and are transmitted back to back.  The first transmission
+    happens at the next multiple of the period, up to one period after
+    starting the task.  Transmissions which are late by whole periods are
+    skipped instead of sent in a burst.
+
+    Only the earliest deadline is scheduled as a call on
+    :attr:`Network.scheduler`, so all periodic messages share the thread
+    with the other timed activities of the network.  Used by
+    :meth:`Network.send_periodic` if :attr:`Network.PERIODIC_BACKEND` is
+    ``"shared"``.
+
+    :param network:
+        The network to transmit on.
+    """
+
+    def __init__(self, network: Network):
+        self.network = network
+        self._queue: list[tuple[float, int, ScheduledMessageTask]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        # Call scheduled for the earliest deadline
+        self._timer: Optional[TimerHandle] = None
+        self._epoch = time.monotonic()
+
+    def add(self, task: ScheduledMessageTask) -> None:
+        """Start transmitting a task."""
+        with self._lock:
+            elapsed = time.monotonic() - self._epoch
+            task._index = math.ceil(elapsed / task.period)
+            task._active = True
+            task._seq = next(self._counter)
+            self._push(task)
+            self._schedule()
+
+    def remove(self, task: ScheduledMessageTask) -> None:
+        """Stop transmitting a task."""
+        # Removed from the queue when it is due, or ignored if the task is
+        # added again before
+        task._active = False
+
+    def stop(self) -> None:
+        """Stop all tasks."""
+        with self._lock:
+            for _, _, task in self._queue:
+                task._active = False
+            self._queue.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _push(self, task: ScheduledMessageTask) -> None:
+        deadline = self._epoch + task._index * task.period
+        heapq.heappush(self._queue, (deadline, task._seq, task))
+
+    def _schedule(self) -> None:
+        """Make sure a call is scheduled for the earliest deadline."""
+        queue = self._queue
+        while queue and not _is_current(queue[0]):
+            heapq.heappop(queue)
+        if not queue:
+            return
+        deadline = queue[0][0]
+        timer = self._timer
+        if timer is not None:
+            if timer.deadline <= deadline:
+                return
+            timer.cancel()
+        self._timer = self.network.scheduler.call_at(deadline, self._on_due)
+
+    def _on_due(self) -> None:
+        queue = self._queue
+        with self._lock:
+            timer = self._timer
+            if timer is not None and timer.deadline <= time.monotonic():
+                # This call, unless replaced by a later one in the meantime
+                self._timer = None
+            # Collect all messages which are due
+            elapsed = time.monotonic() - self._epoch
+            messages = []
+            while queue and queue[0][0] <= self._epoch + elapsed:
+                entry = heapq.heappop(queue)
+                if not _is_current(entry):
+                    continue
+                task = entry[2]
+                messages.append(task.msg)
+                task._index = max(task._index + 1, math.floor(elapsed / task.period) + 1)
+                self._push(task)
+            self._schedule()
+        bus = self.network.bus
+        if bus is None or not messages:
+            return
+        try:
+            with self.network.send_lock:
+                for msg in messages:
+                    bus.send(msg)
+        except can.CanError:
+            logger.exception("Failed to transmit periodic messages")
+
+
+def _is_current(entry: tuple[float, int, ScheduledMessageTask]) -> bool:
+    """Check if a queue entry belongs to the running task."""
+    _, seq, task = entry
+    return task._active and seq == task._seq
+
+
 class MessageListener(can.Listener):
     """Listens for messages on CAN bus and feeds them to a Network instance.
 
@@ -373,13 +854,113 @@ class MessageListener(can.Listener):
         try:
             self.network.notify(msg.arbitration_id, msg.data, msg.timestamp)
         except Exception as e:
-            # Exceptions in any callbaks should not affect CAN processing
+            # Exceptions in any callbacks should not affect CAN processing
+            logger.error(str(e))
+
+    def on_messages_received(self, msgs: list[can.Message]) -> None:
+        """Feed a batch of messages to the network with one call."""
+        try:
+            self.network.notify_many(
+                (msg.arbitration_id, msg.data, msg.timestamp)
+                for msg in msgs
+                if not (msg.is_error_frame or msg.is_remote_frame)
+            )
+        except Exception as e:
+            # Exceptions in any callbacks should not affect CAN processing
             logger.error(str(e))
 
     def stop(self) -> None:
         """Override abstract base method to release any resources."""
 
 
+class BatchNotifier:
+    """Receives messages from a bus in batches and dispatches them to listeners.
+
+    A replacement for :class:`can.Notifier` when bursts of traffic are
+    expected.  After the first message arrives, all messages already queued
+    in the bus are drained without waiting, up to *max_batch* messages.
+    Listeners providing an ``on_messages_received()`` method get the whole
+    batch at once, others are called for each message.
+
+    :param bus:
+        The python-can bus to read from.
+    :param listeners:
+        List of :class:`can.Listener` objects to notify.
+    :param timeout:
+        Maximum time in seconds to wait for the first message of a batch.
+    :param max_batch:
+        Maximum number of messages per batch.
+    """
+
+    def __init__(
+        self,
+        bus: can.BusABC,
+        listeners: list[can.Listener],
+        timeout: float = 1.0,
+        max_batch: int = 256,
+    ):
+        self.bus = bus
+        self.listeners = listeners
+        self.timeout = timeout
+        self.max_batch = max_batch
+        #: Exception raised in the receiving thread, if any
+        self.exception: Optional[Exception] = None
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._rx_thread, name=f"canopen.BatchNotifier for bus {bus.channel_info!r}",
+            daemon=True)
+        self._thread.start()
+
+    def _rx_thread(self) -> None:
+        bus = self.bus
+        try:
+            while self._running:
+                msg = bus.recv(self.timeout)
+                if msg is None:
+                    continue
+                batch = [msg]
+                while len(batch) < self.max_batch:
+                    msg = bus.recv(0)
+                    if msg is None:
+                        break
+                    batch.append(msg)
+                self._dispatch(batch)
+        except Exception as exc:
+            self.exception = exc
+            logger.error("Receiving messages failed: %s", exc)
+            self._running = False
+
+    def _dispatch(self, batch: list[can.Message]) -> None:
+        for listener in self.listeners:
+            on_messages_received = getattr(listener, "on_messages_received", None)
+            if on_messages_received is not None:
+                on_messages_received(batch)
+            else:
+                for msg in batch:
+                    listener.on_message_received(msg)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop receiving and wait for the thread to finish.
+
+        :param timeout:
+            Maximum time in seconds to wait for the receiving thread.
+        """
+        self._running = False
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        for listener in self.listeners:
+            listener.stop()
+
+
+def _single_message_batch(batch_callback: BatchCallback) -> Callback:
+    """Adapt a batch callback to be called for a single message."""
+
+    def callback(can_id: int, data: bytearray, timestamp: float) -> None:
+        batch_callback(can_id, [(data, timestamp)])
+
+    return callback
+
+
 class NodeScanner:
     """Observes which nodes are present on the bus.
 
@@ -399,14 +980,31 @@ class NodeScanner:
         if network is None:
             network = _UNINITIALIZED_NETWORK
         self.network: Network = network
-        #: A :class:`list` of nodes discovered
-        self.nodes: list[int] = []
+        #: Set to ``False`` to skip node detection for every received message
+        self.enabled: bool = True
+        self._nodes: list[int] = []
+        self._found: set[int] = set()
+        self._services = frozenset(self.SERVICES)
+
+    @property
+    def nodes(self) -> list[int]:
+        """A :class:`list` of nodes discovered."""
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes: list[int]):
+        self._nodes = nodes
+        self._found = set(nodes)
 
     def on_message_received(self, can_id: int):
-        service = can_id & 0x780
         node_id = can_id & 0x7F
-        if node_id not in self.nodes and node_id != 0 and service in self.SERVICES:
-            self.nodes.append(node_id)
+        if (
+            node_id not in self._found
+            and node_id != 0
+            and can_id & 0x780 in self._services
+        ):
+            self._found.add(node_id)
+            self._nodes.append(node_id)
 
     def reset(self):
         """Clear list of found nodes."""
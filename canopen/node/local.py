@@ -10,7 +10,7 @@ from canopen.emcy import EmcyProducer
 from canopen.nmt import NmtSlave
 from canopen.node.base import BaseNode
 from canopen.objectdictionary import ObjectDictionary
-from canopen.pdo import PDO, RPDO, TPDO
+from canopen.pdo import PDO, RPDO, SyncPdoEngine, TPDO, TpdoProducer
 from canopen.sdo import SdoAbortedError, SdoServer
 
 
@@ -21,11 +21,13 @@ class LocalNode(BaseNode):
     """Local CANopen node implementing essential communication services.
 
     This does not provide a full-fledged communication logic stack, but needs
-    additional application logic to wire up the various services, such as
-    triggering PDO transmissions according to their communication parameters.
+    additional application logic to wire up the various services.
 
-    Notable exceptions are a local data store for SDO server access, and using
-    the Heartbeat Producer Time parameter to control Heartbeat transmission.
+    Notable exceptions are a local data store for SDO server access, using
+    the Heartbeat Producer Time parameter to control Heartbeat transmission,
+    and handling PDOs according to their communication parameters once started
+    through :attr:`tpdo_producer` (event-driven TPDOs) and :attr:`sync_engine`
+    (synchronous TPDOs and all RPDOs).
 
     :param node_id:
         Node ID (set to 0 if specified by object dictionary)
@@ -44,11 +46,16 @@ class LocalNode(BaseNode):
         self.data_store: dict[int, dict[int, bytes]] = {}
         self._read_callbacks: list[Callable] = []
         self._write_callbacks: list[Callable] = []
+        self._store_callbacks: list[Callable] = []
 
         self.sdo = SdoServer(0x600 + self.id, 0x580 + self.id, self)
         self.tpdo = TPDO(self)
         self.rpdo = RPDO(self)
         self.pdo = PDO(self, self.rpdo, self.tpdo)
+        #: Transmits event-driven TPDOs on changes, see :meth:`TpdoProducer.start`
+        self.tpdo_producer = TpdoProducer(self)
+        #: Handles synchronous PDOs on SYNC, see :meth:`SyncPdoEngine.start`
+        self.sync_engine = SyncPdoEngine(self)
         self.nmt = NmtSlave(self.id, self)
         # Let self.nmt handle writes for 0x1017
         self.add_write_callback(self.nmt.on_write)
@@ -84,6 +91,25 @@ class LocalNode(BaseNode):
     def add_write_callback(self, callback: Callable):
         self._write_callbacks.append(callback)
 
+    def remove_write_callback(self, callback: Callable):
+        self._write_callbacks.remove(callback)
+
+    def add_store_callback(self, callback: Callable):
+        """Add a function to be called after data has been stored.
+
+        Unlike write callbacks, which are called before storing and may
+        reject the write by raising :class:`~canopen.SdoAbortedError`, these
+        are only called once the new data is in :attr:`data_store`.
+
+        :param callback:
+            Function taking the keyword arguments ``index``, ``subindex``,
+            ``od`` and ``data``.
+        """
+        self._store_callbacks.append(callback)
+
+    def remove_store_callback(self, callback: Callable):
+        self._store_callbacks.remove(callback)
+
     def get_data(
         self, index: int, subindex: int, check_readable: bool = False
     ) -> bytes:
@@ -139,6 +165,9 @@ class LocalNode(BaseNode):
         self.data_store.setdefault(index, {})
         self.data_store[index][subindex] = bytes(data)
 
+        for callback in self._store_callbacks:
+            callback(index=index, subindex=subindex, od=obj, data=data)
+
     def _find_object(self, index, subindex):
         if index not in self.object_dictionary:
             # Index does not exist
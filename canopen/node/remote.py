@@ -60,6 +60,7 @@ class RemoteNode(BaseNode):
         self.rpdo.network = network
         self.nmt.network = network
         for sdo in self.sdo_channels:
+            sdo.network = network
             network.subscribe(sdo.tx_cobid, sdo.on_response)
         network.subscribe(0x700 + self.id, self.nmt.on_heartbeat)
         network.subscribe(0x80 + self.id, self.emcy.on_emcy)
@@ -70,6 +71,7 @@ class RemoteNode(BaseNode):
             return
         for sdo in self.sdo_channels:
             self.network.unsubscribe(sdo.tx_cobid, sdo.on_response)
+            sdo.network = canopen.network._UNINITIALIZED_NETWORK
         self.network.unsubscribe(0x700 + self.id, self.nmt.on_heartbeat)
         self.network.unsubscribe(0x80 + self.id, self.emcy.on_emcy)
         self.network.unsubscribe(0, self.nmt.on_command)
@@ -96,6 +98,7 @@ class RemoteNode(BaseNode):
         client = SdoClient(rx_cobid, tx_cobid, self.object_dictionary)
         self.sdo_channels.append(client)
         if self.has_network():
+            client.network = self.network
             self.network.subscribe(client.tx_cobid, client.on_response)
         return client
 
@@ -6,13 +6,17 @@ from __future__ import annotations
 
 import logging
 import struct
+import sys
 from collections.abc import Collection, Iterator, Mapping, MutableMapping
-from typing import Optional, TextIO, Union
+from typing import Optional, TextIO, TYPE_CHECKING, Union
 
 from canopen.objectdictionary.datatypes import *
 from canopen.objectdictionary.datatypes import IntegerN, UnsignedN
 from canopen.utils import pretty_index
 
+if TYPE_CHECKING:
+    from canopen.objectdictionary.cache import ObjectDictionaryCache
+
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +79,8 @@ def export_od(
 def import_od(
     source: Union[str, TextIO, None],
     node_id: Optional[int] = None,
+    cache: Optional[ObjectDictionaryCache] = None,
+    lazy: bool = False,
 ) -> ObjectDictionary:
     """Parse an EDS, DCF, or EPF file.
 
@@ -83,6 +89,14 @@ def import_od(
     :param node_id:
         For EDS and DCF files, the node ID to use.
         For other formats, this parameter is ignored.
+    :param cache:
+        For EDS and DCF files given as a path, the
+        :class:`~canopen.objectdictionary.cache.ObjectDictionaryCache` to use.
+        Defaults to :data:`canopen.objectdictionary.cache.default_cache`.
+    :param lazy:
+        For EDS and DCF files, return a
+        :class:`~canopen.objectdictionary.eds.LazyObjectDictionary` which
+        only creates the objects when they are accessed.  No cache is used.
     :raises ObjectDictionaryError:
         For object dictionary errors and inconsistencies.
     :raises ValueError:
@@ -101,7 +115,13 @@ def import_od(
         filename = source
     suffix = filename[filename.rfind("."):].lower()
     if suffix in (".eds", ".dcf"):
-        from canopen.objectdictionary import eds
+        from canopen.objectdictionary import cache as od_cache, eds
+        if lazy:
+            return eds.import_eds(source, node_id, lazy=True)
+        if cache is None:
+            cache = od_cache.default_cache
+        if cache is not None and filename is source:
+            return cache.import_od(source, node_id)
         return eds.import_eds(source, node_id)
     elif suffix == ".epf":
         from canopen.objectdictionary import epf
@@ -294,8 +314,8 @@ class ODArray(Mapping):
             var = ODVariable(name, self.index, subindex)
             var.parent = self
             for attr in ("data_type", "unit", "factor", "min", "max", "default",
-                         "access_type", "description", "value_descriptions",
-                         "bit_definitions", "storage_location", "custom_options"):
+                         "access_type", "description", "_value_descriptions",
+                         "_bit_definitions", "storage_location", "_custom_options"):
                 if (template_value := getattr(template, attr)) is not None:
                     setattr(var, attr, template_value)
         else:
@@ -347,6 +367,16 @@ class ODVariable:
         REAL64: struct.Struct("<d")
     }
 
+    # Slots keep the many variables of large object dictionaries small.
+    # __dict__ still allows applications to add their own attributes.
+    __slots__ = (
+        "parent", "index", "subindex", "name", "unit", "factor", "min", "max",
+        "default", "default_raw", "relative", "value", "value_raw", "data_type",
+        "access_type", "is_domain", "description", "_value_descriptions",
+        "_bit_definitions", "storage_location", "pdo_mappable", "_custom_options",
+        "__dict__",
+    )
+
     def __init__(self, name: str, index: int, subindex: int = 0):
         #: The :class:`~canopen.ObjectDictionary`,
         #: :class:`~canopen.objectdictionary.ODRecord` or
@@ -357,7 +387,7 @@ class ODVariable:
         #: 8-bit sub-index of the object in the dictionary
         self.subindex = subindex
         #: String representation of the variable
-        self.name = name
+        self.name = sys.intern(name)
         #: Physical unit
         self.unit: str = ""
         #: Factor between physical unit and integer value
@@ -368,10 +398,14 @@ class ODVariable:
         self.max: Optional[int] = None
         #: Default value at start-up
         self.default: Optional[int] = None
+        #: Default value as written in the EDS file, e.g. ``$NODEID+0x180``
+        self.default_raw: Optional[str] = None
         #: Is the default value relative to the node-ID (only applies to COB-IDs)
         self.relative = False
         #: The value of this variable stored in the object dictionary
         self.value: Optional[int] = None
+        #: Parameter value as written in the DCF file
+        self.value_raw: Optional[str] = None
         #: Data type according to the standard as an :class:`int`
         self.data_type: int = 0
         #: Access type, should be "rw", "ro", "wo", or "const"
@@ -380,16 +414,47 @@ class ODVariable:
         self.is_domain: bool = False
         #: Description of variable
         self.description: str = ""
-        #: Dictionary of value descriptions
-        self.value_descriptions: dict[int, str] = {}
-        #: Dictionary of bitfield definitions
-        self.bit_definitions: dict[str, list[int]] = {}
+        # Mappings are only created when used, most variables have none
+        self._value_descriptions: Optional[dict[int, str]] = None
+        self._bit_definitions: Optional[dict[str, list[int]]] = None
         #: Storage location of index
         self.storage_location: Optional[str] = None
         #: Can this variable be mapped to a PDO
         self.pdo_mappable = False
-        #: Key-Value pairs not defined by the standard
-        self.custom_options: dict[str, str] = {}
+        self._custom_options: Optional[dict[str, str]] = None
+
+    @property
+    def value_descriptions(self) -> dict[int, str]:
+        """Dictionary of value descriptions"""
+        if self._value_descriptions is None:
+            self._value_descriptions = {}
+        return self._value_descriptions
+
+    @value_descriptions.setter
+    def value_descriptions(self, value_descriptions: dict[int, str]) -> None:
+        self._value_descriptions = value_descriptions
+
+    @property
+    def bit_definitions(self) -> dict[str, list[int]]:
+        """Dictionary of bitfield definitions"""
+        if self._bit_definitions is None:
+            self._bit_definitions = {}
+        return self._bit_definitions
+
+    @bit_definitions.setter
+    def bit_definitions(self, bit_definitions: dict[str, list[int]]) -> None:
+        self._bit_definitions = bit_definitions
+
+    @property
+    def custom_options(self) -> dict[str, str]:
+        """Key-Value pairs not defined by the standard"""
+        if self._custom_options is None:
+            self._custom_options = {}
+        return self._custom_options
+
+    @custom_options.setter
+    def custom_options(self, custom_options: dict[str, str]) -> None:
+        self._custom_options = custom_options
 
     def __repr__(self) -> str:
         subindex = self.subindex if isinstance(self.parent, (ODRecord, ODArray)) else None
@@ -507,15 +572,15 @@ class ODVariable:
         return value
 
     def decode_desc(self, value: int) -> str:
-        if not self.value_descriptions:
+        if not self._value_descriptions:
             raise ObjectDictionaryError("No value descriptions exist")
-        elif (desc := self.value_descriptions.get(value)) is None:
+        elif (desc := self._value_descriptions.get(value)) is None:
             raise ObjectDictionaryError(
                 f"No value description exists for {value}")
         return desc
 
     def encode_desc(self, desc: str) -> int:
-        if not self.value_descriptions:
+        if not self._value_descriptions:
             raise ObjectDictionaryError("No value descriptions exist")
         else:
             for value, description in self.value_descriptions.items():
@@ -0,0 +1,253 @@
+"""
+Cache of parsed object dictionaries
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import locale
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Optional, Union
+
+import canopen
+from canopen.objectdictionary import (
+    DeviceInformation,
+    ODArray,
+    ODRecord,
+    ODVariable,
+    ObjectDictionary,
+)
+from canopen.objectdictionary import eds
+from canopen.objectdictionary.template import ObjectDictionaryTemplate
+
+
+logger = logging.getLogger(__name__)
+
+#: Version of the cached data, increased when the parser or the format changes
+CACHE_VERSION = 2
+
+#: Cache used by :func:`canopen.import_od` if none is given, e.g.
+#: ``canopen.objectdictionary.cache.default_cache = ObjectDictionaryCache()``
+default_cache: Optional[ObjectDictionaryCache] = None
+
+# Attributes of ODVariable stored in the cache besides name and indices
+_VARIABLE_FIELDS = (
+    "unit", "factor", "min", "max", "default", "default_raw", "relative",
+    "value", "value_raw", "data_type", "access_type", "is_domain",
+    "description", "value_descriptions", "bit_definitions",
+    "storage_location", "pdo_mappable", "custom_options",
+)
+# Values which may be bytes, stored as hex strings
+_BYTES_FIELDS = ("min", "max", "default", "value")
+_DEVICE_FIELDS = (
+    "vendor_name", "vendor_number", "product_name", "product_number",
+    "revision_number", "order_code", "simple_boot_up_master",
+    "simple_boot_up_slave", "granularity", "dynamic_channels_supported",
+    "group_messaging", "nr_of_RXPDO", "nr_of_TXPDO", "LSS_supported",
+)
+
+
+class ObjectDictionaryCache:
+    """Cache of object dictionaries parsed from EDS and DCF files.
+
+    Files are identified by a hash of their contents, so a file is only parsed
+    once into an :class:`~canopen.objectdictionary.template.ObjectDictionaryTemplate`,
+    even if it is loaded for many nodes or under different names.  Each call
+    to :meth:`import_od` returns a new object dictionary for the node, but
+    all objects which do not depend on the node ID are shared with the other
+    object dictionaries created from the same file.  They must not be
+    modified.
+
+    The parsed object dictionaries can also be stored on disk in JSON files,
+    so they are available to other processes.
+
+    :param directory:
+        Directory for the on-disk cache, created if needed.  Only kept in
+        memory if None.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike, None] = None):
+        #: Directory for the on-disk cache
+        self.directory = os.path.expanduser(directory) if directory is not None else None
+        self._templates: dict[str, ObjectDictionaryTemplate] = {}
+        self._lock = threading.Lock()
+
+    def import_od(
+        self, source: Union[str, os.PathLike], node_id: Optional[int] = None
+    ) -> ObjectDictionary:
+        """Load an EDS or DCF file, parsing it only if not cached.
+
+        :param source: Path to the file.
+        :param node_id: The node ID to use, as for :func:`canopen.import_od`.
+        """
+        return self.import_template(source).for_node(node_id)
+
+    def import_template(self, source: Union[str, os.PathLike]) -> ObjectDictionaryTemplate:
+        """Load an EDS or DCF file as a template, parsing it only if not cached.
+
+        :param source: Path to the file.
+        """
+        with open(source, "rb") as f:
+            data = f.read()
+        # Decoding depends on the locale, like for canopen.import_od()
+        encoding = locale.getpreferredencoding(False)
+        key = hashlib.sha256(
+            f"{CACHE_VERSION}:{canopen.__version__}:{encoding}:".encode() + data
+        ).hexdigest()
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                template = self._load(key)
+                if template is None:
+                    template = self._parse(data, os.fspath(source))
+                    self._store(key, template)
+                self._templates[key] = template
+        return template
+
+    def clear(self) -> None:
+        """Remove all object dictionaries kept in memory."""
+        with self._lock:
+            self._templates.clear()
+
+    @staticmethod
+    def _parse(data: bytes, filename: str) -> ObjectDictionaryTemplate:
+        # Decode and split into lines exactly like import_eds() reading the file
+        with io.TextIOWrapper(io.BytesIO(data)) as fp:
+            sections = eds.read_sections(fp, filename)
+        return ObjectDictionaryTemplate.from_sections(sections)
+
+    def _path(self, key: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load(self, key: str) -> Optional[ObjectDictionaryTemplate]:
+        path = self._path(key)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                cached = json.load(f)
+            return ObjectDictionaryTemplate(
+                _decode_od(cached["od"]), cached["node_id"], cached["commissioning"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring invalid cache file %s: %s", path, e)
+            return None
+
+    def _store(self, key: str, template: ObjectDictionaryTemplate) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        cached = {
+            "od": _encode_od(template.od),
+            "node_id": template.node_id,
+            "commissioning": template.commissioning,
+        }
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so other processes never
+            # read a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cached, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write cache file %s: %s", path, e)
+
+
+def _encode_value(field: str, value: Any) -> Any:
+    if field in _BYTES_FIELDS and isinstance(value, bytes):
+        return {"hex": value.hex()}
+    if field == "value_descriptions":
+        return list(value.items())
+    return value
+
+
+def _decode_value(field: str, value: Any) -> Any:
+    if field in _BYTES_FIELDS and isinstance(value, dict):
+        return bytes.fromhex(value["hex"])
+    if field == "value_descriptions":
+        return dict(value)
+    return value
+
+
+_VARIABLE_DEFAULTS = ODVariable("", 0)
+
+
+def _encode_variable(var: ODVariable) -> dict[str, Any]:
+    fields: dict[str, Any] = {"name": var.name, "index": var.index, "subindex": var.subindex}
+    for field in _VARIABLE_FIELDS:
+        value = getattr(var, field, None)
+        default = getattr(_VARIABLE_DEFAULTS, field, None)
+        if type(value) is type(default) and value == default:
+            continue
+        fields[field] = _encode_value(field, value)
+    return fields
+
+
+def _decode_variable(fields: dict[str, Any]) -> ODVariable:
+    var = ODVariable(fields.pop("name"), fields.pop("index"), fields.pop("subindex"))
+    for field, value in fields.items():
+        setattr(var, field, _decode_value(field, value))
+    return var
+
+
+def _encode_od(od: ObjectDictionary) -> dict[str, Any]:
+    objects: list[dict[str, Any]] = []
+    for obj in od.indices.values():
+        if isinstance(obj, ODVariable):
+            objects.append({"type": "variable", "variable": _encode_variable(obj)})
+        else:
+            objects.append({
+                "type": "record" if isinstance(obj, ODRecord) else "array",
+                "name": obj.name,
+                "index": obj.index,
+                "description": obj.description,
+                "storage_location": obj.storage_location,
+                "custom_options": obj.custom_options,
+                "members": [_encode_variable(var) for var in obj.subindices.values()],
+            })
+    info = od.device_information
+    return {
+        "comments": od.comments,
+        "bitrate": od.bitrate,
+        "node_id": od.node_id,
+        "file_info": getattr(od, "__edsFileInfo", None),
+        "allowed_baudrates": sorted(info.allowed_baudrates),
+        "device_information": {field: getattr(info, field) for field in _DEVICE_FIELDS},
+        "objects": objects,
+    }
+
+
+def _decode_od(data: dict[str, Any]) -> ObjectDictionary:
+    od = ObjectDictionary()
+    od.comments = data["comments"]
+    od.bitrate = data["bitrate"]
+    od.node_id = data["node_id"]
+    if data["file_info"] is not None:
+        setattr(od, "__edsFileInfo", data["file_info"])
+    info = DeviceInformation()
+    info.allowed_baudrates = set(data["allowed_baudrates"])
+    for field, value in data["device_information"].items():
+        setattr(info, field, value)
+    od.device_information = info
+    for fields in data["objects"]:
+        obj: Union[ODVariable, ODRecord, ODArray]
+        if fields["type"] == "variable":
+            obj = _decode_variable(fields["variable"])
+        else:
+            obj = (ODRecord if fields["type"] == "record" else ODArray)(
+                fields["name"], fields["index"])
+            if fields["description"] != obj.description:
+                obj.description = fields["description"]
+            obj.storage_location = fields["storage_location"]
+            obj.custom_options = fields["custom_options"]
+            for member in fields["members"]:
+                obj.add_member(_decode_variable(member))
+        od.add_object(obj)
+    return od
@@ -3,8 +3,16 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from configparser import NoOptionError, NoSectionError, RawConfigParser
-from typing import Any, TYPE_CHECKING
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from configparser import (
+    DuplicateOptionError,
+    DuplicateSectionError,
+    MissingSectionHeaderError,
+    RawConfigParser,
+)
+from typing import Any, Optional, TYPE_CHECKING, Union
 
 from canopen.objectdictionary import (
     ODArray,
@@ -15,6 +23,7 @@ from canopen.objectdictionary import (
     objectcodes,
 )
 from canopen.sdo import SdoClient
+from canopen.utils import pretty_index
 
 if TYPE_CHECKING:
     import canopen.network
@@ -22,10 +31,158 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: Options by key, by section name of an EDS file.  A
+#: :class:`configparser.RawConfigParser` can be used as well.
+EdsSections = Mapping[str, Mapping[str, str]]
 
-def import_eds(source, node_id):
-    eds = RawConfigParser(inline_comment_prefixes=(';',))
-    eds.optionxform = str
+
+def _strip_inline_comment(line: str) -> str:
+    # Like RawConfigParser, a ';' only starts a comment after whitespace
+    i = line.find(";")
+    while i > 0:
+        if line[i - 1].isspace():
+            return line[:i].rstrip()
+        i = line.find(";", i + 1)
+    return line
+
+
+def read_sections(fp: Iterable[str], filename: str = "<???>") -> dict[str, dict[str, str]]:
+    """Read the sections of an EDS or DCF file in a single pass.
+
+    This accepts the same syntax as :class:`configparser.RawConfigParser`
+    with ``;`` inline comments and case-sensitive keys, but without
+    interpolation or a default section.
+
+    :param fp: Lines of the file.
+    :param filename: Name of the file for error messages.
+    :return: Options by key, by section name, in the order of the file.
+    :raises configparser.Error:
+        For options outside of a section or duplicate sections or options.
+    """
+    sections: dict[str, dict[str, str]] = {}
+    options: Optional[dict[str, str]] = None
+    section = ""
+    # Last option and its indentation, for continuation lines
+    key: Optional[str] = None
+    key_indent = 0
+    for lineno, line in enumerate(fp, start=1):
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        if ";" in stripped:
+            stripped = _strip_inline_comment(stripped)
+        indent = len(line) - len(line.lstrip())
+        if key is not None and options is not None and indent > key_indent:
+            options[key] = f"{options[key]}\n{stripped}".strip()
+            continue
+        key = None
+        if stripped[0] == "[":
+            end = stripped.rfind("]")
+            if end > 1:
+                section = stripped[1:end]
+                if section in sections:
+                    raise DuplicateSectionError(section, filename, lineno)
+                options = sections[section] = {}
+                continue
+        if options is None:
+            raise MissingSectionHeaderError(filename, lineno, line)
+        equals = stripped.find("=")
+        colon = stripped.find(":")
+        if colon >= 0 and (equals < 0 or colon < equals):
+            equals = colon
+        if equals < 0:
+            logger.warning("Ignoring line %d without value in %s: %r", lineno, filename, line)
+            continue
+        name = stripped[:equals].rstrip()
+        if name in options:
+            raise DuplicateOptionError(section, name, filename, lineno)
+        options[name] = stripped[equals + 1:].lstrip()
+        key = name
+        key_indent = indent
+    return sections
+
+
+# Section headers which may also be continuation lines
+_INDENTED_HEADER = re.compile(r"\n[ \t]+\[")
+
+
+def split_sections(text: str, filename: str = "<???>") -> dict[str, str]:
+    """Split an EDS or DCF file into sections without parsing the options.
+
+    Section headers are recognized as by :func:`read_sections`, which can
+    parse the text of a section later.
+
+    :param text: Contents of the file.
+    :param filename: Name of the file for error messages.
+    :return: Text of each section including its header, by section name, in
+        the order of the file.
+    :raises configparser.Error:
+        For options outside of a section or duplicate sections.
+    """
+    # Every header follows a line break, including the first one
+    lines = "\n" + text
+    if _INDENTED_HEADER.search(lines):
+        return _split_lines(text, filename)
+    before, *chunks = lines.split("\n[")
+    if any(line.strip()[:1] not in ("", "#", ";") for line in before.splitlines()):
+        # Options outside of a section
+        return _split_lines(text, filename)
+    sections: dict[str, str] = {}
+    for chunk in chunks:
+        header = chunk.partition("\n")[0].rstrip()
+        if ";" in header:
+            header = _strip_inline_comment(header)
+        end = header.rfind("]")
+        if end < 1 or header[:end] in sections:
+            # Not a section header or a duplicate
+            return _split_lines(text, filename)
+        sections[header[:end]] = f"[{chunk}\n"
+    return sections
+
+
+def _split_lines(text: str, filename: str) -> dict[str, str]:
+    # Line by line like read_sections, for the unusual cases
+    sections: dict[str, list[str]] = {}
+    lines: Optional[list[str]] = None
+    # Indentation of the last option, for continuation lines
+    key_indent: Optional[int] = None
+    for lineno, line in enumerate(text.splitlines(keepends=True), start=1):
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            if lines is not None:
+                lines.append(line)
+            continue
+        if ";" in stripped:
+            stripped = _strip_inline_comment(stripped)
+        indent = len(line) - len(line.lstrip())
+        if key_indent is not None and lines is not None and indent > key_indent:
+            lines.append(line)
+            continue
+        key_indent = None
+        if stripped[0] == "[":
+            end = stripped.rfind("]")
+            if end > 1:
+                section = stripped[1:end]
+                if section in sections:
+                    raise DuplicateSectionError(section, filename, lineno)
+                lines = sections[section] = [line]
+                continue
+        if lines is None:
+            raise MissingSectionHeaderError(filename, lineno, line)
+        lines.append(line)
+        if "=" in stripped or ":" in stripped:
+            key_indent = indent
+    return {section: "".join(lines) for section, lines in sections.items()}
+
+
+# Index, subindex and [index]Name sections
+_OBJECT_SECTION = re.compile(r"([0-9A-Fa-f]{4})(?:$|[S|s]ub([0-9A-Fa-f]+)$|(Name))")
+_DUMMY_USAGE_SECTION = re.compile(r"[Dd]ummy[Uu]sage$")
+# Object types of the objects in an object dictionary
+_OBJECT_TYPES = (objectcodes.VAR, objectcodes.DOMAIN, objectcodes.ARRAY, objectcodes.RECORD)
+
+
+def import_eds(source, node_id, lazy=False):
     opened_here = False
     try:
         if hasattr(source, "read"):
@@ -33,33 +190,104 @@ def import_eds(source, node_id):
         else:
             fp = open(source)
             opened_here = True
-        eds.read_file(fp)
+        filename = getattr(fp, "name", "<???>")
+        if lazy:
+            text = fp.read()
+        else:
+            eds = read_sections(fp, filename)
     finally:
         # Only close object if opened in this fn
         if opened_here:
             fp.close()
+    if lazy:
+        return import_lazy(text, node_id, filename)
+    return import_sections(eds, node_id)
 
+
+def import_sections(eds: EdsSections, node_id: Optional[int]) -> ObjectDictionary:
+    """Create an object dictionary from the sections of an EDS or DCF file.
+
+    :param eds: Sections as returned by :func:`read_sections`.
+    :param node_id: Node ID to use for values relative to ``$NODEID``.
+    """
     od = ObjectDictionary()
+    node_id = _import_header(od, eds, node_id)
 
-    if eds.has_section("FileInfo"):
-        od.__edsFileInfo = {  # type: ignore[attr-defined] # custom addition
-            opt: eds.get("FileInfo", opt)
-            for opt in eds.options("FileInfo")
-        }
+    # Sections of each object, by index
+    objects: dict[int, list[str]] = {}
+    for section in eds:
+        match = _OBJECT_SECTION.match(section)
+        if match is not None:
+            objects.setdefault(int(match.group(1), 16), []).append(section)
+        elif _DUMMY_USAGE_SECTION.match(section):
+            _add_dummy_objects(od, eds[section])
+
+    for index, sections in objects.items():
+        obj = build_object(eds, index, sections, node_id)
+        if obj is not None:
+            od.add_object(obj)
+
+    return od
+
+
+def import_lazy(
+    text: str, node_id: Optional[int], filename: str = "<???>"
+) -> LazyObjectDictionary:
+    """Create a :class:`LazyObjectDictionary` from an EDS or DCF file.
 
-    if eds.has_section("Comments"):
-        linecount = int(eds.get("Comments", "Lines"), 0)
+    :param text: Contents of the file.
+    :param node_id: Node ID to use for values relative to ``$NODEID``.
+    :param filename: Name of the file for error messages.
+    """
+    # Sections which are not objects, e.g. DeviceInfo
+    eds: dict[str, dict[str, str]] = {}
+    # Text of the sections of each object, by index, the index section first
+    objects: dict[int, list[str]] = {}
+    for section, section_text in split_sections(text, filename).items():
+        match = _OBJECT_SECTION.match(section)
+        if match is None:
+            eds.update(read_sections(section_text.splitlines(), filename))
+            continue
+        index_str, subindex_str, name_str = match.groups()
+        index = int(index_str, 16)
+        if subindex_str is None and name_str is None:
+            objects.setdefault(index, []).append(section_text)
+        elif index in objects:
+            objects[index].append(section_text)
+        else:
+            raise KeyError(f"{pretty_index(index)} was not found in Object Dictionary")
+
+    od = LazyObjectDictionary(eds, filename)
+    node_id = _import_header(od, eds, node_id)
+    for section, options in eds.items():
+        if _DUMMY_USAGE_SECTION.match(section):
+            _add_dummy_objects(od, options)
+    od._add_pending(
+        {index: (texts[0], "".join(texts[1:])) for index, texts in objects.items()},
+        node_id)
+    return od
+
+
+def _import_header(
+    od: ObjectDictionary, eds: EdsSections, node_id: Optional[int]
+) -> Optional[int]:
+    if "FileInfo" in eds:
+        od.__edsFileInfo = dict(eds["FileInfo"])  # type: ignore[attr-defined] # custom addition
+
+    if "Comments" in eds:
+        comments = eds["Comments"]
+        linecount = int(comments["Lines"], 0)
         od.comments = '\n'.join([
-            eds.get("Comments", f"Line{line}")
+            comments[f"Line{line}"]
             for line in range(1, linecount + 1)
         ])
 
-    if not eds.has_section("DeviceInfo"):
+    if "DeviceInfo" not in eds:
         logger.warn("eds file does not have a DeviceInfo section. This section is mandatory")
     else:
+        device_info = eds["DeviceInfo"]
         for rate in [10, 20, 50, 125, 250, 500, 800, 1000]:
-            baudPossible = int(
-                eds.get("DeviceInfo", f"BaudRate_{rate}", fallback='0'), 0)
+            baudPossible = int(device_info.get(f"BaudRate_{rate}", '0'), 0)
             if baudPossible != 0:
                 od.device_information.allowed_baudrates.add(rate*1000)
 
@@ -79,60 +307,89 @@ def import_eds(source, node_id):
             (int, "NrOfTXPDO", "nr_of_TXPDO"),
             (bool, "LSS_Supported", "LSS_supported"),
         ]:
-            try:
-                if t in (int, bool):
-                    setattr(od.device_information, odprop,
-                            t(int(eds.get("DeviceInfo", eprop), 0))
-                            )
-                elif t is str:
-                    setattr(od.device_information, odprop,
-                            eds.get("DeviceInfo", eprop)
-                            )
-            except NoOptionError:
-                pass
-
-    if eds.has_section("DeviceComissioning"):
-        if val := eds.getint("DeviceComissioning", "Baudrate", fallback=None):
+            value = device_info.get(eprop)
+            if value is None:
+                continue
+            if t in (int, bool):
+                setattr(od.device_information, odprop, t(int(value, 0)))
+            elif t is str:
+                setattr(od.device_information, odprop, value)
+
+    if "DeviceComissioning" in eds:
+        commissioning = eds["DeviceComissioning"]
+        if val := int(commissioning.get("Baudrate", "0")):
             od.bitrate = val * 1000
 
         if node_id is None:
-            if val := eds.get("DeviceComissioning", "NodeID", fallback=None):
-                node_id = int(val, base=0)
+            if node_id_str := commissioning.get("NodeID"):
+                node_id = int(node_id_str, base=0)
         od.node_id = node_id
 
-    for section in eds.sections():
-        # Match dummy definitions
-        match = re.match(r"^[Dd]ummy[Uu]sage$", section)
-        if match is not None:
-            for i in range(1, 8):
-                key = f"Dummy{i:04d}"
-                if eds.getint(section, key) == 1:
-                    var = ODVariable(key, i, 0)
-                    var.data_type = i
-                    var.access_type = "const"
-                    od.add_object(var)
-
-        # Match indexes
-        match = re.match(r"^[0-9A-Fa-f]{4}$", section)
-        if match is not None:
-            index = int(section, 16)
-            name = eds.get(section, "ParameterName")
-            try:
-                object_type = int(eds.get(section, "ObjectType"), 0)
-            except NoOptionError:
-                # DS306 4.6.3.2 object description
-                # If the keyword ObjectType is missing, this is regarded as
-                # "ObjectType=0x7" (=VAR).
-                object_type = objectcodes.VAR
-            try:
-                storage_location = eds.get(section, "StorageLocation")
-            except NoOptionError:
-                storage_location = None
+    return node_id
+
+
+def _add_dummy_objects(od: ObjectDictionary, options: Mapping[str, str]) -> None:
+    for i in range(1, 8):
+        key = f"Dummy{i:04d}"
+        if int(options[key]) == 1:
+            var = ODVariable(key, i, 0)
+            var.data_type = i
+            var.access_type = "const"
+            od.add_object(var)
+
+
+def build_object(
+    eds: EdsSections, index: int, sections: Iterable[str], node_id: Optional[int]
+) -> Union[ODVariable, ODRecord, ODArray, None]:
+    """Create an object from its sections, in the order of the file.
+
+    :param eds: Sections of the eds file, e.g. from :func:`read_sections`
+    :param index: Index of the object
+    :param sections: Names of the index, subindex and [index]Name sections
+    :param node_id: Node ID
+    :return: The object, or None for unsupported object types.
+    :raises KeyError: If a subindex comes before its index.
+    """
+    entry: Union[ODVariable, ODRecord, ODArray, None] = None
+    for section in sections:
+        match = _OBJECT_SECTION.match(section)
+        assert match is not None
+        options = eds[section]
+        if match.group(2) is not None:
+            # Subindex
+            subindex = int(match.group(2), 16)
+            if entry is None:
+                raise KeyError(f"{pretty_index(index)} was not found in Object Dictionary")
+            if isinstance(entry, (ODRecord, ODArray)):
+                object_type = int(options.get("ObjectType", "7"), 0)
+                var = build_variable(eds, section, node_id, object_type, index, subindex)
+                entry.add_member(var)
+
+        elif match.group(3) is not None:
+            # [index]Name
+            num_of_entries = int(options["NrOfEntries"])
+            if entry is None:
+                raise KeyError(f"{pretty_index(index)} was not found in Object Dictionary")
+            assert isinstance(entry, (ODRecord, ODArray))
+            # For CompactSubObj index 1 is were we find the variable
+            src_var = entry[1]
+            for subindex in range(1, num_of_entries + 1):
+                var = copy_variable(eds, section, subindex, src_var)
+                if var is not None:
+                    entry.add_member(var)
+
+        else:
+            # Index
+            name = options["ParameterName"]
+            # DS306 4.6.3.2 object description
+            # If the keyword ObjectType is missing, this is regarded as
+            # "ObjectType=0x7" (=VAR).
+            object_type = int(options.get("ObjectType", "7"), 0)
+            storage_location = options.get("StorageLocation")
 
             if object_type in (objectcodes.VAR, objectcodes.DOMAIN):
-                var = build_variable(eds, section, node_id, object_type, index)
-                od.add_object(var)
-            elif object_type == objectcodes.ARRAY and eds.has_option(section, "CompactSubObj"):
+                entry = build_variable(eds, section, node_id, object_type, index)
+            elif object_type == objectcodes.ARRAY and "CompactSubObj" in options:
                 arr = ODArray(name, index)
                 last_subindex = ODVariable("Number of entries", index, 0)
                 last_subindex.data_type = datatypes.UNSIGNED8
@@ -140,48 +397,115 @@ def import_eds(source, node_id):
                 arr.add_member(build_variable(eds, section, node_id, object_type, index, 1))
                 arr.storage_location = storage_location
                 arr.custom_options = _get_custom_options(eds, section)
-                od.add_object(arr)
+                entry = arr
             elif object_type == objectcodes.ARRAY:
                 arr = ODArray(name, index)
                 arr.storage_location = storage_location
                 arr.custom_options = _get_custom_options(eds, section)
-                od.add_object(arr)
+                entry = arr
             elif object_type == objectcodes.RECORD:
                 record = ODRecord(name, index)
                 record.storage_location = storage_location
                 record.custom_options = _get_custom_options(eds, section)
-                od.add_object(record)
+                entry = record
 
-            continue
+    return entry
 
-        # Match subindexes
-        match = re.match(r"^([0-9A-Fa-f]{4})[S|s]ub([0-9A-Fa-f]+)$", section)
-        if match is not None:
-            index = int(match.group(1), 16)
-            subindex = int(match.group(2), 16)
-            entry = od[index]
-            if isinstance(entry, (ODRecord, ODArray)):
-                try:
-                    object_type = int(eds.get(section, "ObjectType"), 0)
-                except NoOptionError:
-                    object_type = objectcodes.VAR
-                var = build_variable(eds, section, node_id, object_type, index, subindex)
-                entry.add_member(var)
 
-        # Match [index]Name
-        match = re.match(r"^([0-9A-Fa-f]{4})Name", section)
-        if match is not None:
-            index = int(match.group(1), 16)
-            num_of_entries = int(eds.get(section, "NrOfEntries"))
-            entry = od[index]
-            # For CompactSubObj index 1 is were we find the variable
-            src_var = od[index][1]
-            for subindex in range(1, num_of_entries + 1):
-                var = copy_variable(eds, section, subindex, src_var)
-                if var is not None:
-                    entry.add_member(var)
+class LazyObjectDictionary(ObjectDictionary):
+    """Object dictionary which creates its objects from an EDS or DCF file
+    only when they are first accessed.
 
-    return od
+    Returned by :func:`canopen.import_od` with ``lazy=True``.  The text of
+    each object is kept until then, which takes less time and memory when
+    only a few objects of a large file are used.  Looking up an object by
+    name, :func:`len` and iterating parse the index sections of all
+    objects once.  Errors in the definition of an object are only reported
+    when the object is created.
+
+    :param eds: Sections which are not objects, e.g. with data type definitions.
+    :param filename: Name of the file for error messages.
+    """
+
+    def __init__(self, eds: EdsSections, filename: str = "<???>"):
+        super().__init__()
+        self._eds = eds
+        self._filename = filename
+        self._node_id: Optional[int] = None
+        # Text of the index section and the other sections of the objects
+        # not created yet, by index
+        self._pending: dict[int, tuple[str, str]] = {}
+        # Indices of the pending objects by name, only created when needed
+        self._pending_names: Optional[dict[str, int]] = None
+        self._lock = threading.RLock()
+
+    def __getitem__(
+        self, index: Union[int, str]
+    ) -> Union[ODArray, ODRecord, ODVariable]:
+        if self._pending and index not in self.indices and index not in self.names:
+            self._load(index)
+        return super().__getitem__(index)
+
+    def __iter__(self) -> Iterator[int]:
+        self._index_names()
+        return iter(sorted(self.indices.keys() | self._pending.keys()))
+
+    def __len__(self) -> int:
+        self._index_names()
+        return len(self.indices.keys() | self._pending.keys())
+
+    def __contains__(self, index: object) -> bool:
+        if self._pending and isinstance(index, (int, str)):
+            self._load(index)
+        return super().__contains__(index)
+
+    def add_object(self, obj: Union[ODArray, ODRecord, ODVariable]) -> None:
+        with self._lock:
+            # Replaces an object from the file
+            self._pending.pop(obj.index, None)
+            if self._pending_names is not None:
+                self._pending_names.pop(obj.name, None)
+            super().add_object(obj)
+
+    def _add_pending(
+        self, objects: dict[int, tuple[str, str]], node_id: Optional[int]
+    ) -> None:
+        with self._lock:
+            self._pending.update(objects)
+            self._pending_names = None
+            self._node_id = node_id
+
+    def _index_names(self) -> dict[str, int]:
+        with self._lock:
+            if self._pending_names is None:
+                self._pending_names = {}
+                for index, (index_text, _) in list(self._pending.items()):
+                    # Only the index section is needed for the name
+                    options, = read_sections(index_text.splitlines(), self._filename).values()
+                    if int(options.get("ObjectType", "7"), 0) in _OBJECT_TYPES:
+                        self._pending_names[options["ParameterName"]] = index
+                    else:
+                        del self._pending[index]
+            return self._pending_names
+
+    def _load(self, index: Union[int, str]) -> None:
+        with self._lock:
+            if isinstance(index, str):
+                names = self._index_names()
+                if index not in names:
+                    return
+                index = names[index]
+            texts = self._pending.get(index)
+            if texts is None:
+                # Created already, maybe by another thread
+                return
+            sections = read_sections("".join(texts).splitlines(), self._filename)
+            obj = build_object({**self._eds, **sections}, index, sections, self._node_id)
+            if obj is None:
+                # Not an object type of an object dictionary
+                del self._pending[index]
+            else:
+                self.add_object(obj)
 
 
 def import_from_node(node_id: int, network: canopen.network.Network):
@@ -243,7 +567,7 @@ def _signed_int_from_hex(hex_str, bit_length):
     return number
 
 
-def _decode_from_eds(node_id: int, var_type: int, value: Any) -> Any:
+def _decode_from_eds(node_id: Optional[int], var_type: int, value: Any) -> Any:
     if var_type in (datatypes.OCTET_STRING, datatypes.DOMAIN):
         return bytes.fromhex(value)
     elif var_type in (datatypes.VISIBLE_STRING, datatypes.UNICODE_STRING):
@@ -285,39 +609,38 @@ _STANDARD_OPTIONS = {
 }
 
 
-def _get_custom_options(eds: RawConfigParser, section: str) -> dict[str, str]:
+def _get_custom_options(eds: EdsSections, section: str) -> dict[str, str]:
     custom_options = {}
-    for option, value in eds.items(section):
+    for option, value in eds[section].items():
         if option not in _STANDARD_OPTIONS:
             custom_options[option] = value
     return custom_options
 
 
 def build_variable(
-    eds: RawConfigParser,
+    eds: EdsSections,
     section: str,
-    node_id: int,
+    node_id: Optional[int],
     object_type: int,
     index: int,
     subindex: int = 0
 ) -> ODVariable:
     """Create a object dictionary entry.
 
-    :param eds: String stream of the eds file
+    :param eds: Sections of the eds file, e.g. from :func:`read_sections`
     :param section:
     :param node_id: Node ID
     :param index: Index of the CANOpen object
     :param subindex: Subindex of the CANOpen object (if present, else 0)
     :param is_domain: variable represents a DOMAIN ObjectType (if present, else False)
     """
-    name = eds.get(section, "ParameterName")
+    options = eds[section]
+    name = options["ParameterName"]
     var = ODVariable(name, index, subindex)
-    try:
-        var.storage_location = eds.get(section, "StorageLocation")
-    except NoOptionError:
-        var.storage_location = None
-    var.data_type = int(eds.get(section, "DataType"), 0)
-    var.access_type = eds.get(section, "AccessType").lower()
+    if (storage_location := options.get("StorageLocation")) is not None:
+        var.storage_location = sys.intern(storage_location)
+    var.data_type = int(options["DataType"], 0)
+    var.access_type = sys.intern(options["AccessType"].lower())
     var.is_domain = object_type == objectcodes.DOMAIN
     if var.data_type > 0x1B:
         # The object dictionary editor from CANFestival creates an optional object if min max
@@ -325,20 +648,21 @@ def build_variable(
         # [A0] (start point, iterates for more).  The eds.get function gives us 0x00A0 now
         # convert to String without hex representation and upper case.  The sub2 part is then
         # the section where the type parameter stands.
-        try:
-            var.data_type = int(eds.get(f"{var.data_type:X}sub1", "DefaultValue"), 0)
-        except NoSectionError:
+        type_section = f"{var.data_type:X}sub1"
+        if type_section in eds:
+            var.data_type = int(eds[type_section]["DefaultValue"], 0)
+        else:
             logger.warning(
                 "%s has an unknown or unsupported data type (0x%X)", name, var.data_type
             )
             # Assume DOMAIN to force application to interpret the byte data
             var.data_type = datatypes.DOMAIN
 
-    var.pdo_mappable = bool(int(eds.get(section, "PDOMapping", fallback="0"), 0))
+    var.pdo_mappable = bool(int(options.get("PDOMapping", "0"), 0))
 
-    if eds.has_option(section, "LowLimit"):
+    min_string = options.get("LowLimit")
+    if min_string is not None:
         try:
-            min_string = eds.get(section, "LowLimit")
             if var.data_type in datatypes.SIGNED_TYPES:
                 var.min = _signed_int_from_hex(min_string, _calc_bit_length(var.data_type))
             else:
@@ -348,9 +672,9 @@ def build_variable(
                 "Invalid LowLimit %r for %s (0x%X), ignoring",
                 min_string, var.name, var.index,
             )
-    if eds.has_option(section, "HighLimit"):
+    max_string = options.get("HighLimit")
+    if max_string is not None:
         try:
-            max_string = eds.get(section, "HighLimit")
             if var.data_type in datatypes.SIGNED_TYPES:
                 var.max = _signed_int_from_hex(max_string, _calc_bit_length(var.data_type))
             else:
@@ -360,47 +684,55 @@ def build_variable(
                 "Invalid HighLimit %r for %s (0x%X), ignoring",
                 max_string, var.name, var.index,
             )
-    if eds.has_option(section, "DefaultValue"):
+    default_raw = options.get("DefaultValue")
+    if default_raw is not None:
+        # The same few default values are used by most objects
+        default_raw = sys.intern(default_raw)
+        var.default_raw = default_raw
         try:
-            var.default_raw = eds.get(section, "DefaultValue")
-            if '$NODEID' in var.default_raw:
+            if '$NODEID' in default_raw:
                 var.relative = True
-            var.default = _decode_from_eds(node_id, var.data_type, var.default_raw)
+            var.default = _decode_from_eds(node_id, var.data_type, default_raw)
         except ValueError:
             logger.warning(
                 "Invalid DefaultValue %r for %s (0x%X), ignoring",
-                var.default_raw, var.name, var.index,
+                default_raw, var.name, var.index,
             )
-    if eds.has_option(section, "ParameterValue"):
+    value_raw = options.get("ParameterValue")
+    if value_raw is not None:
+        var.value_raw = value_raw
         try:
-            var.value_raw = eds.get(section, "ParameterValue")
-            var.value = _decode_from_eds(node_id, var.data_type, var.value_raw)
+            var.value = _decode_from_eds(node_id, var.data_type, value_raw)
         except ValueError:
             logger.warning(
                 "Invalid ParameterValue %r for %s (0x%X), ignoring",
-                var.value_raw, var.name, var.index,
+                value_raw, var.name, var.index,
             )
     # Factor, Description and Unit are not standard according to the CANopen specifications, but
     # they are implemented in the python canopen package, so we can at least try to use them
-    if eds.has_option(section, "Factor"):
+    factor = options.get("Factor")
+    if factor is not None:
         try:
-            var.factor = float(eds.get(section, "Factor"))
+            var.factor = float(factor)
         except ValueError:
             logger.warning(
                 "Invalid Factor %r for %s (0x%X), ignoring",
-                eds.get(section, "Factor"), var.name, var.index,
+                factor, var.name, var.index,
             )
-    if eds.has_option(section, "Description"):
-        var.description = eds.get(section, "Description")
-    if eds.has_option(section, "Unit"):
-        var.unit = eds.get(section, "Unit")
-
-    var.custom_options = _get_custom_options(eds, section)
+    description = options.get("Description")
+    if description is not None:
+        var.description = description
+    unit = options.get("Unit")
+    if unit is not None:
+        var.unit = unit
+
+    if custom_options := _get_custom_options(eds, section):
+        var.custom_options = custom_options
     return var
 
 
 def copy_variable(eds, section, subindex, src_var):
-    name = eds.get(section, str(subindex))
+    name = eds[section][str(subindex)]
     var = copy.copy(src_var)
     # It is only the name and subindex that varies
     var.name = name
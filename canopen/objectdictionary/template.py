@@ -0,0 +1,192 @@
+"""
+Object dictionaries shared between nodes with different node IDs
+"""
+
+from __future__ import annotations
+
+import copy
+from collections import ChainMap
+from typing import Optional, TextIO, Union
+
+from canopen.objectdictionary import ODArray, ODRecord, ODVariable, ObjectDictionary
+
+
+def _is_relative(var: ODVariable) -> bool:
+    return any("$NODEID" in (getattr(var, attr, None) or "")
+               for attr in ("default_raw", "value_raw"))
+
+
+class ObjectDictionaryTemplate:
+    """An object dictionary to be used by many nodes with different node IDs.
+
+    Values relative to ``$NODEID`` in the EDS file, e.g. COB-IDs, are kept
+    without the node ID added.  :meth:`for_node` creates a lightweight
+    :class:`NodeObjectDictionary` for each node, which adds the node ID when
+    such an object is accessed.  All other objects are shared between the
+    nodes and must not be modified.
+
+    :param od:
+        Object dictionary imported with node ID 0.
+    :param node_id:
+        Node ID from the DeviceComissioning section of a DCF file.
+    :param commissioning:
+        If the file has a DeviceComissioning section.
+    """
+
+    def __init__(
+        self,
+        od: ObjectDictionary,
+        node_id: Optional[int] = None,
+        commissioning: bool = False,
+    ):
+        self.od = od
+        #: Node ID used if none is given to :meth:`for_node`
+        self.node_id = node_id
+        self.commissioning = commissioning
+        #: Indices of the objects with values relative to the node ID
+        self.relative: set[int] = set()
+        for obj in od.indices.values():
+            variables = obj.subindices.values() if isinstance(obj, (ODRecord, ODArray)) else [obj]
+            if any(_is_relative(var) for var in variables):
+                self.relative.add(obj.index)
+
+    @classmethod
+    def from_sections(cls, eds: dict[str, dict[str, str]]) -> ObjectDictionaryTemplate:
+        """Create a template from the sections of an EDS or DCF file.
+
+        :param eds: Sections as returned by :func:`~canopen.objectdictionary.eds.read_sections`.
+        """
+        from canopen.objectdictionary.eds import import_sections
+        od = import_sections(eds, 0)
+        commissioning = eds.get("DeviceComissioning")
+        node_id = None
+        if commissioning is not None:
+            if node_id_str := commissioning.get("NodeID"):
+                node_id = int(node_id_str, 0)
+            od.node_id = node_id
+        return cls(od, node_id, commissioning is not None)
+
+    @classmethod
+    def from_eds(cls, source: Union[str, TextIO]) -> ObjectDictionaryTemplate:
+        """Create a template from an EDS or DCF file.
+
+        :param source: The path to the file or a file like object.
+        """
+        from canopen.objectdictionary.eds import read_sections
+        if hasattr(source, "read"):
+            return cls.from_sections(read_sections(source, getattr(source, "name", "<???>")))
+        with open(source) as fp:
+            return cls.from_sections(read_sections(fp, source))
+
+    def for_node(self, node_id: Optional[int] = None) -> NodeObjectDictionary:
+        """Create an object dictionary for a node.
+
+        :param node_id:
+            The node ID, or None for the one from the DCF file.
+        """
+        if node_id is None:
+            node_id = self.node_id
+        return NodeObjectDictionary(self, node_id)
+
+    def resolve(
+        self, obj: Union[ODVariable, ODRecord, ODArray], node_id: Optional[int]
+    ) -> Union[ODVariable, ODRecord, ODArray]:
+        """Copy a relative object with the node ID added to its values."""
+        if isinstance(obj, ODVariable):
+            return _resolve_variable(obj, node_id)
+        container = copy.copy(obj)
+        container.subindices = {}
+        container.names = {}
+        for var in obj.subindices.values():
+            if _is_relative(var):
+                container.add_member(_resolve_variable(var, node_id))
+            else:
+                # Shared, so keep the parent of the template
+                container.subindices[var.subindex] = var
+                container.names[var.name] = var
+        return container
+
+
+def _resolve_variable(var: ODVariable, node_id: Optional[int]) -> ODVariable:
+    var = copy.copy(var)
+    for attr, raw_attr in (("default", "default_raw"), ("value", "value_raw")):
+        raw = getattr(var, raw_attr, None)
+        offset = getattr(var, attr)
+        if raw is not None and "$NODEID" in raw and isinstance(offset, int):
+            setattr(var, attr, offset + node_id if node_id is not None else None)
+    return var
+
+
+class _NodeLayer(ChainMap):
+    """Own entries of a node on top of the shared ones of the template.
+
+    Deleting a shared entry only hides it for this node.
+    """
+
+    def __init__(self, own: dict, shared: dict):
+        super().__init__(own, shared)
+        #: Keys of the template deleted for this node
+        self.hidden: set = set()
+
+    def __getitem__(self, key):
+        if key in self.hidden:
+            return self.__missing__(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self.hidden.discard(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.maps[0].pop(key, None)
+        if key in self.maps[1]:
+            self.hidden.add(key)
+
+    def __contains__(self, key):
+        return key not in self.hidden and super().__contains__(key)
+
+    def __iter__(self):
+        return (key for key in super().__iter__() if key not in self.hidden)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __bool__(self):
+        return any(True for _ in self)
+
+
+class NodeObjectDictionary(ObjectDictionary):
+    """Object dictionary of one node, created by
+    :meth:`ObjectDictionaryTemplate.for_node`.
+
+    Objects are looked up in the template.  Objects with values relative to
+    the node ID are copied with the node ID added on first access.  Objects
+    added to this object dictionary only affect this node.
+    """
+
+    def __init__(self, template: ObjectDictionaryTemplate, node_id: Optional[int]):
+        super().__init__()
+        source = template.od
+        #: The template shared with other nodes
+        self.template = template
+        self._node_id = node_id
+        # Own objects first, then the shared ones of the template
+        self.indices = _NodeLayer(self.indices, source.indices)
+        self.names = _NodeLayer(self.names, source.names)
+        self.comments = source.comments
+        self.bitrate = source.bitrate
+        self.node_id = node_id if template.commissioning else None
+        self.device_information = source.device_information
+        if hasattr(source, "__edsFileInfo"):
+            setattr(self, "__edsFileInfo", getattr(source, "__edsFileInfo"))
+
+    def __getitem__(
+        self, index: Union[int, str]
+    ) -> Union[ODArray, ODRecord, ODVariable]:
+        obj = super().__getitem__(index)
+        if obj.parent is self.template.od and obj.index in self.template.relative:
+            obj = self.template.resolve(obj, self._node_id)
+            self.add_object(obj)
+        return obj
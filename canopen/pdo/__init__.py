@@ -3,17 +3,24 @@ import logging
 from collections.abc import Iterator
 
 from canopen import node
-from canopen.pdo.base import PdoBase, PdoMap, PdoMaps, PdoVariable
+from canopen.pdo.base import PdoBase, PdoMap, PdoMaps, PdoSnapshot, PdoVariable
+from canopen.pdo.engine import SyncPdoEngine
+from canopen.pdo.producer import TpdoProducer
+from canopen.pdo.recorder import PdoRecorder
 
 
 __all__ = [
     "PdoBase",
     "PdoMap",
     "PdoMaps",
+    "PdoRecorder",
+    "PdoSnapshot",
     "PdoVariable",
     "PDO",
     "RPDO",
+    "SyncPdoEngine",
     "TPDO",
+    "TpdoProducer",
 ]
 
 logger = logging.getLogger(__name__)
@@ -4,9 +4,10 @@ import binascii
 import contextlib
 import logging
 import math
+import struct
 import threading
-from collections.abc import Iterator, Mapping
-from typing import Callable, Optional, TYPE_CHECKING, Union
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
 
 import canopen.network
 from canopen import objectdictionary
@@ -22,6 +23,22 @@ if TYPE_CHECKING:
 PDO_NOT_VALID = 1 << 31
 RTR_NOT_ALLOWED = 1 << 30
 
+# Struct format character for each data type which can be decoded by a
+# combined struct when byte aligned
+_STRUCT_CODES = {
+    objectdictionary.BOOLEAN: "?",
+    objectdictionary.INTEGER8: "b",
+    objectdictionary.INTEGER16: "h",
+    objectdictionary.INTEGER32: "l",
+    objectdictionary.INTEGER64: "q",
+    objectdictionary.UNSIGNED8: "B",
+    objectdictionary.UNSIGNED16: "H",
+    objectdictionary.UNSIGNED32: "L",
+    objectdictionary.UNSIGNED64: "Q",
+    objectdictionary.REAL32: "f",
+    objectdictionary.REAL64: "d",
+}
+
 logger = logging.getLogger(__name__)
 
 
@@ -227,6 +244,13 @@ class PdoMap:
         self.receive_condition = threading.Condition()
         self.is_received: bool = False
         self._task = None
+        # Compiled layout, invalidated when the mapping changes
+        self._codec: Optional[PdoCodec] = None
+        #: Last received message, decoded on demand
+        self.snapshot: Optional[PdoSnapshot] = None
+        # Nesting level of batch() and whether update() was deferred
+        self._batch_depth = 0
+        self._batch_dirty = False
 
     def __repr__(self) -> str:
         cob = f"0x{self.cob_id:X}" if self.cob_id else "Unassigned"
@@ -292,6 +316,46 @@ class PdoMap:
 
     def _update_data_size(self):
         self.data = bytearray(int(math.ceil(self.length / 8.0)))
+        self._codec = None
+
+    @property
+    def codec(self) -> PdoCodec:
+        """Layout of the mapped variables, compiled on first use."""
+        if self._codec is None:
+            self._codec = PdoCodec(self.map, len(self.data))
+        return self._codec
+
+    def decode(self, data: Optional[bytes] = None) -> dict[str, Any]:
+        """Decode the raw values of all mapped variables at once.
+
+        :param data:
+            Message data to decode, by default the current :attr:`data`.
+
+        :return: Raw values by variable name.
+        """
+        codec = self.codec
+        return dict(zip(codec.names, codec.decode(self.data if data is None else data)))
+
+    def encode(self, values: Union[Mapping[str, Any], Sequence[Any]]) -> bytearray:
+        """Set the raw values of several mapped variables at once.
+
+        Values are not checked against the limits given in the object
+        dictionary.  A running periodic transmission is updated.
+
+        :param values:
+            Raw values by variable name, other variables keep their current
+            value.  Or a sequence with values for all mapped variables in order.
+
+        :return: The updated message :attr:`data`.
+        """
+        codec = self.codec
+        if isinstance(values, Mapping):
+            current = dict(zip(codec.names, codec.decode(self.data)))
+            current.update(values)
+            values = [current[name] for name in codec.names]
+        codec.encode(values, self.data)
+        self.update()
+        return self.data
 
     @property
     def name(self) -> str:
@@ -337,6 +401,7 @@ class PdoMap:
                 if self.timestamp is not None:
                     self.period = timestamp - self.timestamp
                 self.timestamp = timestamp
+                self.snapshot = PdoSnapshot(self.codec, bytes(data), timestamp)
                 self.receive_condition.notify_all()
                 for callback in self.callbacks:
                     callback(self)
@@ -346,7 +411,8 @@ class PdoMap:
 
         :param callback:
             The function to call which must take one argument of a
-            :class:`~canopen.pdo.PdoMap`.
+            :class:`~canopen.pdo.PdoMap`.  Its :attr:`snapshot` holds the
+            received values, decoded only when accessed.
         """
         self.callbacks.append(callback)
 
@@ -501,6 +567,7 @@ class PdoMap:
         """Clear all variables from this map."""
         self.map = []
         self.length = 0
+        self._codec = None
 
     def add_variable(
         self,
@@ -581,10 +648,73 @@ class PdoMap:
             self._task = None
 
     def update(self) -> None:
-        """Update periodic message with new data."""
-        if self._task is not None:
+        """Update periodic message with new data.
+
+        Inside :meth:`batch`, this is deferred until the batch ends.
+        """
+        if self._batch_depth:
+            self._batch_dirty = True
+        elif self._task is not None:
             self._task.update(self.data)
 
+    @contextlib.contextmanager
+    def batch(self, transmit: bool = False) -> Iterator[PdoMap]:
+        """Change several variables and apply them all at once.
+
+        Inside the ``with`` block, variable writes only change :attr:`data`.
+        A running periodic transmission is updated once when the block
+        ends.  If the block raises an exception, the previous data is restored
+        and nothing is sent.  Batches can be nested, only the outermost one
+        takes effect.
+
+        :param transmit:
+            Transmit the message once when the block ends, unless periodic
+            transmission is running.
+
+        Example::
+
+            with node.rpdo[1].batch(transmit=True) as rpdo:
+                rpdo['Controlword'].raw = 0x0F
+                rpdo['Target velocity'].raw = 1000
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+        previous = bytes(self.data)
+        self._batch_depth = 1
+        self._batch_dirty = False
+        try:
+            yield self
+        except BaseException:
+            self.data[:] = previous
+            raise
+        finally:
+            self._batch_depth = 0
+        if self._task is not None:
+            if self._batch_dirty:
+                self._task.update(self.data)
+        elif transmit:
+            self.transmit()
+
+    def set_values(self, values: Mapping[Union[int, str], Any], transmit: bool = False) -> None:
+        """Set the raw values of several variables and apply them at once.
+
+        :param values:
+            Raw values by variable name or index, like :meth:`__getitem__`.
+        :param transmit:
+            Transmit the message once afterwards, unless periodic transmission
+            is running.
+
+        :raises KeyError: If a variable is not mapped, no value is changed then.
+        """
+        with self.batch(transmit):
+            for key, value in values.items():
+                self[key].raw = value
+
     def remote_request(self) -> None:
         """Send a remote request for the transmit PDO.
         Silently ignore if not allowed.
@@ -604,6 +734,167 @@ class PdoMap:
         return self.timestamp if self.is_received else None
 
 
+class PdoCodec:
+    """Precompiled plan to decode and encode all variables of a PDO map.
+
+    Byte aligned variables of their natural size are handled by a single
+    :class:`struct.Struct`.  Bit fields are extracted from the whole message
+    as one integer using precomputed shifts and masks.  Anything else falls
+    back to the individual :class:`PdoVariable`.
+    """
+
+    def __init__(self, variables: Sequence[PdoVariable], size: int):
+        """
+        :param variables:
+            The mapped variables, dummy entries without length are skipped.
+        :param size:
+            Size of the message data in bytes.
+
+        :raises ValueError:
+            If a variable has no offset, i.e. is not part of a PDO map.
+        """
+        variables = [var for var in variables if var.length]
+        #: Names of the variables, in the same order as decoded values
+        self.names: list[str] = [var.name for var in variables]
+        #: Object indexes of the variables, in the same order as decoded values
+        self.indexes: list[int] = [var.index for var in variables]
+        self.size = size
+        # Slot of each variable by name and by index, first one wins
+        self.slots: dict[Union[int, str], int] = {}
+        for slot, var in enumerate(variables):
+            self.slots.setdefault(var.name, slot)
+            self.slots.setdefault(var.index, slot)
+        fmt = "<"
+        pos = 0
+        self._struct_slots: list[int] = []
+        self._bit_fields: list[tuple[int, int, int, int, bool]] = []
+        self._others: list[tuple[int, PdoVariable]] = []
+        # How to decode each variable on its own
+        self._fields: list[tuple] = []
+        for slot, var in enumerate(variables):
+            offset = var.offset
+            if offset is None:
+                raise ValueError(f"{var.name} has no offset in the PDO")
+            data_type = var.od.data_type
+            code = _STRUCT_CODES.get(data_type)
+            byte_offset, bit_offset = divmod(offset, 8)
+            if (code is not None and not bit_offset and byte_offset >= pos
+                    and var.length == len(var.od)):
+                if byte_offset > pos:
+                    fmt += f"{byte_offset - pos}x"
+                fmt += code
+                pos = byte_offset + var.length // 8
+                self._struct_slots.append(slot)
+                self._fields.append((struct.Struct("<" + code), byte_offset))
+            elif (data_type in objectdictionary.INTEGER_TYPES
+                    or data_type == objectdictionary.BOOLEAN):
+                mask = (1 << var.length) - 1
+                sign_bit = (1 << (var.length - 1)
+                            if data_type in objectdictionary.SIGNED_TYPES else 0)
+                is_bool = data_type == objectdictionary.BOOLEAN
+                self._bit_fields.append((slot, offset, mask, sign_bit, is_bool))
+                self._fields.append((None, (offset, mask, sign_bit, is_bool)))
+            else:
+                self._others.append((slot, var))
+                self._fields.append((None, var))
+        self._struct = struct.Struct(fmt)
+        self._count = len(variables)
+
+    def decode_field(self, data: bytes, slot: int) -> Any:
+        """Decode the raw value of a single variable from message data."""
+        field_struct, arg = self._fields[slot]
+        if field_struct is not None:
+            return field_struct.unpack_from(data, arg)[0]
+        if isinstance(arg, PdoVariable):
+            return arg.od.decode_raw(arg._extract(data))
+        shift, mask, sign_bit, is_bool = arg
+        value = (int.from_bytes(data, "little") >> shift) & mask
+        if value & sign_bit:
+            value -= mask + 1
+        return bool(value) if is_bool else value
+
+    def decode(self, data: bytes) -> list[Any]:
+        """Decode the raw values of all variables from message data."""
+        values: list[Any] = [None] * self._count
+        for slot, value in zip(self._struct_slots, self._struct.unpack_from(data)):
+            values[slot] = value
+        if self._bit_fields:
+            frame = int.from_bytes(data, "little")
+            for slot, shift, mask, sign_bit, is_bool in self._bit_fields:
+                value = (frame >> shift) & mask
+                if value & sign_bit:
+                    value -= mask + 1
+                values[slot] = bool(value) if is_bool else value
+        for slot, var in self._others:
+            values[slot] = var.od.decode_raw(var._extract(data))
+        return values
+
+    def encode(self, values: Sequence[Any], data: bytearray) -> None:
+        """Encode the raw values of all variables into message data."""
+        self._struct.pack_into(data, 0, *[values[slot] for slot in self._struct_slots])
+        if self._bit_fields:
+            frame = int.from_bytes(data, "little")
+            for slot, shift, mask, _, _ in self._bit_fields:
+                frame &= ~(mask << shift)
+                frame |= (int(values[slot]) & mask) << shift
+            data[:] = frame.to_bytes(len(data), "little")
+        for slot, var in self._others:
+            var._insert(data, var.od.encode_raw(values[slot]))
+
+
+class PdoSnapshot(Mapping):
+    """A received PDO message whose variables are decoded on demand.
+
+    Each value is decoded on first access and cached, so variables which are
+    never looked at cost nothing.  Values can be looked up by variable name
+    or by object index, where the first mapped variable of the index is
+    found like with :class:`PdoMap`.
+    """
+
+    __slots__ = ("data", "timestamp", "_codec", "_values")
+
+    _MISSING = object()
+
+    def __init__(self, codec: PdoCodec, data: bytes, timestamp: Optional[float]):
+        #: Message data as received
+        self.data = data
+        #: Timestamp of the message
+        self.timestamp = timestamp
+        self._codec = codec
+        self._values = [self._MISSING] * len(codec.names)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__} {self.data.hex()} at {self.timestamp}>"
+
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        return self.get_slot(self._codec.slots[key])
+
+    def get_slot(self, slot: int) -> Any:
+        """Value of a variable by its position among the mapped variables.
+
+        Unlike a lookup by object index, which finds the first variable of
+        that index, this can access any variable.
+        """
+        value = self._values[slot]
+        if value is self._MISSING:
+            value = self._values[slot] = self._codec.decode_field(self.data, slot)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codec.names)
+
+    def __len__(self) -> int:
+        return len(self._codec.names)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._codec.slots
+
+    @property
+    def indexes(self) -> list[int]:
+        """Object indexes of the mapped variables."""
+        return self._codec.indexes
+
+
 class PdoVariable(variable.Variable):
     """One object dictionary variable mapped to a PDO."""
 
@@ -620,6 +911,9 @@ class PdoVariable(variable.Variable):
 
         :return: PdoVariable value as :class:`bytes`.
         """
+        return self._extract(self.pdo_parent.data)
+
+    def _extract(self, msg_data) -> bytes:
         byte_offset, bit_offset = divmod(self.offset, 8)
 
         if bit_offset or self.length % 8:
@@ -629,16 +923,16 @@ class PdoVariable(variable.Variable):
                 # A boolean type needs to be treated as an U08
                 data_type = objectdictionary.UNSIGNED8
             od_struct = self.od.STRUCT_TYPES[data_type]
-            data = od_struct.unpack_from(self.pdo_parent.data, byte_offset)[0]
+            data = od_struct.unpack_from(msg_data, byte_offset)[0]
             # Shift and mask to get the correct values
             data = (data >> bit_offset) & ((1 << self.length) - 1)
             # Check if the variable is signed and if the data is negative prepend signedness
-            if od_struct.format.islower() and (1 << (self.length - 1)) < data:
+            if od_struct.format.islower() and (1 << (self.length - 1)) <= data:
                 # fill up the rest of the bits to get the correct signedness
                 data = data | (~((1 << self.length) - 1))
             data = od_struct.pack(data)
         else:
-            data = self.pdo_parent.data[byte_offset:byte_offset + len(self.od) // 8]
+            data = msg_data[byte_offset:byte_offset + len(self.od) // 8]
 
         return data
 
@@ -647,12 +941,16 @@ class PdoVariable(variable.Variable):
 
         :param data: Value for the PDO variable in the PDO message.
         """
-        byte_offset, bit_offset = divmod(self.offset, 8)
         logger.debug("Updating %s to %s in %s",
                      self.name, binascii.hexlify(data), self.pdo_parent.name)
+        self._insert(self.pdo_parent.data, data)
+        self.pdo_parent.update()
+
+    def _insert(self, msg_data: bytearray, data: bytes) -> None:
+        byte_offset, bit_offset = divmod(self.offset, 8)
 
         if bit_offset or self.length % 8:
-            cur_msg_data = self.pdo_parent.data[byte_offset:byte_offset + len(self.od) // 8]
+            cur_msg_data = msg_data[byte_offset:byte_offset + len(self.od) // 8]
             # Need information of the current variable type (unsigned vs signed)
             data_type = self.od.data_type
             if data_type == objectdictionary.BOOLEAN:
@@ -669,11 +967,9 @@ class PdoVariable(variable.Variable):
             cur_msg_data = cur_msg_data & bitwise_not
             # Set the new data on the correct position
             data = (data << bit_offset) | cur_msg_data
-            od_struct.pack_into(self.pdo_parent.data, byte_offset, data)
+            od_struct.pack_into(msg_data, byte_offset, data)
         else:
-            self.pdo_parent.data[byte_offset:byte_offset + len(data)] = data
-
-        self.pdo_parent.update()
+            msg_data[byte_offset:byte_offset + len(data)] = data
 
 
 # For compatibility
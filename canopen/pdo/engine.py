@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, Optional, TYPE_CHECKING
+
+from canopen.sdo import SdoAbortedError
+from canopen.sync import SyncConsumer
+
+
+if TYPE_CHECKING:
+    from canopen.node import LocalNode
+    from canopen.pdo.base import PdoMap
+
+
+logger = logging.getLogger(__name__)
+
+#: Highest transmission type for cyclic synchronous PDOs
+MAX_SYNC_TYPE = 0xF0
+
+
+class _SyncTpdo:
+    """Transmission state of one synchronous TPDO."""
+
+    __slots__ = ("pdo_map", "cob_id", "period", "countdown", "started", "last_data",
+                 "triggered")
+
+    def __init__(self, pdo_map: PdoMap, cob_id: int, period: int):
+        self.pdo_map = pdo_map
+        self.cob_id = cob_id
+        # Number of SYNCs between transmissions, zero for acyclic
+        self.period = period
+        self.countdown = period
+        # Wait for the SYNC start value if one is configured
+        self.started = not pdo_map.sync_start_value
+        self.last_data: Optional[bytes] = None
+        self.triggered = False
+
+
+class SyncPdoEngine:
+    """Handle the synchronous PDOs of a local node on each SYNC message.
+
+    On every SYNC message, in this order:
+
+    1. Synchronous RPDOs (transmission types 0 to 240) received since the
+       previous SYNC are written to the node's data store.
+    2. Callbacks added by :meth:`add_callback` are called, e.g. to run one
+       step of a simulation.
+    3. Synchronous TPDOs which are due are updated from the data store and
+       transmitted together.
+
+    Cyclic TPDOs (transmission types 1 to 240) are due every n-th SYNC.  If a
+    SYNC start value is configured and the SYNC messages carry a counter,
+    the first transmission waits for that counter value.  Acyclic TPDOs
+    (transmission type 0) are sent when their data changed or when
+    triggered with :meth:`trigger`.
+
+    Asynchronous RPDOs are written to the data store immediately on
+    reception.  PDOs are only handled while the node is in NMT state
+    OPERATIONAL.
+
+    :param node: The local node.
+    """
+
+    def __init__(self, node: LocalNode):
+        self.node = node
+        self.sync: Optional[SyncConsumer] = None
+        self._tpdos: list[_SyncTpdo] = []
+        self._rpdos: list[PdoMap] = []
+        # Synchronous RPDO data waiting for the next SYNC, by map
+        self._pending: dict[int, tuple[PdoMap, bytes]] = {}
+        self._callbacks: list[Callable[[Optional[int]], None]] = []
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback: Callable[[Optional[int]], None]) -> None:
+        """Add a function to be called on each SYNC message.
+
+        It is called after the received RPDOs were applied and before the
+        TPDOs are sampled.
+
+        :param callback: Function which takes the SYNC counter value or None.
+        """
+        self._callbacks.append(callback)
+
+    def start(self) -> None:
+        """Start handling PDOs with the current PDO configuration.
+
+        Call again after changing the configuration.
+        """
+        self.stop()
+        for pdo_map in self.node.tpdo.map.values():
+            if (pdo_map.enabled and pdo_map.cob_id and pdo_map.trans_type is not None
+                    and pdo_map.trans_type <= MAX_SYNC_TYPE):
+                self._tpdos.append(_SyncTpdo(pdo_map, pdo_map.cob_id, pdo_map.trans_type))
+        for pdo_map in self.node.rpdo.map.values():
+            if pdo_map.enabled and pdo_map.cob_id:
+                pdo_map.add_callback(self.on_rpdo)
+                pdo_map.subscribe()
+                self._rpdos.append(pdo_map)
+        self.sync = SyncConsumer(self.node.network)
+        self.sync.add_callback(self.on_sync)
+        self.sync.start()
+
+    def stop(self) -> None:
+        """Stop handling PDOs."""
+        if self.sync is not None:
+            self.sync.stop()
+            self.sync = None
+        for pdo_map in self._rpdos:
+            pdo_map.callbacks.remove(self.on_rpdo)
+        self._rpdos.clear()
+        self._tpdos.clear()
+        self._pending.clear()
+
+    def trigger(self, pdo_map: PdoMap) -> None:
+        """Transmit an acyclic synchronous TPDO on the next SYNC.
+
+        :raises KeyError: If the PDO is not handled by this engine.
+        """
+        for tpdo in self._tpdos:
+            if tpdo.pdo_map is pdo_map:
+                tpdo.triggered = True
+                return
+        raise KeyError(f"{pdo_map.name} is not a synchronous TPDO")
+
+    def on_rpdo(self, pdo_map: PdoMap) -> None:
+        """Store or apply a received RPDO."""
+        if self.node.nmt.state != "OPERATIONAL":
+            return
+        data = bytes(pdo_map.data)
+        if pdo_map.trans_type is not None and pdo_map.trans_type <= MAX_SYNC_TYPE:
+            with self._lock:
+                self._pending[id(pdo_map)] = (pdo_map, data)
+        else:
+            self._apply(pdo_map, data)
+
+    def on_sync(self, counter: Optional[int], timestamp: float) -> None:
+        """Apply pending RPDOs and transmit due TPDOs."""
+        if self.node.nmt.state != "OPERATIONAL":
+            return
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for pdo_map, data in pending:
+            self._apply(pdo_map, data)
+        for callback in self._callbacks:
+            callback(counter)
+        frames = []
+        for tpdo in self._tpdos:
+            if self._is_due(tpdo, counter):
+                frames.append((tpdo.cob_id, bytes(tpdo.pdo_map.data)))
+        if frames:
+            self.node.network.send_batch(frames)
+
+    def _is_due(self, tpdo: _SyncTpdo, counter: Optional[int]) -> bool:
+        pdo_map = tpdo.pdo_map
+        if not tpdo.started:
+            if counter is not None and counter != pdo_map.sync_start_value:
+                return False
+            tpdo.started = True
+            tpdo.countdown = 1
+        if tpdo.period:
+            tpdo.countdown -= 1
+            if tpdo.countdown > 0:
+                return False
+            tpdo.countdown = tpdo.period
+            self._sample(pdo_map)
+            return True
+        # Acyclic, only on change or trigger
+        self._sample(pdo_map)
+        data = bytes(pdo_map.data)
+        if data == tpdo.last_data and not tpdo.triggered:
+            return False
+        tpdo.last_data = data
+        tpdo.triggered = False
+        return True
+
+    def _sample(self, pdo_map: PdoMap) -> None:
+        for var in pdo_map:
+            if not var.length:
+                continue
+            try:
+                var._insert(pdo_map.data, self.node.get_data(var.index, var.subindex))
+            except SdoAbortedError:
+                # No value available, keep the previous one
+                pass
+
+    def _apply(self, pdo_map: PdoMap, data: bytes) -> None:
+        for var in pdo_map:
+            if not var.length:
+                continue
+            try:
+                self.node.set_data(var.index, var.subindex, var._extract(data))
+            except SdoAbortedError as e:
+                logger.warning("Could not apply %s from %s: %s", var.name, pdo_map.name, e)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import array
+import contextlib
+import logging
+import os
+from collections.abc import Iterable
+from typing import Any, TYPE_CHECKING, Union
+
+import can
+
+import canopen.network
+from canopen import objectdictionary
+from canopen.node import RemoteNode
+from canopen.pdo.recorder import _import_numpy, decode_frames
+
+
+if TYPE_CHECKING:
+    from canopen.objectdictionary import ObjectDictionary
+    from canopen.pdo.base import PdoMap
+
+
+logger = logging.getLogger(__name__)
+
+
+class _FrameGroup:
+    """Messages of one PDO collected until the next chunk is decoded."""
+
+    def __init__(self, pdo_map: PdoMap):
+        self.pdo_map = pdo_map
+        self.size = len(pdo_map.data)
+        self.frames = bytearray()
+        self.timestamps = array.array("d")
+        #: Decoded columns of previous chunks
+        self.chunks: list[dict[str, Any]] = []
+
+    def append(self, data: Union[bytes, bytearray], timestamp: float) -> None:
+        if len(data) != self.size:
+            data = bytes(data[:self.size]).ljust(self.size, b"\0")
+        self.frames += data
+        self.timestamps.append(timestamp)
+
+    def flush(self, np) -> None:
+        if not self.timestamps:
+            return
+        frames = np.frombuffer(bytes(self.frames), dtype=np.uint8).reshape(-1, self.size)
+        columns = {"timestamp": np.array(self.timestamps, dtype=np.float64)}
+        columns.update(decode_frames(self.pdo_map, frames))
+        self.chunks.append(columns)
+        self.frames = bytearray()
+        self.timestamps = array.array("d")
+
+
+class PdoLogDecoder:
+    """Decode PDOs from recorded CAN traffic, e.g. candump, ASC or BLF logs.
+
+    Messages are grouped by COB-ID and each group is decoded a whole chunk
+    at a time with NumPy, which is much faster than replaying the messages
+    through a :class:`~canopen.Network`.
+
+    .. note::
+       This API requires the ``recorder`` feature to be installed::
+
+          python3 -m pip install 'canopen[recorder]'
+
+    :param pdo_maps:
+        PDO maps with their mapping configured, e.g. using
+        :meth:`canopen.pdo.PdoMap.read`.  More can be added using
+        :meth:`add_pdo` and :meth:`add_node`.
+    """
+
+    def __init__(self, pdo_maps: Iterable[PdoMap] = ()):
+        #: PDO maps to decode by COB-ID
+        self.pdo_maps: dict[int, PdoMap] = {}
+        #: Network holding the nodes added by :meth:`add_node`, never connected
+        self.network = canopen.network.Network()
+        for pdo_map in pdo_maps:
+            self.add_pdo(pdo_map)
+
+    def add_pdo(self, pdo_map: PdoMap) -> None:
+        """Decode messages of a PDO.
+
+        :param pdo_map: PDO map with its COB-ID and mapping configured.
+        :raises ValueError: If the PDO has no COB-ID.
+        """
+        if not pdo_map.cob_id:
+            raise ValueError(f"{pdo_map.name} has no COB-ID")
+        if pdo_map.cob_id in self.pdo_maps:
+            logger.warning("Replacing PDO with COB-ID 0x%X", pdo_map.cob_id)
+        self.pdo_maps[pdo_map.cob_id] = pdo_map
+
+    def add_node(
+        self,
+        node_id: int,
+        object_dictionary: Union[ObjectDictionary, str],
+    ) -> RemoteNode:
+        """Decode all enabled PDOs of a node, configured as in its object dictionary.
+
+        The PDO configuration is taken from the values in the object
+        dictionary, so a DCF file describing the actual setup should be used.
+
+        :param node_id: Node ID.
+        :param object_dictionary: Object dictionary as a path or an ``ObjectDictionary``.
+
+        :return: The node holding the PDO configuration.
+        """
+        node = RemoteNode(node_id, object_dictionary)
+        self.network.add_node(node)
+        for pdo in node.tpdo, node.rpdo:
+            pdo.read(from_od=True)
+            for pdo_map in pdo.map.values():
+                if pdo_map.enabled and pdo_map.cob_id and pdo_map.length:
+                    self.add_pdo(pdo_map)
+        return node
+
+    def decode(
+        self,
+        source: Union[str, os.PathLike, Iterable[can.Message]],
+        phys: bool = False,
+        chunk_size: int = 100000,
+    ) -> dict[str, dict[str, Any]]:
+        """Decode all configured PDOs from recorded messages.
+
+        :param source:
+            Path to a log file in any format supported by :class:`can.LogReader`,
+            or an iterable of :class:`can.Message`.
+        :param phys:
+            Scale integer values with the factor from the object dictionary,
+            like :attr:`canopen.pdo.PdoVariable.phys`.
+        :param chunk_size:
+            Number of PDO messages collected before decoding them.
+
+        :return:
+            Columns by PDO name, each a :class:`numpy.ndarray` of values by
+            variable name plus the message timestamps as ``"timestamp"``.
+        :raises NotImplementedError:
+            When the ``canopen[recorder]`` feature is not installed.
+        """
+        np = _import_numpy()
+        groups = {cob_id: _FrameGroup(pdo_map) for cob_id, pdo_map in self.pdo_maps.items()}
+        with contextlib.ExitStack() as stack:
+            if isinstance(source, (str, os.PathLike)):
+                reader = can.LogReader(source)
+                # Readers of older python-can releases are no context managers
+                if hasattr(reader, "stop"):
+                    stack.callback(reader.stop)
+                messages: Iterable[can.Message] = reader
+            else:
+                messages = source
+            pending = 0
+            for msg in messages:
+                if msg.is_remote_frame or msg.is_error_frame:
+                    continue
+                group = groups.get(msg.arbitration_id)
+                if group is None:
+                    continue
+                group.append(msg.data, msg.timestamp)
+                pending += 1
+                if pending >= chunk_size:
+                    for each in groups.values():
+                        each.flush(np)
+                    pending = 0
+
+        results = {}
+        for group in groups.values():
+            group.flush(np)
+            columns = {}
+            names = ["timestamp"] + group.pdo_map.codec.names
+            for name in names:
+                parts = [chunk[name] for chunk in group.chunks]
+                columns[name] = np.concatenate(parts) if parts else np.array([])
+            if phys:
+                for var in group.pdo_map:
+                    factor = var.od.factor
+                    if var.od.data_type in objectdictionary.INTEGER_TYPES and factor != 1:
+                        columns[var.name] = columns[var.name] * factor
+            results[group.pdo_map.name] = columns
+        return results
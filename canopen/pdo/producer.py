@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Optional, TYPE_CHECKING
+
+from canopen.sdo import SdoAbortedError
+
+
+if TYPE_CHECKING:
+    from canopen.node import LocalNode
+    from canopen.objectdictionary import ODVariable
+    from canopen.pdo.base import PdoMap, PdoVariable
+    from canopen.scheduler import TimerHandle
+
+
+logger = logging.getLogger(__name__)
+
+#: Transmission types for event-driven TPDOs
+EVENT_DRIVEN_TYPES = (0xFE, 0xFF)
+
+
+class _MapState:
+    """Transmission state of one TPDO."""
+
+    __slots__ = ("pdo_map", "last_sent", "pending", "inhibit_timer", "event_timer")
+
+    def __init__(self, pdo_map: PdoMap):
+        self.pdo_map = pdo_map
+        self.last_sent: Optional[float] = None
+        self.pending = False
+        self.inhibit_timer: Optional[TimerHandle] = None
+        self.event_timer: Optional[TimerHandle] = None
+
+    @property
+    def inhibit_time(self) -> float:
+        # Configured in multiples of 100 us
+        return (self.pdo_map.inhibit_time or 0) * 100e-6
+
+    @property
+    def event_time(self) -> float:
+        # Configured in ms
+        return (self.pdo_map.event_timer or 0) * 1e-3
+
+    def cancel(self) -> None:
+        for timer in self.inhibit_timer, self.event_timer:
+            if timer is not None:
+                timer.cancel()
+        self.inhibit_timer = self.event_timer = None
+        self.pending = False
+
+
+class TpdoProducer:
+    """Transmit the event-driven TPDOs of a local node on change of state.
+
+    When an object mapped into an enabled TPDO with transmission type 254 or
+    255 is written through :meth:`canopen.LocalNode.set_data`, e.g. by an SDO
+    client or the application, the new value is copied into the PDO once it
+    is stored and the PDO is transmitted if the value has changed.  Writes
+    rejected by a write callback are ignored.  Changes within the inhibit time
+    after a transmission are combined into a single transmission at the end
+    of the inhibit time.  When an event timer is configured, the PDO is also
+    transmitted whenever no transmission happened for that time.
+
+    All timing is handled by the :attr:`canopen.Network.scheduler` shared
+    between all nodes of the network.  PDOs are only transmitted while the
+    node is in NMT state OPERATIONAL.
+
+    :param node: The local node.
+    """
+
+    def __init__(self, node: LocalNode):
+        self.node = node
+        self._states: dict[int, _MapState] = {}
+        # PDO variables by mapped object
+        self._mapped: dict[tuple[int, int], list[tuple[_MapState, PdoVariable]]] = {}
+        self._lock = threading.RLock()
+        self._running = False
+
+    def start(self) -> None:
+        """Start producing with the current PDO configuration.
+
+        Call again after changing the configuration.
+        """
+        self.stop()
+        with self._lock:
+            for pdo_map in self.node.tpdo.map.values():
+                if (not pdo_map.enabled or not pdo_map.cob_id
+                        or pdo_map.trans_type not in EVENT_DRIVEN_TYPES):
+                    continue
+                state = _MapState(pdo_map)
+                self._states[id(pdo_map)] = state
+                for var in pdo_map:
+                    if not var.length:
+                        continue
+                    self._mapped.setdefault((var.index, var.subindex), []).append((state, var))
+                    try:
+                        var._insert(pdo_map.data, self.node.get_data(var.index, var.subindex))
+                    except SdoAbortedError:
+                        # No initial value available
+                        pass
+                self._restart_event_timer(state)
+            self.node.add_store_callback(self.on_store)
+            self._running = True
+
+    def stop(self) -> None:
+        """Stop producing and cancel all timers."""
+        with self._lock:
+            if self._running:
+                self.node.remove_store_callback(self.on_store)
+                self._running = False
+            for state in self._states.values():
+                state.cancel()
+            self._states.clear()
+            self._mapped.clear()
+
+    def on_store(self, index: int, subindex: int, od: ODVariable, data: bytes) -> None:
+        """Copy stored values into the mapped TPDOs and trigger them."""
+        entries = self._mapped.get((index, subindex))
+        if not entries:
+            return
+        with self._lock:
+            for state, var in entries:
+                pdo_map = state.pdo_map
+                previous = bytes(pdo_map.data)
+                var._insert(pdo_map.data, data)
+                if pdo_map.data != previous:
+                    self._trigger(state)
+
+    def trigger(self, pdo_map: PdoMap) -> None:
+        """Transmit a TPDO as soon as its inhibit time allows.
+
+        This can be used for application specific events.
+
+        :raises KeyError: If the PDO is not handled by this producer.
+        """
+        with self._lock:
+            self._trigger(self._states[id(pdo_map)])
+
+    def _trigger(self, state: _MapState) -> None:
+        now = time.monotonic()
+        inhibit_time = state.inhibit_time
+        if state.last_sent is not None and now < state.last_sent + inhibit_time:
+            # Within inhibit time, combine with other changes
+            state.pending = True
+            if state.inhibit_timer is None:
+                state.inhibit_timer = self.node.network.scheduler.call_at(
+                    state.last_sent + inhibit_time, lambda: self._on_inhibit_end(state))
+        else:
+            self._transmit(state, now)
+
+    def _on_inhibit_end(self, state: _MapState) -> None:
+        with self._lock:
+            state.inhibit_timer = None
+            if state.pending and self._states.get(id(state.pdo_map)) is state:
+                self._transmit(state, time.monotonic())
+
+    def _on_event_timer(self, state: _MapState) -> None:
+        with self._lock:
+            state.event_timer = None
+            if self._states.get(id(state.pdo_map)) is state:
+                self._trigger(state)
+                if state.event_timer is None:
+                    # Transmission was delayed by the inhibit time
+                    self._restart_event_timer(state)
+
+    def _transmit(self, state: _MapState, now: float) -> None:
+        state.pending = False
+        if self.node.nmt.state == "OPERATIONAL":
+            state.last_sent = now
+            state.pdo_map.transmit()
+        self._restart_event_timer(state)
+
+    def _restart_event_timer(self, state: _MapState) -> None:
+        if state.event_timer is not None:
+            state.event_timer.cancel()
+            state.event_timer = None
+        event_time = state.event_time
+        if event_time:
+            state.event_timer = self.node.network.scheduler.call_later(
+                event_time, lambda: self._on_event_timer(state))
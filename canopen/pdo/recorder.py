@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import array
+import logging
+import threading
+from collections.abc import Iterable
+from typing import Any, Optional, TYPE_CHECKING
+
+from canopen import objectdictionary
+
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from canopen.pdo.base import PdoMap, PdoVariable
+
+
+logger = logging.getLogger(__name__)
+
+# NumPy type for each data type which can be viewed directly when byte aligned
+_NUMPY_TYPES = {
+    objectdictionary.INTEGER8: "i1",
+    objectdictionary.INTEGER16: "<i2",
+    objectdictionary.INTEGER32: "<i4",
+    objectdictionary.INTEGER64: "<i8",
+    objectdictionary.UNSIGNED8: "u1",
+    objectdictionary.UNSIGNED16: "<u2",
+    objectdictionary.UNSIGNED32: "<u4",
+    objectdictionary.UNSIGNED64: "<u8",
+    objectdictionary.REAL32: "<f4",
+    objectdictionary.REAL64: "<f8",
+}
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise NotImplementedError("This feature requires the 'canopen[recorder]' feature")
+    return numpy
+
+
+def decode_frames(variables: Iterable[PdoVariable], frames: np.ndarray) -> dict[str, np.ndarray]:
+    """Decode many messages of the same PDO mapping at once.
+
+    .. note::
+       This API requires the ``recorder`` feature to be installed::
+
+          python3 -m pip install 'canopen[recorder]'
+
+    :param variables:
+        The mapped variables, e.g. a :class:`~canopen.pdo.PdoMap`.
+    :param frames:
+        Message data as a two-dimensional array of :class:`numpy.uint8`, one
+        row per message.
+
+    :return: A column of raw values by variable name.
+    :raises ValueError:
+        If the message data is not two-dimensional.
+    :raises NotImplementedError:
+        When the ``canopen[recorder]`` feature is not installed.
+    """
+    np = _import_numpy()
+    frames = np.asarray(frames, dtype=np.uint8)
+    if frames.ndim != 2:
+        raise ValueError("Message data must have one row per message")
+    columns = {}
+    words = None
+    for var in variables:
+        if not var.length:
+            continue
+        data_type = var.od.data_type
+        dtype = _NUMPY_TYPES.get(data_type)
+        offset = var.offset or 0
+        byte_offset, bit_offset = divmod(offset, 8)
+        if dtype is not None and not bit_offset and var.length == len(var.od):
+            column = frames[:, byte_offset:byte_offset + var.length // 8]
+            columns[var.name] = np.ascontiguousarray(column).view(dtype).ravel()
+        elif (data_type in objectdictionary.INTEGER_TYPES
+                or data_type == objectdictionary.BOOLEAN):
+            if words is None:
+                # Whole messages as little endian integers, padded to 64 bits
+                padded = np.zeros((len(frames), 8), dtype=np.uint8)
+                padded[:, :frames.shape[1]] = frames
+                words = padded.view("<u8").ravel()
+            mask = (1 << var.length) - 1
+            values = (words >> np.uint64(offset)) & np.uint64(mask)
+            if data_type == objectdictionary.BOOLEAN:
+                values = values.astype(bool)
+            elif data_type in objectdictionary.SIGNED_TYPES:
+                values = values.astype(np.int64)
+                if var.length < 64:
+                    values[values >= 1 << (var.length - 1)] -= 1 << var.length
+            columns[var.name] = values
+        else:
+            columns[var.name] = np.array(
+                [var.od.decode_raw(var._extract(bytes(row))) for row in frames],
+                dtype=object)
+    return columns
+
+
+class _RingBuffer:
+    """Raw messages and timestamps of one PDO in preallocated storage."""
+
+    def __init__(self, pdo_map: PdoMap, capacity: int):
+        self.pdo_map = pdo_map
+        self.size = len(pdo_map.data)
+        self.capacity = capacity
+        self.frames = bytearray(self.size * capacity)
+        self.timestamps = array.array("d", bytes(8 * capacity))
+        #: Total number of messages appended
+        self.count = 0
+
+    def append(self, data: bytes, timestamp: Optional[float]) -> None:
+        pos = self.count % self.capacity
+        start = pos * self.size
+        if len(data) != self.size:
+            data = bytes(data[:self.size]).ljust(self.size, b"\0")
+        self.frames[start:start + self.size] = data
+        self.timestamps[pos] = timestamp or 0.0
+        self.count += 1
+
+    def ordered(self) -> tuple[bytes, array.array]:
+        """Stored messages and timestamps from oldest to newest."""
+        if self.count <= self.capacity:
+            return (bytes(self.frames[:self.count * self.size]),
+                    self.timestamps[:self.count])
+        pos = self.count % self.capacity
+        split = pos * self.size
+        return (bytes(self.frames[split:] + self.frames[:split]),
+                self.timestamps[pos:] + self.timestamps[:pos])
+
+
+class PdoRecorder:
+    """Record received PDOs for later analysis.
+
+    Raw messages and timestamps are appended to preallocated ring buffers, so
+    recording costs little even at high message rates.  When a buffer is
+    full, the oldest messages are overwritten.  The values are decoded a
+    whole column at a time when requested.
+
+    Recording works without any additional packages.  Decoding and exporting
+    requires the ``recorder`` feature to be installed::
+
+        python3 -m pip install 'canopen[recorder]'
+
+    :param pdo_maps:
+        The PDO maps to record.  Their mapping must not change while recording
+        and messages recorded with a previous mapping are discarded.
+    :param capacity:
+        Number of messages to keep per PDO.
+    """
+
+    def __init__(self, pdo_maps: Iterable[PdoMap], capacity: int = 100000):
+        self.pdo_maps = list(pdo_maps)
+        self.capacity = capacity
+        self._buffers: dict[int, _RingBuffer] = {}
+        self._lock = threading.Lock()
+        self._recording = False
+
+    def start(self) -> None:
+        """Start recording messages received by the PDO maps."""
+        if self._recording:
+            return
+        for pdo_map in self.pdo_maps:
+            buffer = self._buffers.get(id(pdo_map))
+            if buffer is None or buffer.size != len(pdo_map.data):
+                # Mapping was changed, previous messages can not be decoded
+                self._buffers[id(pdo_map)] = _RingBuffer(pdo_map, self.capacity)
+            pdo_map.add_callback(self.on_pdo)
+        self._recording = True
+
+    def stop(self) -> None:
+        """Stop recording.  The recorded messages are kept."""
+        if not self._recording:
+            return
+        for pdo_map in self.pdo_maps:
+            pdo_map.callbacks.remove(self.on_pdo)
+        self._recording = False
+
+    def clear(self) -> None:
+        """Discard all recorded messages."""
+        with self._lock:
+            for buffer in self._buffers.values():
+                buffer.count = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+    def on_pdo(self, pdo_map: PdoMap) -> None:
+        """Store a received PDO message."""
+        with self._lock:
+            self._buffers[id(pdo_map)].append(pdo_map.data, pdo_map.timestamp)
+
+    def count(self, pdo_map: PdoMap) -> int:
+        """Number of messages currently stored for the PDO map."""
+        buffer = self._buffers.get(id(pdo_map))
+        return min(buffer.count, self.capacity) if buffer else 0
+
+    def _buffer(self, pdo_map: PdoMap) -> _RingBuffer:
+        buffer = self._buffers.get(id(pdo_map))
+        if buffer is None:
+            if not any(m is pdo_map for m in self.pdo_maps):
+                raise KeyError(f"{pdo_map.name} is not recorded")
+            buffer = self._buffers[id(pdo_map)] = _RingBuffer(pdo_map, self.capacity)
+        return buffer
+
+    def frames(self, pdo_map: PdoMap) -> tuple[np.ndarray, np.ndarray]:
+        """Get the stored messages of a PDO map.
+
+        :return:
+            Message data with one row per message and the timestamps, from the
+            oldest to the newest message.
+        :raises NotImplementedError:
+            When the ``canopen[recorder]`` feature is not installed.
+        """
+        np = _import_numpy()
+        buffer = self._buffer(pdo_map)
+        with self._lock:
+            frames, timestamps = buffer.ordered()
+        return (np.frombuffer(frames, dtype=np.uint8).reshape(-1, buffer.size),
+                np.frombuffer(timestamps, dtype=np.float64))
+
+    def columns(self, pdo_map: PdoMap) -> dict[str, Any]:
+        """Decode the stored messages of a PDO map.
+
+        :return:
+            A column of raw values by variable name, plus the message
+            timestamps as ``"timestamp"``.
+        :raises NotImplementedError:
+            When the ``canopen[recorder]`` feature is not installed.
+        """
+        frames, timestamps = self.frames(pdo_map)
+        columns = {"timestamp": timestamps}
+        columns.update(decode_frames(pdo_map, frames))
+        return columns
+
+    def save_npz(self, filename) -> None:
+        """Save the decoded columns of all PDO maps to a NumPy ``.npz`` file.
+
+        The arrays are named ``<PDO name>/<variable name>``, e.g.
+        ``TxPDO1_node4/timestamp``.
+
+        :param filename: Path or file object to write to.
+        :raises NotImplementedError:
+            When the ``canopen[recorder]`` feature is not installed.
+        """
+        np = _import_numpy()
+        arrays = {}
+        for pdo_map in self.pdo_maps:
+            for name, column in self.columns(pdo_map).items():
+                arrays[f"{pdo_map.name}/{name}"] = column
+        np.savez(filename, **arrays)
+
+    def save_parquet(self, pdo_map: PdoMap, filename) -> None:
+        """Save the decoded columns of a PDO map to a Parquet file.
+
+        This additionally requires :mod:`pyarrow` to be installed.
+
+        :param pdo_map: The PDO map to save.
+        :param filename: Path or file object to write to.
+        :raises NotImplementedError:
+            When :mod:`pyarrow` or the ``canopen[recorder]`` feature is not installed.
+        """
+        try:
+            import pyarrow  # type: ignore
+            import pyarrow.parquet  # type: ignore
+        except ImportError:
+            raise NotImplementedError("This feature requires pyarrow")
+        table = pyarrow.table(self.columns(pdo_map))
+        pyarrow.parquet.write_table(table, filename)
@@ -1,9 +1,10 @@
 # inspired by the NmtMaster code
 import logging
 import time
+from collections.abc import Iterator, MutableMapping
 
 from canopen.node import RemoteNode
-from canopen.pdo import PdoMap
+from canopen.pdo import PdoMap, PdoSnapshot
 from canopen.sdo import SdoCommunicationError
 
 
@@ -193,6 +194,66 @@ class Homing:
     }
 
 
+class _SnapshotValue:
+    """Reference to a variable of a received TPDO, decoded on lookup."""
+
+    __slots__ = ("snapshot", "slot")
+
+    def __init__(self, snapshot: PdoSnapshot, slot: int):
+        self.snapshot = snapshot
+        self.slot = slot
+
+
+class TpdoValues(MutableMapping):
+    """Values from the last received TPDOs by object index.
+
+    Entries may refer to a variable of a :class:`~canopen.pdo.PdoSnapshot`,
+    which is decoded when the value is looked up.  Copies, e.g. using
+    :meth:`copy` or ``dict(values)``, hold the decoded values.
+    """
+
+    def __init__(self):
+        self._values: dict[int, object] = {}
+
+    def __getitem__(self, index: int):
+        value = self._values[index]
+        if isinstance(value, _SnapshotValue):
+            return value.snapshot.get_slot(value.slot)
+        return value
+
+    def set_snapshot(self, snapshot: PdoSnapshot) -> None:
+        """Refer to all variables of a received TPDO.
+
+        If several variables of the same object index are mapped, the last
+        one is kept.
+        """
+        values = self._values
+        for slot, index in enumerate(snapshot.indexes):
+            values[index] = _SnapshotValue(snapshot, slot)
+
+    def __setitem__(self, index: int, value) -> None:
+        self._values[index] = value
+
+    def __delitem__(self, index: int) -> None:
+        del self._values[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, index) -> bool:
+        return index in self._values
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def copy(self) -> dict:
+        """Return a plain dictionary with the decoded values."""
+        return dict(self)
+
+
 class BaseNode402(RemoteNode):
     """A CANopen CiA 402 profile slave node.
 
@@ -213,7 +274,7 @@ class BaseNode402(RemoteNode):
 
     def __init__(self, node_id, object_dictionary):
         super(BaseNode402, self).__init__(node_id, object_dictionary)
-        self.tpdo_values = {}  # { index: value from last received TPDO }
+        self.tpdo_values = TpdoValues()  # { index: value from last received TPDO }
         self.tpdo_pointers: dict[int, PdoMap] = {}
         self.rpdo_pointers: dict[int, PdoMap] = {}
 
@@ -458,10 +519,17 @@ class BaseNode402(RemoteNode):
     def on_TPDOs_update_callback(self, mapobject: PdoMap):
         """Cache updated values from a TPDO received from this node.
 
+        The values are only decoded when looked up in :attr:`tpdo_values`.
+
         :param mapobject: The received PDO message.
         """
-        for obj in mapobject:
-            self.tpdo_values[obj.index] = obj.raw
+        snapshot = mapobject.snapshot
+        if snapshot is None:
+            # Not called for a received message, take the current values
+            for obj in mapobject:
+                self.tpdo_values[obj.index] = obj.raw
+        else:
+            self.tpdo_values.set_snapshot(snapshot)
 
     @property
     def statusword(self):
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class TimerHandle:
+    """A call scheduled with :class:`Scheduler`."""
+
+    __slots__ = ("deadline", "callback", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable[[], None]):
+        #: Time of the call according to :func:`time.monotonic`
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the call, if it did not happen yet."""
+        self.cancelled = True
+
+
+class Scheduler:
+    """Calls functions at given times from a single background thread.
+
+    This allows many timed activities to share one thread instead of
+    starting a thread each.  Callbacks are run one after another and should
+    return quickly.  The thread is started on first use.
+
+    :param name:
+        Name of the thread.
+    """
+
+    def __init__(self, name: str = "canopen-scheduler"):
+        self.name = name
+        self._queue: list[tuple[float, int, TimerHandle]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def call_at(self, deadline: float, callback: Callable[[], None]) -> TimerHandle:
+        """Schedule a call at the given time.
+
+        :param deadline:
+            Time according to :func:`time.monotonic`.
+        :param callback:
+            Function to call without arguments.
+
+        :return: Handle to cancel the call.
+        """
+        handle = TimerHandle(deadline, callback)
+        with self._condition:
+            heapq.heappush(self._queue, (deadline, next(self._counter), handle))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            elif self._queue[0][2] is handle:
+                # New earliest deadline
+                self._condition.notify_all()
+        return handle
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """Schedule a call after the given delay in seconds.
+
+        :return: Handle to cancel the call.
+        """
+        return self.call_at(time.monotonic() + delay, callback)
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the thread, discarding all pending calls."""
+        with self._condition:
+            thread = self._thread
+            self._queue.clear()
+            self._thread = None
+            self._condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        queue = self._queue
+        condition = self._condition
+        current = threading.current_thread()
+        while True:
+            with condition:
+                while True:
+                    if self._thread is not current:
+                        # Stopped
+                        return
+                    if not queue:
+                        condition.wait()
+                        continue
+                    deadline, _, handle = queue[0]
+                    if handle.cancelled:
+                        heapq.heappop(queue)
+                        continue
+                    delay = deadline - time.monotonic()
+                    if delay <= 0:
+                        heapq.heappop(queue)
+                        break
+                    condition.wait(delay)
+            try:
+                handle.callback()
+            except Exception:
+                logger.exception("Error in scheduled call %r", handle.callback)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import binascii
+import logging
 from collections.abc import Iterator, Mapping
 from typing import Optional, Union
 
@@ -10,6 +11,9 @@ from canopen import variable
 from canopen.utils import pretty_index
 
 
+logger = logging.getLogger(__name__)
+
+
 class CrcXmodem:
     """Mimics CrcXmodem from crccheck."""
 
@@ -93,6 +97,26 @@ class SdoBase(Mapping):
     ) -> None:
         raise NotImplementedError()
 
+    def _upload_expedited(self, index: int, subindex: int) -> bytes:
+        """Read an object which is expected to fit an expedited transfer."""
+        return self.upload(index, subindex)
+
+    def _download_expedited(self, index: int, subindex: int, data: bytes) -> None:
+        """Write 1 to 4 bytes of data using an expedited transfer."""
+        self.download(index, subindex, data)
+
+    async def aupload(self, index: int, subindex: int) -> bytes:
+        raise NotImplementedError()
+
+    async def adownload(
+        self,
+        index: int,
+        subindex: int,
+        data: bytes,
+        force_segment: bool = False,
+    ) -> None:
+        raise NotImplementedError()
+
 
 class SdoRecord(Mapping):
 
@@ -151,7 +175,14 @@ class SdoVariable(variable.Variable):
         variable.Variable.__init__(self, od)
 
     def get_data(self) -> bytes:
-        data = self.sdo_node.upload(self.od.index, self.od.subindex)
+        if self.od.fixed_size and len(self.od) <= 32:
+            # Small enough for an expedited transfer
+            data = self.sdo_node._upload_expedited(self.od.index, self.od.subindex)
+        else:
+            data = self.sdo_node.upload(self.od.index, self.od.subindex)
+        return self._truncate(data)
+
+    def _truncate(self, data: bytes) -> bytes:
         response_size = len(data)
 
         # If size is available through variable in OD, then use the smaller of the two sizes.
@@ -166,7 +197,33 @@ class SdoVariable(variable.Variable):
 
     def set_data(self, data: bytes):
         force_segment = self.od.data_type == objectdictionary.DOMAIN
-        self.sdo_node.download(self.od.index, self.od.subindex, data, force_segment)
+        if not force_segment and 1 <= len(data) <= 4:
+            self.sdo_node._download_expedited(self.od.index, self.od.subindex, data)
+        else:
+            self.sdo_node.download(self.od.index, self.od.subindex, data, force_segment)
+
+    async def aget_data(self) -> bytes:
+        """Asynchronous counterpart of :meth:`get_data`."""
+        data = await self.sdo_node.aupload(self.od.index, self.od.subindex)
+        return self._truncate(data)
+
+    async def aset_data(self, data: bytes) -> None:
+        """Asynchronous counterpart of :meth:`set_data`."""
+        force_segment = self.od.data_type == objectdictionary.DOMAIN
+        await self.sdo_node.adownload(self.od.index, self.od.subindex, data, force_segment)
+
+    async def aget_raw(self) -> Union[int, float, str, bytes, bytearray]:
+        """Asynchronous counterpart of reading :attr:`raw`."""
+        value = self.od.decode_raw(await self.aget_data())
+        logger.debug("Value of %r (%s) is %r",
+                     self.name, pretty_index(self.index, self.subindex), value)
+        return value
+
+    async def aset_raw(self, value: Union[int, bool, float, str, bytes]) -> None:
+        """Asynchronous counterpart of writing :attr:`raw`."""
+        logger.debug("Writing %r (0x%04X:%02X) = %r",
+                     self.name, self.index, self.subindex, value)
+        await self.aset_data(self.od.encode_raw(value))
 
     @property
     def writable(self) -> bool:
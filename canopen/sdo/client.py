@@ -1,8 +1,15 @@
+import asyncio
+import collections
+import contextlib
 import io
 import logging
+import os
 import queue
 import struct
+import threading
 import time
+from collections.abc import Iterable, Sequence
+from typing import Optional
 
 from can import CanError
 
@@ -16,6 +23,107 @@ from canopen.utils import pretty_index
 logger = logging.getLogger(__name__)
 
 
+class ResponseMailbox:
+    """Hands SDO responses from the receiving thread to a waiting client.
+
+    Usually holds at most a single frame, since only one request is
+    outstanding at a time.  During block uploads the server sends many
+    frames in a row, these are kept in order until taken.  Putting and
+    taking frames does not lock, a waiting reader is woken up by
+    releasing a plain lock which is cheaper than a condition variable.
+
+    Supports the :class:`queue.Queue` methods used to access SDO responses,
+    so it can be used in place of the queue the client had before.
+    """
+
+    def __init__(self):
+        self._frames = collections.deque()
+        # Released whenever a frame has arrived
+        self._signal = threading.Lock()
+        self._signal.acquire()
+
+    def put(self, data: bytes, block: bool = True, timeout: Optional[float] = None) -> None:
+        """Store a received frame and wake up a waiting reader.
+
+        Never blocks, the arguments are only accepted for compatibility
+        with :meth:`queue.Queue.put`.
+        """
+        self._frames.append(data)
+        try:
+            self._signal.release()
+        except RuntimeError:
+            # Already signaled
+            pass
+
+    def put_nowait(self, data: bytes) -> None:
+        """Store a received frame, same as :meth:`put`."""
+        self.put(data)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> bytes:
+        """Take the oldest frame, like :meth:`queue.Queue.get`.
+
+        :param block:
+            Wait for a frame if none is available.
+        :param timeout:
+            Max time in seconds to wait, or ``None`` to wait forever.
+
+        :raises queue.Empty:
+            If no frame was available in time.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        frame = self.wait(timeout if block else 0.0)
+        if frame is None:
+            raise queue.Empty
+        return frame
+
+    def get_nowait(self) -> bytes:
+        """Take the oldest frame without waiting, same as ``get(False)``."""
+        return self.get(False)
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """Take the oldest frame, waiting for one if necessary.
+
+        :param timeout:
+            Max time in seconds to wait, or ``None`` to wait forever.
+
+        :return: The frame, or ``None`` if the timeout expired.
+        """
+        frames = self._frames
+        try:
+            return frames.popleft()
+        except IndexError:
+            pass
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if deadline is None:
+                self._signal.acquire()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._signal.acquire(timeout=remaining):
+                    return frames.popleft() if frames else None
+            try:
+                return frames.popleft()
+            except IndexError:
+                # Signal was left over from a frame already taken
+                pass
+
+    def drain(self) -> list[bytes]:
+        """Take all pending frames without waiting."""
+        frames = []
+        try:
+            while True:
+                frames.append(self._frames.popleft())
+        except IndexError:
+            return frames
+
+    def empty(self) -> bool:
+        return not self._frames
+
+    def qsize(self) -> int:
+        return len(self._frames)
+
+
 class SdoClient(SdoBase):
     """Handles communication with an SDO server."""
 
@@ -31,6 +139,9 @@ class SdoClient(SdoBase):
     #: Seconds to wait before retrying a request after a send error
     RETRY_DELAY = 0.1
 
+    #: Adapt the block size of block uploads to observed retransmissions
+    ADAPTIVE_BLOCK_SIZE = False
+
     def __init__(self, rx_cobid, tx_cobid, od):
         """
         :param int rx_cobid:
@@ -41,10 +152,23 @@ class SdoClient(SdoBase):
             Object Dictionary to use for communication
         """
         SdoBase.__init__(self, rx_cobid, tx_cobid, od)
-        self.responses = queue.Queue()
+        #: Received responses waiting to be read
+        self.responses = ResponseMailbox()
+        # Request buffer reused by the expedited fast path
+        self._request = bytearray(8)
+        # Command and multiplexer of the last answered initiate request
+        self._previous = None
+        # Used while a transfer is awaited through the asynchronous API
+        self._aresponses = None
+        self._aloop = None
+        self._alock = None
 
     def on_response(self, can_id, data, timestamp):
-        self.responses.put(bytes(data))
+        aresponses = self._aresponses
+        if aresponses is not None:
+            self._aloop.call_soon_threadsafe(aresponses.put_nowait, bytes(data))
+        else:
+            self.responses.put(bytes(data))
 
     def send_request(self, request):
         retries_left = self.MAX_RETRIES
@@ -64,6 +188,21 @@ class SdoClient(SdoBase):
             else:
                 break
 
+    def send_requests(self, requests):
+        """Send several requests back to back, e.g. a block transfer sub-block."""
+        if self.PAUSE_BEFORE_SEND:
+            time.sleep(self.PAUSE_BEFORE_SEND)
+        try:
+            self.network.send_messages(self.rx_cobid, requests)
+        except CanError as e:
+            # Could be a buffer overflow. Send the messages one by one,
+            # sequence numbers already received are ignored by the server
+            logger.info(str(e))
+            if self.RETRY_DELAY:
+                time.sleep(self.RETRY_DELAY)
+            for request in requests:
+                self.send_request(request)
+
     def read_response(self):
         """Wait for an SDO response and handle timeout or remote abort.
 
@@ -72,27 +211,103 @@ class SdoClient(SdoBase):
         :raises canopen.SdoCommunicationError:
             After timeout with no response received.
         """
-        try:
-            response = self.responses.get(
-                block=True, timeout=self.RESPONSE_TIMEOUT)
-        except queue.Empty:
-            raise SdoCommunicationError("No SDO response received")
-        res_command, = struct.unpack_from("B", response)
-        if res_command == RESPONSE_ABORTED:
-            abort_code, = struct.unpack_from("<L", response, 4)
-            raise SdoAbortedError(abort_code)
+        return self._read_response()
+
+    def _read_response(self, request=None):
+        """Wait for the response, discarding stale ones not matching the request."""
+        deadline = time.monotonic() + self.RESPONSE_TIMEOUT
+        while True:
+            response = self.responses.wait(deadline - time.monotonic())
+            if response is None:
+                raise SdoCommunicationError("No SDO response received")
+            if request is None or not _is_stale(request, response, self._previous):
+                break
+        _check_aborted(response)
+        if request is not None and request[0] & 0xE0 in _INITIATE_RESPONSES:
+            self._previous = bytes(request[:4])
         return response
 
     def request_response(self, sdo_request):
-        retries_left = self.MAX_RETRIES
+        self._begin_request(sdo_request)
+        return self._end_request(sdo_request)
+
+    def _begin_request(self, sdo_request):
+        """Send a request without waiting, complete with :meth:`_end_request`."""
         if not self.responses.empty():
-            # logger.warning("There were unexpected messages in the queue")
-            self.responses = queue.Queue()
+            stale = self.responses.drain()
+            logger.debug("Discarding %d unexpected SDO responses", len(stale))
+        self.send_request(sdo_request)
+
+    def _end_request(self, sdo_request):
+        """Wait for the response to a request, resending it on timeout."""
+        retries_left = self.MAX_RETRIES
         while True:
+            # Wait for node to respond
+            try:
+                return self._read_response(sdo_request)
+            except SdoCommunicationError as e:
+                retries_left -= 1
+                if not retries_left:
+                    self.abort(ABORT_TIMED_OUT)
+                    raise
+                logger.warning(str(e))
             self.send_request(sdo_request)
+
+    async def _asend_request(self, request):
+        retries_left = self.MAX_RETRIES
+        if self.PAUSE_BEFORE_SEND:
+            await asyncio.sleep(self.PAUSE_BEFORE_SEND)
+        while True:
+            try:
+                self.network.send_message(self.rx_cobid, request)
+            except CanError as e:
+                # Could be a buffer overflow. Wait some time before trying again
+                retries_left -= 1
+                if not retries_left:
+                    raise
+                logger.info(str(e))
+                if self.RETRY_DELAY:
+                    await asyncio.sleep(self.RETRY_DELAY)
+            else:
+                break
+
+    async def aread_response(self, request=None):
+        """Wait for an SDO response without blocking the event loop.
+
+        Only valid during a transfer started by one of the asynchronous methods.
+
+        :param request:
+            If given, stale responses not matching this request are discarded.
+
+        :raises canopen.SdoAbortedError:
+            When receiving an SDO abort response from the server.
+        :raises canopen.SdoCommunicationError:
+            After timeout with no response received.
+        """
+        deadline = time.monotonic() + self.RESPONSE_TIMEOUT
+        while True:
+            try:
+                response = await asyncio.wait_for(
+                    self._aresponses.get(), deadline - time.monotonic())
+            except asyncio.TimeoutError:
+                raise SdoCommunicationError("No SDO response received")
+            if request is None or not _is_stale(request, response, self._previous):
+                break
+        _check_aborted(response)
+        if request is not None and request[0] & 0xE0 in _INITIATE_RESPONSES:
+            self._previous = bytes(request[:4])
+        return response
+
+    async def arequest_response(self, sdo_request):
+        """Asynchronous counterpart of :meth:`request_response`."""
+        retries_left = self.MAX_RETRIES
+        if not self._aresponses.empty():
+            self._aresponses = asyncio.Queue()
+        while True:
+            await self._asend_request(sdo_request)
             # Wait for node to respond
             try:
-                return self.read_response()
+                return await self.aread_response(sdo_request)
             except SdoCommunicationError as e:
                 retries_left -= 1
                 if not retries_left:
@@ -100,13 +315,33 @@ class SdoClient(SdoBase):
                     raise
                 logger.warning(str(e))
 
+    @contextlib.asynccontextmanager
+    async def _async_transfer(self):
+        """Route responses to the running event loop for one transfer."""
+        if self._alock is None:
+            self._alock = asyncio.Lock()
+        async with self._alock:
+            self._aloop = asyncio.get_running_loop()
+            self._aresponses = asyncio.Queue()
+            try:
+                yield
+            finally:
+                self._aresponses = None
+
     def abort(self, abort_code=ABORT_GENERAL_ERROR):
-        """Abort current transfer."""
+        """Abort current transfer.
+
+        During a transfer through the asynchronous API, the abort is sent
+        once without pausing or retrying, so the event loop is not blocked.
+        """
         request = bytearray(8)
         request[0] = REQUEST_ABORTED
         # TODO: Is it necessary to include index and subindex?
         struct.pack_into("<L", request, 4, abort_code)
-        self.send_request(request)
+        if self._aresponses is not None:
+            self.network.send_message(self.rx_cobid, request)
+        else:
+            self.send_request(request)
         logger.error("Transfer aborted by client with code 0x%08X", abort_code)
 
     def upload(self, index: int, subindex: int) -> bytes:
@@ -163,6 +398,375 @@ class SdoClient(SdoBase):
                        force_segment=force_segment) as fp:
             fp.write(data)
 
+    def _upload_expedited(self, index: int, subindex: int) -> bytes:
+        """Read a small object without the stream machinery.
+
+        The request is built in a reused buffer.  Should the server still
+        choose a segmented transfer, the segments are read as usual.
+        """
+        request = self._begin_upload(index, subindex, self._request)
+        return self._end_upload(index, subindex, request)
+
+    def _download_expedited(self, index: int, subindex: int, data: bytes) -> None:
+        """Write 1 to 4 bytes without the stream machinery."""
+        request = _expedited_download_request(index, subindex, data, self._request)
+        response = self.request_response(request)
+        _check_expedited_download_response(self, response)
+
+    def download_file(
+        self,
+        index: int,
+        subindex: int,
+        file,
+        block_transfer: bool = True,
+        size: Optional[int] = None,
+        progress=None,
+        chunk_size: int = 7 * 1024,
+    ) -> float:
+        """Write the contents of a file to an object, e.g. a firmware image.
+
+        The file is streamed through one reusable buffer, so the whole
+        contents are never held in memory.
+
+        :param index:
+            Index of object to write.
+        :param subindex:
+            Sub-index of object to write.
+        :param file:
+            Path of the file, or a binary file object opened for reading.
+            Transfer starts at the current position of a file object.
+        :param block_transfer:
+            If block transfer should be used.
+        :param size:
+            Number of bytes to transfer, by default up to the end of the file.
+            Any data in the file after this is left unread.
+            Must be given for block transfer if the file is not seekable.
+        :param progress:
+            Called as ``progress(bytes_sent, size)`` after each chunk.
+        :param chunk_size:
+            Number of bytes to read from the file at a time.
+
+        :return: The average throughput in bytes per second.
+
+        :raises canopen.SdoCommunicationError:
+            On unexpected response or timeout.
+        :raises canopen.SdoAbortedError:
+            When node responds with an error.
+        :raises ValueError:
+            If the file ends before the expected size was transferred.
+            The transfer is then aborted, so the server discards the data.
+        """
+        with contextlib.ExitStack() as stack:
+            if isinstance(file, (str, os.PathLike)):
+                file = stack.enter_context(open(file, "rb"))
+            if size is None:
+                size = _remaining_size(file)
+            if size is None and block_transfer:
+                raise ValueError("Size must be known for block transfer")
+            stream = stack.enter_context(
+                self.open(index, subindex, "wb", buffering=0, size=size,
+                          block_transfer=block_transfer))
+            chunk_size = max(chunk_size, 7)
+            buffer = bytearray(chunk_size)
+            view = memoryview(buffer)
+            start_time = time.perf_counter()
+            sent = 0
+            # Bytes at the start of the buffer not yet accepted by the stream
+            filled = 0
+            while True:
+                # Never read beyond the announced size
+                end = chunk_size if size is None else min(chunk_size, size - sent)
+                n = file.readinto(view[filled:end])
+                if not n:
+                    break
+                filled += n
+                pos = 0
+                while pos < filled:
+                    written = stream.write(view[pos:filled])
+                    if not written:
+                        break
+                    pos += written
+                buffer[:filled - pos] = buffer[pos:filled]
+                filled -= pos
+                sent += pos
+                if progress is not None and pos:
+                    progress(sent, size)
+            if filled or (size is not None and sent < size):
+                # Make sure the server discards the incomplete data
+                stream.abort(ABORT_LENGTH_TOO_LOW)
+                raise ValueError(f"File ended after {sent + filled} of {size} bytes")
+        elapsed = time.perf_counter() - start_time
+        bytes_per_second = sent / elapsed if elapsed > 0 else 0.0
+        logger.info("Downloaded %d bytes to 0x%04X:%02X at %.0f bytes/s",
+                    sent, index, subindex, bytes_per_second)
+        return bytes_per_second
+
+    def upload_to(
+        self,
+        index: int,
+        subindex: int,
+        file,
+        block_transfer: bool = False,
+        progress=None,
+        chunk_size: int = 7 * 1024,
+    ) -> float:
+        """Read an object into a file or buffer, e.g. a log or an EDS file.
+
+        Data is received directly into the destination buffer, or into one
+        reusable buffer which is then written to the file, so memory use
+        does not depend on the size of the object.
+
+        :param index:
+            Index of object to read.
+        :param subindex:
+            Sub-index of object to read.
+        :param file:
+            Path of the file to create, a binary file object opened for
+            writing, or a :class:`bytearray` which will be resized to hold
+            exactly the received data.
+        :param block_transfer:
+            If block transfer should be used.
+        :param progress:
+            Called as ``progress(bytes_received, size)`` after each chunk,
+            where size is ``None`` if not indicated by the server.
+        :param chunk_size:
+            Number of bytes to receive at a time.
+
+        :return: The average throughput in bytes per second.
+
+        :raises canopen.SdoCommunicationError:
+            On unexpected response or timeout.
+        :raises canopen.SdoAbortedError:
+            When node responds with an error.
+        """
+        chunk_size = max(chunk_size, 7)
+        with contextlib.ExitStack() as stack:
+            if isinstance(file, (str, os.PathLike)):
+                file = stack.enter_context(open(file, "wb"))
+            start_time = time.perf_counter()
+            stream = stack.enter_context(
+                self.open(index, subindex, "rb", buffering=0,
+                          block_transfer=block_transfer))
+            # Size is not specified if zero, like in upload()
+            size = stream.size or None
+            received = 0
+            if isinstance(file, bytearray):
+                # Preallocate for the announced size and receive in place
+                del file[:]
+                file.extend(bytes(size + 7 if size else chunk_size))
+                while True:
+                    if len(file) - received < 7:
+                        file.extend(bytes(chunk_size))
+                    with memoryview(file)[received:] as view:
+                        n = stream.readinto(view)
+                    if not n:
+                        break
+                    received += n
+                    if progress is not None:
+                        progress(received, size)
+                if size and size < received:
+                    received = size
+                del file[received:]
+            else:
+                buffer = memoryview(bytearray(chunk_size))
+                while True:
+                    n = stream.readinto(buffer)
+                    if not n:
+                        break
+                    if size and received + n > size:
+                        n = size - received
+                    file.write(buffer[:n])
+                    received += n
+                    if progress is not None:
+                        progress(received, size)
+        elapsed = time.perf_counter() - start_time
+        bytes_per_second = received / elapsed if elapsed > 0 else 0.0
+        logger.info("Uploaded %d bytes from 0x%04X:%02X at %.0f bytes/s",
+                    received, index, subindex, bytes_per_second)
+        return bytes_per_second
+
+    def upload_many(
+        self,
+        objects: Iterable[tuple[int, int]],
+        channels: Optional[Sequence["SdoClient"]] = None,
+    ) -> list[bytes]:
+        """Read many objects one after another with minimal overhead.
+
+        Each object is read like with :meth:`upload`, but without creating
+        stream objects, and the request message buffer is reused.  Only one
+        transfer is outstanding per SDO channel at a time.
+
+        If the server offers additional SDO channels (see
+        :meth:`canopen.RemoteNode.add_sdo`), these can be passed to spread
+        the objects over all channels, with one transfer outstanding on each.
+
+        :param objects:
+            Sequence of ``(index, subindex)`` tuples to read.
+        :param channels:
+            SDO clients to use in parallel, defaulting to only this one.
+            Usually :attr:`canopen.RemoteNode.sdo_channels`.
+
+        :return: The data objects, in the same order as requested.
+
+        :raises canopen.SdoCommunicationError:
+            On unexpected response or timeout.
+        :raises canopen.SdoAbortedError:
+            When node responds with an error, stopping at the first failure.
+            Transfers already started on the other channels are completed
+            first, so no responses are left behind.
+        """
+        objects = list(objects)
+        if not channels:
+            channels = [self]
+        requests = [bytearray(8) for _ in channels]
+        results: list[bytes] = []
+        for start in range(0, len(objects), len(channels)):
+            batch = objects[start:start + len(channels)]
+            started = []
+            error: Optional[Exception] = None
+            for sdo, request, (index, subindex) in zip(channels, requests, batch):
+                try:
+                    sdo._begin_upload(index, subindex, request)
+                except (SdoError, CanError) as e:
+                    error = e
+                    break
+                started.append((sdo, request, index, subindex))
+            for sdo, request, index, subindex in started:
+                try:
+                    data = sdo._end_upload(index, subindex, request)
+                except (SdoError, CanError) as e:
+                    if error is None:
+                        error = e
+                    continue
+                if error is None:
+                    results.append(data)
+            if error is not None:
+                raise error
+        return results
+
+    def _begin_upload(self, index, subindex, request=None):
+        """Send an upload request, complete with :meth:`_end_upload`."""
+        logger.debug("Reading 0x%04X:%02X from node %d", index, subindex,
+                     self.rx_cobid - 0x600)
+        request = _upload_request(index, subindex, request)
+        self._begin_request(request)
+        return request
+
+    def _end_upload(self, index, subindex, request):
+        """Wait for the upload response and read any remaining segments."""
+        response = self._end_request(request)
+        data, size = _parse_upload_response(response, index, subindex)
+        if data is None:
+            data = self._run_segments(_segmented_upload(self))
+        if size and size < len(data):
+            data = data[:size]
+        return data
+
+    def _begin_download(self, index, subindex, data):
+        """Send a download request, complete with :meth:`_end_download`."""
+        if 1 <= len(data) <= 4:
+            request = _expedited_download_request(index, subindex, data)
+        else:
+            request = _download_request(index, subindex, len(data))
+        self._begin_request(request)
+        return request
+
+    def _end_download(self, data, request):
+        """Wait for the download response and write any remaining segments."""
+        response = self._end_request(request)
+        size = len(data)
+        if 1 <= size <= 4:
+            _check_expedited_download_response(self, response)
+            return
+        _check_download_response(self, response)
+        self._run_segments(_segmented_download(self, data))
+
+    def _run_segments(self, segments):
+        """Perform the requests of a segmented transfer, see :func:`_segmented_upload`.
+
+        :return: The result of the transfer.
+        """
+        try:
+            request = next(segments)
+            while True:
+                request = segments.send(self.request_response(request))
+        except StopIteration as e:
+            return e.value
+
+    async def _arun_segments(self, segments):
+        """Asynchronous counterpart of :meth:`_run_segments`."""
+        try:
+            request = next(segments)
+            while True:
+                request = segments.send(await self.arequest_response(request))
+        except StopIteration as e:
+            return e.value
+
+    async def aupload(self, index: int, subindex: int) -> bytes:
+        """Asynchronous counterpart of :meth:`upload`.
+
+        Uses expedited or segmented transfer and waits for responses without
+        blocking the event loop.  Transfers on the same SDO channel are
+        serialized.
+
+        :param index:
+            Index of object to read.
+        :param subindex:
+            Sub-index of object to read.
+
+        :return: A data object.
+
+        :raises canopen.SdoCommunicationError:
+            On unexpected response or timeout.
+        :raises canopen.SdoAbortedError:
+            When node responds with an error.
+        """
+        async with self._async_transfer():
+            logger.debug("Reading 0x%04X:%02X from node %d", index, subindex,
+                         self.rx_cobid - 0x600)
+            response = await self.arequest_response(_upload_request(index, subindex))
+            data, size = _parse_upload_response(response, index, subindex)
+            if data is None:
+                data = await self._arun_segments(_segmented_upload(self))
+        if size and size < len(data):
+            data = data[:size]
+        return data
+
+    async def adownload(
+        self,
+        index: int,
+        subindex: int,
+        data: bytes,
+        force_segment: bool = False,
+    ) -> None:
+        """Asynchronous counterpart of :meth:`download`.
+
+        :param index:
+            Index of object to write.
+        :param subindex:
+            Sub-index of object to write.
+        :param data:
+            Data to be written.
+        :param force_segment:
+            Force use of segmented transfer regardless of data size.
+
+        :raises canopen.SdoCommunicationError:
+            On unexpected response or timeout.
+        :raises canopen.SdoAbortedError:
+            When node responds with an error.
+        """
+        size = len(data)
+        async with self._async_transfer():
+            if 1 <= size <= 4 and not force_segment:
+                request = _expedited_download_request(index, subindex, data)
+                response = await self.arequest_response(request)
+                _check_expedited_download_response(self, response)
+                return
+            response = await self.arequest_response(
+                _download_request(index, subindex, size))
+            _check_download_response(self, response)
+            await self._arun_segments(_segmented_download(self, data))
+
     def open(self, index, subindex=0, mode="rb", encoding="ascii",
              buffering=1024, size=None, block_transfer=False, force_segment=False, request_crc_support=True):
         """Open the data stream as a file like object.
@@ -227,6 +831,214 @@ class SdoClient(SdoBase):
         return buffered_stream
 
 
+def _remaining_size(file):
+    """Get the number of bytes left in a file, or ``None`` if not seekable."""
+    try:
+        pos = file.tell()
+        end = file.seek(0, io.SEEK_END)
+        file.seek(pos)
+    except (AttributeError, OSError):
+        return None
+    return end - pos
+
+
+def _check_aborted(response):
+    """Raise if the response is an SDO abort."""
+    res_command, = struct.unpack_from("B", response)
+    if res_command == RESPONSE_ABORTED:
+        abort_code, = struct.unpack_from("<L", response, 4)
+        raise SdoAbortedError(abort_code)
+
+
+def _is_stale(request, response, previous):
+    """Check if a response is left over from the previous transfer.
+
+    Only a late answer to the previous initiate request, which does not
+    also answer the current one, can be safely discarded.  Any other
+    unexpected response is reported by the caller.
+    """
+    expected = _INITIATE_RESPONSES.get(request[0] & 0xE0)
+    if expected is None or previous is None:
+        return False
+    res_command = response[0] & 0xE0
+    if res_command == expected and response[1:4] == request[1:4]:
+        return False
+    stale = (res_command == _INITIATE_RESPONSES.get(previous[0] & 0xE0)
+             and response[1:4] == previous[1:4])
+    if stale:
+        logger.debug("Discarding stale SDO response %s", bytes(response).hex())
+    return stale
+
+
+# Response command expected for each initiate request command
+_INITIATE_RESPONSES = {
+    REQUEST_UPLOAD: RESPONSE_UPLOAD,
+    REQUEST_DOWNLOAD: RESPONSE_DOWNLOAD,
+}
+
+
+def _upload_request(index, subindex, request=None):
+    if request is None:
+        request = bytearray(8)
+    EXPEDITED_STRUCT.pack_into(request, 0, REQUEST_UPLOAD, index, subindex, b"")
+    return request
+
+
+def _parse_upload_response(response, index, subindex):
+    """Check an initiate upload response.
+
+    :returns:
+        The data for an expedited transfer or ``None`` if segments follow,
+        and the size of data if specified by the server.
+    """
+    res_command, res_index, res_subindex = SDO_STRUCT.unpack_from(response)
+    res_data = response[4:8]
+
+    if res_command & 0xE0 != RESPONSE_UPLOAD:
+        raise SdoCommunicationError(f"Unexpected response 0x{res_command:02X}")
+
+    # Check that the message is for us
+    if res_index != index or res_subindex != subindex:
+        raise SdoCommunicationError(
+            f"Node returned a value for {pretty_index(res_index, res_subindex)} instead, "
+            "maybe there is another SDO client communicating "
+            "on the same SDO channel?")
+
+    size = None
+    exp_data = None
+    if res_command & EXPEDITED:
+        # Expedited upload
+        if res_command & SIZE_SPECIFIED:
+            size = 4 - ((res_command >> 2) & 0x3)
+            exp_data = res_data[:size]
+        else:
+            exp_data = res_data
+    elif res_command & SIZE_SPECIFIED:
+        size, = struct.unpack("<L", res_data)
+        logger.debug("Using segmented transfer of %d bytes", size)
+    else:
+        logger.debug("Using segmented transfer")
+    return exp_data, size
+
+
+def _segment_upload_request(toggle):
+    request = bytearray(8)
+    request[0] = REQUEST_SEGMENT_UPLOAD | toggle
+    return request
+
+
+def _parse_segment_upload_response(sdo_client, response, toggle):
+    """Check an upload segment response.
+
+    :returns: The segment data and whether this was the last segment.
+    """
+    res_command, = struct.unpack_from("B", response)
+    if res_command & 0xE0 != RESPONSE_SEGMENT_UPLOAD:
+        sdo_client.abort(ABORT_INVALID_COMMAND_SPECIFIER)
+        raise SdoCommunicationError(f"Unexpected response 0x{res_command:02X}")
+    if res_command & TOGGLE_BIT != toggle:
+        sdo_client.abort(ABORT_TOGGLE_NOT_ALTERNATED)
+        raise SdoCommunicationError("Toggle bit mismatch")
+    length = 7 - ((res_command >> 1) & 0x7)
+    return response[1:length + 1], bool(res_command & NO_MORE_DATA)
+
+
+def _download_request(index, subindex, size):
+    request = bytearray(8)
+    command = REQUEST_DOWNLOAD
+    if size is not None:
+        command |= SIZE_SPECIFIED
+        struct.pack_into("<L", request, 4, size)
+    SDO_STRUCT.pack_into(request, 0, command, index, subindex)
+    return request
+
+
+def _check_download_response(sdo_client, response):
+    res_command, = struct.unpack_from("B", response)
+    if res_command != RESPONSE_DOWNLOAD:
+        sdo_client.abort(ABORT_INVALID_COMMAND_SPECIFIER)
+        raise SdoCommunicationError(
+            f"Unexpected response 0x{res_command:02X}")
+
+
+def _expedited_download_request(index, subindex, data, request=None):
+    if request is None:
+        request = bytearray(8)
+    command = REQUEST_DOWNLOAD | EXPEDITED | SIZE_SPECIFIED
+    command |= (4 - len(data)) << 2
+    EXPEDITED_STRUCT.pack_into(request, 0, command, index, subindex, data)
+    return request
+
+
+def _check_expedited_download_response(sdo_client, response):
+    res_command, = struct.unpack_from("B", response)
+    if res_command & 0xE0 != RESPONSE_DOWNLOAD:
+        sdo_client.abort(ABORT_INVALID_COMMAND_SPECIFIER)
+        raise SdoCommunicationError(
+            f"Unexpected response 0x{res_command:02X}")
+
+
+def _segment_download_request(toggle, data, last):
+    request = bytearray(8)
+    size = len(data)
+    command = REQUEST_SEGMENT_DOWNLOAD | toggle
+    if last:
+        # No more data after this message
+        command |= NO_MORE_DATA
+    # Specify number of bytes that do not contain segment data
+    command |= (7 - size) << 1
+    request[0] = command
+    request[1:size + 1] = data
+    return request
+
+
+def _check_segment_download_response(sdo_client, response):
+    res_command, = struct.unpack_from("B", response)
+    if res_command & 0xE0 != RESPONSE_SEGMENT_DOWNLOAD:
+        sdo_client.abort(ABORT_INVALID_COMMAND_SPECIFIER)
+        raise SdoCommunicationError(
+            f"Unexpected response 0x{res_command:02X} "
+            f"(expected 0x{RESPONSE_SEGMENT_DOWNLOAD:02X})")
+
+
+def _segmented_upload(sdo_client):
+    """Segment requests of an upload, receiving each response.
+
+    Used as a generator, which is driven by :meth:`SdoClient._run_segments`
+    or :meth:`SdoClient._arun_segments`.
+
+    :return: The received data.
+    """
+    data = bytearray()
+    toggle = 0
+    done = False
+    while not done:
+        response = yield _segment_upload_request(toggle)
+        segment, done = _parse_segment_upload_response(sdo_client, response, toggle)
+        toggle ^= TOGGLE_BIT
+        data += segment
+    return bytes(data)
+
+
+def _segmented_download(sdo_client, data):
+    """Segment requests of a download, receiving each response.
+
+    Used as a generator like :func:`_segmented_upload`.
+    """
+    size = len(data)
+    toggle = 0
+    pos = 0
+    while True:
+        segment = data[pos:pos + 7]
+        pos += len(segment)
+        last = pos >= size
+        response = yield _segment_download_request(toggle, segment, last)
+        _check_segment_download_response(sdo_client, response)
+        toggle ^= TOGGLE_BIT
+        if last:
+            return
+
+
 class ReadableStream(io.RawIOBase):
     """File like object for reading from a variable."""
 
@@ -249,44 +1061,19 @@ class ReadableStream(io.RawIOBase):
 
         logger.debug("Reading 0x%04X:%02X from node %d", index, subindex,
                      sdo_client.rx_cobid - 0x600)
-        request = bytearray(8)
-        SDO_STRUCT.pack_into(request, 0, REQUEST_UPLOAD, index, subindex)
-        response = sdo_client.request_response(request)
-        res_command, res_index, res_subindex = SDO_STRUCT.unpack_from(response)
-        res_data = response[4:8]
-
-        if res_command & 0xE0 != RESPONSE_UPLOAD:
-            raise SdoCommunicationError(f"Unexpected response 0x{res_command:02X}")
-
-        # Check that the message is for us
-        if res_index != index or res_subindex != subindex:
-            raise SdoCommunicationError(
-                f"Node returned a value for {pretty_index(res_index, res_subindex)} instead, "
-                "maybe there is another SDO client communicating "
-                "on the same SDO channel?")
-
-        self.exp_data = None
-        if res_command & EXPEDITED:
-            # Expedited upload
-            if res_command & SIZE_SPECIFIED:
-                self.size = 4 - ((res_command >> 2) & 0x3)
-                self.exp_data = res_data[:self.size]
-            else:
-                self.exp_data = res_data
+        response = sdo_client.request_response(_upload_request(index, subindex))
+        self.exp_data, self.size = _parse_upload_response(response, index, subindex)
+        if self.exp_data is not None:
             self.pos += len(self.exp_data)
-        elif res_command & SIZE_SPECIFIED:
-            self.size, = struct.unpack("<L", res_data)
-            logger.debug("Using segmented transfer of %d bytes", self.size)
-        else:
-            logger.debug("Using segmented transfer")
 
     def read(self, size=-1):
-        """Read one segment which may be up to 7 bytes.
+        """Read as many complete segments of up to 7 bytes as fit into size.
 
         :param int size:
-            If size is -1, all data will be returned. Other values are ignored.
+            If size is -1, all data will be returned. At least one segment
+            is returned for smaller sizes.
 
-        :returns: 1 - 7 bytes of data or no bytes if EOF.
+        :returns: Data or no bytes if EOF.
         :rtype: bytes
         """
         if self._done:
@@ -296,34 +1083,38 @@ class ReadableStream(io.RawIOBase):
             return self.exp_data
         if size is None or size < 0:
             return self.readall()
-
-        command = REQUEST_SEGMENT_UPLOAD
-        command |= self._toggle
-        request = bytearray(8)
-        request[0] = command
-        response = self.sdo_client.request_response(request)
-        res_command, = struct.unpack_from("B", response)
-        if res_command & 0xE0 != RESPONSE_SEGMENT_UPLOAD:
-            self.sdo_client.abort(ABORT_INVALID_COMMAND_SPECIFIER)
-            raise SdoCommunicationError(f"Unexpected response 0x{res_command:02X}")
-        if res_command & TOGGLE_BIT != self._toggle:
-            self.sdo_client.abort(ABORT_TOGGLE_NOT_ALTERNATED)
-            raise SdoCommunicationError("Toggle bit mismatch")
-        length = 7 - ((res_command >> 1) & 0x7)
-        if res_command & NO_MORE_DATA:
-            self._done = True
-        self._toggle ^= TOGGLE_BIT
-        self.pos += length
-        return response[1:length + 1]
+        b = bytearray(max(size, 7))
+        n = self.readinto(b)
+        del b[n:]
+        return bytes(b)
 
     def readinto(self, b):
         """
         Read bytes into a pre-allocated, writable bytes-like object b,
         and return the number of bytes read.
+
+        Segments are received until b has no room for another one.
         """
-        data = self.read(7)
-        b[:len(data)] = data
-        return len(data)
+        if self._done:
+            return 0
+        view = memoryview(b).cast("B")
+        if self.exp_data is not None:
+            n = len(self.exp_data)
+            view[:n] = self.exp_data
+            self._done = True
+            return n
+        if len(view) < 7:
+            raise ValueError("Buffer must have room for at least 7 bytes")
+        n = 0
+        while not self._done and n + 7 <= len(view):
+            response = self.sdo_client.request_response(_segment_upload_request(self._toggle))
+            data, self._done = _parse_segment_upload_response(
+                self.sdo_client, response, self._toggle)
+            self._toggle ^= TOGGLE_BIT
+            view[n:n + len(data)] = data
+            n += len(data)
+        self.pos += n
+        return n
 
     def readable(self):
         return True
@@ -357,18 +1148,8 @@ class WritableStream(io.RawIOBase):
 
         if size is None or size < 1 or size > 4 or force_segment:
             # Initiate segmented download
-            request = bytearray(8)
-            command = REQUEST_DOWNLOAD
-            if size is not None:
-                command |= SIZE_SPECIFIED
-                struct.pack_into("<L", request, 4, size)
-            SDO_STRUCT.pack_into(request, 0, command, index, subindex)
-            response = sdo_client.request_response(request)
-            res_command, = struct.unpack_from("B", response)
-            if res_command != RESPONSE_DOWNLOAD:
-                self.sdo_client.abort(ABORT_INVALID_COMMAND_SPECIFIER)
-                raise SdoCommunicationError(
-                    f"Unexpected response 0x{res_command:02X}")
+            response = sdo_client.request_response(_download_request(index, subindex, size))
+            _check_download_response(sdo_client, response)
         else:
             # Expedited download
             # Prepare header (first 4 bytes in CAN message)
@@ -393,37 +1174,20 @@ class WritableStream(io.RawIOBase):
             data = b.tobytes() if isinstance(b, memoryview) else b
             request = self._exp_header + data.ljust(4, b"\x00")
             response = self.sdo_client.request_response(request)
-            res_command, = struct.unpack_from("B", response)
-            if res_command & 0xE0 != RESPONSE_DOWNLOAD:
-                self.sdo_client.abort(ABORT_INVALID_COMMAND_SPECIFIER)
-                raise SdoCommunicationError(
-                    f"Unexpected response 0x{res_command:02X}")
+            _check_expedited_download_response(self.sdo_client, response)
             bytes_sent = len(b)
             self._done = True
         else:
             # Segmented download
-            request = bytearray(8)
-            command = REQUEST_SEGMENT_DOWNLOAD
-            # Add toggle bit
-            command |= self._toggle
-            self._toggle ^= TOGGLE_BIT
             # Can send up to 7 bytes at a time
             bytes_sent = min(len(b), 7)
             if self.size is not None and self.pos + bytes_sent >= self.size:
                 # No more data after this message
-                command |= NO_MORE_DATA
                 self._done = True
-            # Specify number of bytes that do not contain segment data
-            command |= (7 - bytes_sent) << 1
-            request[0] = command
-            request[1:bytes_sent + 1] = b[0:bytes_sent]
+            request = _segment_download_request(self._toggle, b[0:bytes_sent], self._done)
+            self._toggle ^= TOGGLE_BIT
             response = self.sdo_client.request_response(request)
-            res_command, = struct.unpack("B", response[0:1])
-            if res_command & 0xE0 != RESPONSE_SEGMENT_DOWNLOAD:
-                self.sdo_client.abort(ABORT_INVALID_COMMAND_SPECIFIER)
-                raise SdoCommunicationError(
-                    f"Unexpected response 0x{res_command:02X} "
-                    f"(expected 0x{RESPONSE_SEGMENT_DOWNLOAD:02X})")
+            _check_segment_download_response(self.sdo_client, response)
         # Advance position
         self.pos += bytes_sent
         return bytes_sent
@@ -445,6 +1209,16 @@ class WritableStream(io.RawIOBase):
             self.sdo_client.request_response(request)
             self._done = True
 
+    def abort(self, abort_code=ABORT_GENERAL_ERROR):
+        """Abort the transfer and close the stream without ending it.
+
+        The server discards any data written so far.
+        """
+        if not self.closed:
+            self._done = True
+            self.sdo_client.abort(abort_code)
+            super(WritableStream, self).close()
+
     def writable(self):
         return True
 
@@ -458,10 +1232,14 @@ class BlockUploadStream(io.RawIOBase):
     #: Total size of data or ``None`` if not specified
     size = None
 
+    #: Number of segments per block, also the maximum in adaptive mode
     blksize = 127
 
     crc_supported = False
 
+    #: Number of times a retransmission had to be requested
+    retransmissions = 0
+
     def __init__(self, sdo_client, index, subindex=0, request_crc_support=True):
         """
         :param canopen.sdo.SdoClient sdo_client:
@@ -480,6 +1258,9 @@ class BlockUploadStream(io.RawIOBase):
         self._server_crc = None
         self._ackseq = 0
         self._error = False
+        self._adaptive = sdo_client.ADAPTIVE_BLOCK_SIZE
+        self._start_time = time.perf_counter()
+        self._end_time = None
 
         logger.debug("Reading 0x%04X:%02X from node %d", index, subindex,
                      sdo_client.rx_cobid - 0x600)
@@ -513,19 +1294,26 @@ class BlockUploadStream(io.RawIOBase):
         sdo_client.send_request(request)
 
     def read(self, size=-1):
-        """Read one segment which may be up to 7 bytes.
+        """Read as many complete segments of up to 7 bytes as fit into size.
 
         :param int size:
-            If size is -1, all data will be returned. Other values are ignored.
+            If size is -1, all data will be returned. At least one segment
+            is returned for smaller sizes.
 
-        :returns: 1 - 7 bytes of data or no bytes if EOF.
+        :returns: Data or no bytes if EOF.
         :rtype: bytes
         """
         if self._done:
             return b""
         if size is None or size < 0:
             return self.readall()
+        b = bytearray(max(size, 7))
+        n = self.readinto(b)
+        del b[n:]
+        return bytes(b)
 
+    def _read_segment(self):
+        """Receive the next segment, without updating CRC or position."""
         try:
             response = self.sdo_client.read_response()
         except SdoCommunicationError:
@@ -539,27 +1327,32 @@ class BlockUploadStream(io.RawIOBase):
             response = self._retransmit()
             res_command, = struct.unpack_from("B", response)
         if self._ackseq >= self.blksize or res_command & NO_MORE_BLOCKS:
+            if self._adaptive and self.blksize < type(self).blksize:
+                # Block was received completely, try larger blocks again
+                self.blksize = min(self.blksize + self.blksize // 4 + 1,
+                                   type(self).blksize)
             self._ack_block()
         if res_command & NO_MORE_BLOCKS:
             n = self._end_upload()
-            data = response[1:8 - n]
             self._done = True
-        else:
-            data = response[1:8]
-        if self.crc_supported:
-            self._crc.process(data)
-            if self._done:
-                if self._server_crc != self._crc.final():
-                    self._error = True
-                    self.sdo_client.abort(ABORT_CRC_ERROR)
-                    raise SdoCommunicationError("CRC is not OK")
-                logger.info("CRC is OK")
-        self.pos += len(data)
-        return data
+            return memoryview(response)[1:8 - n]
+        return memoryview(response)[1:8]
+
+    @property
+    def bytes_per_second(self):
+        """Average throughput of the transfer so far."""
+        end_time = self._end_time or time.perf_counter()
+        elapsed = end_time - self._start_time
+        return self.pos / elapsed if elapsed > 0 else 0.0
 
     def _retransmit(self):
         logger.info("Only %d sequences were received. Requesting retransmission",
                     self._ackseq)
+        self.retransmissions += 1
+        if self._adaptive:
+            # Frames get lost, let the server send smaller blocks
+            self.blksize = max(self.blksize // 2, 1)
+            logger.debug("Reducing block size to %d", self.blksize)
         end_time = time.time() + self.sdo_client.RESPONSE_TIMEOUT
         self._ack_block()
         while time.time() < end_time:
@@ -616,10 +1409,34 @@ class BlockUploadStream(io.RawIOBase):
         """
         Read bytes into a pre-allocated, writable bytes-like object b,
         and return the number of bytes read.
+
+        Segments are received until b has no room for another one, and the
+        CRC is calculated once over all of them.
         """
-        data = self.read(7)
-        b[:len(data)] = data
-        return len(data)
+        if self._done:
+            return 0
+        view = memoryview(b).cast("B")
+        if len(view) < 7:
+            raise ValueError("Buffer must have room for at least 7 bytes")
+        n = 0
+        while not self._done and n + 7 <= len(view):
+            data = self._read_segment()
+            view[n:n + len(data)] = data
+            n += len(data)
+        self.pos += n
+        if self.crc_supported:
+            self._crc.process(view[:n])
+            if self._done:
+                if self._server_crc != self._crc.final():
+                    self._error = True
+                    self.sdo_client.abort(ABORT_CRC_ERROR)
+                    raise SdoCommunicationError("CRC is not OK")
+                logger.info("CRC is OK")
+        if self._done:
+            self._end_time = time.perf_counter()
+            logger.info("Block upload of %d bytes at %.0f bytes/s",
+                        self.pos, self.bytes_per_second)
+        return n
 
     def readable(self):
         return True
@@ -649,7 +1466,13 @@ class BlockDownloadStream(io.RawIOBase):
         self._crc = sdo_client.crc_cls()
         self._last_bytes_sent = 0
         self._current_block = []
+        # Requests of the current sub-block not sent yet
+        self._pending = []
         self._retransmitting = False
+        #: Number of times the server requested a retransmission
+        self.retransmissions = 0
+        self._start_time = time.perf_counter()
+        self._end_time = None
         command = REQUEST_BLOCK_DOWNLOAD | INITIATE_BLOCK_TRANSFER
         if request_crc_support:
             command |= CRC_SUPPORTED
@@ -684,7 +1507,8 @@ class BlockDownloadStream(io.RawIOBase):
     def write(self, b):
         """
         Write the given bytes-like object, b, to the SDO server, and return the
-        number of bytes written. This will be at most 7 bytes.
+        number of bytes written. This will be a multiple of 7 bytes, unless
+        the end of data is reached.
 
         :param bytes b:
             Data to be transmitted.
@@ -695,17 +1519,24 @@ class BlockDownloadStream(io.RawIOBase):
         """
         if self._done:
             raise RuntimeError("All expected data has already been transmitted")
-        # Can send up to 7 bytes at a time
-        data = b[0:7]
-        if self.size is not None and self.pos + len(data) >= self.size:
-            # This is the last data to be transmitted based on expected size
-            self.send(data, end=True)
-        elif len(data) < 7:
-            # We can't send less than 7 bytes in the middle of a transmission
-            return None
-        else:
-            self.send(data)
-        return len(data)
+        view = memoryview(b).cast("B")
+        written = 0
+        while not self._done:
+            # Can send up to 7 bytes per message
+            data = bytes(view[written:written + 7])
+            if self.size is not None and self.pos + len(data) >= self.size:
+                # This is the last data to be transmitted based on expected size
+                self._send(data, end=True)
+            elif len(data) < 7:
+                # We can't send less than 7 bytes in the middle of a transmission
+                break
+            else:
+                self._send(data)
+            written += len(data)
+        # Calculate CRC over all data at once, but not if retransmitting
+        if self.crc_supported and not self._retransmitting:
+            self._crc.process(view[:written])
+        return written or None
 
     def send(self, b, end=False):
         """Send up to 7 bytes of data.
@@ -718,6 +1549,13 @@ class BlockDownloadStream(io.RawIOBase):
         assert len(b) <= 7, "Max 7 bytes can be sent"
         if not end:
             assert len(b) == 7, "Less than 7 bytes only allowed if last data"
+        # Don't calculate crc if retransmitting
+        if self.crc_supported and not self._retransmitting:
+            # Calculate CRC
+            self._crc.process(b)
+        self._send(b, end)
+
+    def _send(self, b, end=False):
         self._seqno += 1
         command = self._seqno
         if end:
@@ -730,21 +1568,27 @@ class BlockDownloadStream(io.RawIOBase):
         request = bytearray(8)
         request[0] = command
         request[1:len(b) + 1] = b
-        self.sdo_client.send_request(request)
+        self._pending.append(request)
         self.pos += len(b)
         # Add the sent data to the current block buffer
         self._current_block.append(b)
-        # Don't calculate crc if retransmitting
-        if self.crc_supported and not self._retransmitting:
-            # Calculate CRC
-            self._crc.process(b)
         if self._seqno >= self._blksize:
-            # End of this block, wait for ACK
+            # End of this block, send it all at once and wait for ACK
+            pending = self._pending
+            self._pending = []
+            self.sdo_client.send_requests(pending)
             self._block_ack()
 
     def tell(self):
         return self.pos
 
+    @property
+    def bytes_per_second(self):
+        """Average throughput of the transfer so far."""
+        end_time = self._end_time or time.perf_counter()
+        elapsed = end_time - self._start_time
+        return self.pos / elapsed if elapsed > 0 else 0.0
+
     def _block_ack(self):
         logger.debug("Waiting for acknowledgement of last block...")
         try:
@@ -777,6 +1621,7 @@ class BlockDownloadStream(io.RawIOBase):
         """Retransmit the failed block"""
         logger.info("%d of %d sequences were received. "
                     "Will start retransmission", ackseq, self._blksize)
+        self.retransmissions += 1
         # Sub blocks betwen ackseq and end of corrupted block need to be resent
         # Get the part of the block to resend
         block = self._current_block[ackseq:]
@@ -804,6 +1649,9 @@ class BlockDownloadStream(io.RawIOBase):
             return
         if not self._done:
             logger.error("Block transfer was not finished")
+        if self._pending:
+            self.sdo_client.send_requests(self._pending)
+            self._pending = []
         command = REQUEST_BLOCK_DOWNLOAD | END_BLOCK_TRANSFER
         # Specify number of bytes in last message that did not contain data
         command |= (7 - self._last_bytes_sent) << 2
@@ -817,7 +1665,20 @@ class BlockDownloadStream(io.RawIOBase):
         res_command, = struct.unpack_from("B", response)
         if not res_command & END_BLOCK_TRANSFER:
             raise SdoCommunicationError("Block download unsuccessful")
-        logger.info("Block download successful")
+        self._end_time = time.perf_counter()
+        logger.info("Block download of %d bytes successful at %.0f bytes/s",
+                    self.pos, self.bytes_per_second)
+
+    def abort(self, abort_code=ABORT_GENERAL_ERROR):
+        """Abort the transfer and close the stream without ending it.
+
+        Any sub-block not sent yet is dropped and the server discards the
+        data received so far.
+        """
+        if not self.closed:
+            self._pending = []
+            self.sdo_client.abort(abort_code)
+            super(BlockDownloadStream, self).close()
 
     def writable(self):
         return True
@@ -4,6 +4,8 @@ from typing import Final
 
 # Command, index, subindex
 SDO_STRUCT = struct.Struct("<BHB")
+# Command, index, subindex, data of an expedited transfer
+EXPEDITED_STRUCT = struct.Struct("<BHB4s")
 
 REQUEST_SEGMENT_DOWNLOAD = 0 << 5
 REQUEST_DOWNLOAD = 1 << 5
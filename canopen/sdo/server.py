@@ -225,3 +225,17 @@ class SdoServer(SdoBase):
             When node responds with an error.
         """
         return self._node.set_data(index, subindex, data)
+
+    async def aupload(self, index: int, subindex: int) -> bytes:
+        """Asynchronous variant of :meth:`upload`, completing immediately."""
+        return self.upload(index, subindex)
+
+    async def adownload(
+        self,
+        index: int,
+        subindex: int,
+        data: bytes,
+        force_segment: bool = False,
+    ):
+        """Asynchronous variant of :meth:`download`, completing immediately."""
+        return self.download(index, subindex, data)
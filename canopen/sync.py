@@ -1,9 +1,155 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+import logging
+import math
+import threading
+import time
+from typing import Callable, Optional, TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
     import canopen.network
+    from canopen.pdo.base import PdoMap
+
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """Counts of values in bins of equal width.
+
+    Values below the first or above the last bin are counted in that bin.
+
+    :param low:
+        Lower edge of the first bin.
+    :param bin_width:
+        Width of each bin.
+    :param bins:
+        Number of bins.
+    """
+
+    def __init__(self, low: float, bin_width: float, bins: int):
+        self.low = low
+        self.bin_width = bin_width
+        #: Number of values in each bin
+        self.counts = [0] * bins
+        #: Number of values
+        self.count = 0
+        #: Smallest value, or None if empty
+        self.min: Optional[float] = None
+        #: Largest value, or None if empty
+        self.max: Optional[float] = None
+        self._sum = 0.0
+
+    @property
+    def edges(self) -> list[float]:
+        """Lower edges of the bins."""
+        return [self.low + i * self.bin_width for i in range(len(self.counts))]
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of all values, or None if empty."""
+        return self._sum / self.count if self.count else None
+
+    def add(self, value: float) -> None:
+        """Count a value."""
+        i = int((value - self.low) // self.bin_width)
+        self.counts[min(max(i, 0), len(self.counts) - 1)] += 1
+        self.count += 1
+        self._sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+
+class SyncStatistics:
+    """Timing of a SYNC transmission started with ``precise=True``.
+
+    :param period:
+        Nominal SYNC period in seconds.
+    :param bin_width:
+        Width of the histogram bins in seconds.
+    :param bins:
+        Number of histogram bins.
+    """
+
+    def __init__(self, period: float, bin_width: float = 10e-6, bins: int = 100):
+        self.period = period
+        self.bin_width = bin_width
+        self.bins = bins
+        self.reset()
+
+    @property
+    def count(self) -> int:
+        """Number of transmitted SYNC messages."""
+        return self.jitter.count
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        bin_width = self.bin_width
+        bins = self.bins
+        #: Delay of each transmission after its deadline in seconds
+        self.jitter = Histogram(0.0, bin_width, bins)
+        #: Time between consecutive transmissions in seconds, centered on
+        #: the nominal period
+        self.periods = Histogram(self.period - bins // 2 * bin_width, bin_width, bins)
+        #: Number of SYNC periods skipped because a transmission was too late
+        self.missed = 0
+
+
+class _SyncThread:
+    """Thread transmitting SYNC messages at monotonic deadlines."""
+
+    def __init__(self, producer: SyncProducer, period: float, busy_wait: float):
+        self.producer = producer
+        self.period = period
+        self.busy_wait = busy_wait
+        self.statistics = SyncStatistics(period)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="canopen-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.error("SYNC thread did not stop within %s seconds", timeout)
+
+    def _run(self) -> None:
+        clock = time.monotonic
+        period = self.period
+        statistics = self.statistics
+        stopped = self._stopped
+        counter = 0
+        previous = None
+        deadline = clock()
+        while not stopped.is_set():
+            remaining = deadline - clock()
+            if remaining > self.busy_wait:
+                # Sleep until shortly before the deadline
+                stopped.wait(remaining - self.busy_wait)
+                continue
+            while clock() < deadline:
+                # Releases the GIL while spinning
+                time.sleep(0)
+            if self.producer.counter_overflow:
+                counter = counter % self.producer.counter_overflow + 1
+            now = clock()
+            try:
+                self.producer._transmit_fused(counter or None)
+            except Exception:
+                logger.exception("Failed to transmit SYNC")
+            statistics.jitter.add(now - deadline)
+            if previous is not None:
+                statistics.periods.add(now - previous)
+            previous = now
+            deadline += period
+            if deadline < now:
+                # Overrun, skip the missed periods but keep the phase
+                missed = math.ceil((now - deadline) / period)
+                statistics.missed += missed
+                deadline += missed * period
 
 
 class SyncProducer:
@@ -15,7 +161,35 @@ class SyncProducer:
     def __init__(self, network: canopen.network.Network):
         self.network = network
         self.period: Optional[float] = None
-        self._task: Optional[canopen.network.PeriodicMessageTask] = None
+        #: Largest value of the SYNC counter (2 to 240), or 0 to transmit
+        #: SYNC messages without a counter, as in object 0x1019
+        self.counter_overflow = 0
+        self._pdos: list[PdoMap] = []
+        #: Timing statistics of the current or last precise transmission
+        self.statistics: Optional[SyncStatistics] = None
+        self._task: Union[canopen.network.PeriodicMessageTask, _SyncThread, None] = None
+
+    def add_pdo(self, pdo_map: PdoMap) -> None:
+        """Transmit a PDO right after each periodic SYNC message.
+
+        This is meant for synchronous RPDOs of the nodes on the network,
+        which then take the current data of the PDO into effect on the
+        following SYNC.  The data is taken from :attr:`PdoMap.data
+        <canopen.pdo.PdoMap.data>` at the time of transmission, so use
+        :meth:`PdoMap.batch() <canopen.pdo.PdoMap.batch>` to update
+        several variables consistently.  Setting any PDOs enables
+        ``precise`` transmission.
+
+        :param pdo_map: PDO with its COB-ID configured.
+        :raises ValueError: If the PDO has no COB-ID.
+        """
+        if not pdo_map.cob_id:
+            raise ValueError(f"{pdo_map.name} has no COB-ID")
+        self._pdos.append(pdo_map)
+
+    def remove_pdo(self, pdo_map: PdoMap) -> None:
+        """Stop transmitting a PDO added with :meth:`add_pdo`."""
+        self._pdos.remove(pdo_map)
 
     def transmit(self, count: Optional[int] = None):
         """Send out a SYNC message once.
@@ -28,11 +202,38 @@ class SyncProducer:
         data = bytes([count]) if count is not None else b""
         self.network.send_message(self.cob_id, data)
 
-    def start(self, period: Optional[float] = None):
+    def _transmit_fused(self, count: Optional[int]) -> None:
+        data = bytes([count]) if count is not None else b""
+        frames = [(self.cob_id, data)]
+        for pdo_map in self._pdos:
+            if pdo_map.cob_id:
+                frames.append((pdo_map.cob_id, bytes(pdo_map.data)))
+        self.network.send_batch(frames)
+
+    def start(
+        self,
+        period: Optional[float] = None,
+        precise: bool = False,
+        busy_wait: float = 0.0,
+    ):
         """Start periodic transmission of SYNC message in a background thread.
 
+        By default the transmission is delegated to the CAN interface using
+        :meth:`canopen.Network.send_periodic`, which for many interfaces
+        falls back to a thread using plain sleeps.  With ``precise`` set, a
+        dedicated thread transmits at deadlines on a monotonic clock, so
+        delays do not accumulate, and records :attr:`statistics` about the
+        timing.  This is also used when a :attr:`counter_overflow` or PDOs
+        with :meth:`add_pdo` are set.
+
         :param period:
             Period of SYNC message in seconds.
+        :param precise:
+            Use the dedicated thread.
+        :param busy_wait:
+            Time in seconds before each deadline in which the dedicated
+            thread polls the clock instead of sleeping.  This reduces the
+            jitter at the cost of CPU time.
         :raises RuntimeError:
             If a periodic transmission is already started.
         :raises ValueError:
@@ -47,10 +248,57 @@ class SyncProducer:
         if not self.period:
             raise ValueError("A valid transmission period has not been given")
 
-        self._task = self.network.send_periodic(self.cob_id, b"", self.period)
+        if precise or busy_wait or self.counter_overflow or self._pdos:
+            thread = _SyncThread(self, self.period, busy_wait)
+            self.statistics = thread.statistics
+            self._task = thread
+        else:
+            self._task = self.network.send_periodic(self.cob_id, b"", self.period)
 
     def stop(self):
         """Stop periodic transmission of SYNC message."""
         if self._task is not None:
             self._task.stop()
         self._task = None
+
+
+class SyncConsumer:
+    """Receives SYNC messages and keeps count of them."""
+
+    #: COB-ID of the SYNC message
+    cob_id = 0x80
+
+    def __init__(self, network: canopen.network.Network):
+        self.network = network
+        #: Number of SYNC messages received since :meth:`start`
+        self.count = 0
+        #: Counter value of the last SYNC message, or None if it had no counter
+        self.counter: Optional[int] = None
+        #: Timestamp of the last SYNC message
+        self.timestamp: Optional[float] = None
+        self._callbacks: list[Callable[[Optional[int], float], None]] = []
+
+    def add_callback(self, callback: Callable[[Optional[int], float], None]) -> None:
+        """Add a function to be called on each SYNC message.
+
+        :param callback:
+            Function which takes the counter value (or None) and the timestamp.
+        """
+        self._callbacks.append(callback)
+
+    def start(self) -> None:
+        """Start listening for SYNC messages."""
+        self.count = 0
+        self.counter = None
+        self.network.subscribe(self.cob_id, self.on_sync)
+
+    def stop(self) -> None:
+        """Stop listening for SYNC messages."""
+        self.network.unsubscribe(self.cob_id, self.on_sync)
+
+    def on_sync(self, can_id: int, data: bytearray, timestamp: float) -> None:
+        self.count += 1
+        self.counter = data[0] if data else None
+        self.timestamp = timestamp
+        for callback in self._callbacks:
+            callback(self.counter, timestamp)
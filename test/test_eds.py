@@ -1,10 +1,22 @@
+import configparser
 import io
 import os
+import tempfile
 import unittest
+import unittest.mock
 from configparser import RawConfigParser
 
 import canopen
-from canopen.objectdictionary.eds import _signed_int_from_hex, build_variable
+from canopen.objectdictionary import cache as od_cache
+from canopen.objectdictionary.cache import ObjectDictionaryCache
+from canopen.objectdictionary.template import ObjectDictionaryTemplate
+from canopen.objectdictionary.eds import (
+    LazyObjectDictionary,
+    _signed_int_from_hex,
+    build_variable,
+    read_sections,
+    split_sections,
+)
 from canopen.utils import pretty_index
 
 from .util import DATATYPES_EDS, SAMPLE_EDS, tmp_file
@@ -190,6 +202,81 @@ class TestEDS(unittest.TestCase):
                     build_variable(eds, index, node_id=42, object_type=7, index=int(index, 16))
                 self.assertRegex(cm.output[0], option)
 
+    def test_read_sections_same_as_configparser(self):
+        for filename in SAMPLE_EDS, DATATYPES_EDS:
+            with self.subTest(filename=filename):
+                eds = RawConfigParser(inline_comment_prefixes=(';',))
+                eds.optionxform = str
+                eds.read(filename)
+                with open(filename) as fp:
+                    sections = read_sections(fp)
+                self.assertEqual(list(sections), eds.sections())
+                for section, options in sections.items():
+                    self.assertEqual(options, dict(eds.items(section)))
+
+    def test_read_sections_syntax(self):
+        sections = read_sections(io.StringIO(
+            "; Comment\n"
+            "[1000]\n"
+            "ParameterName = Device type ; inline comment\n"
+            "Description=a;b\n"
+            "Unit: mm\n"
+            "Multi=first\n"
+            "  second\n"
+            "\n"
+            "[1000sub1]\n"
+            "Empty=\n"
+        ))
+        self.assertEqual(sections, {
+            "1000": {
+                "ParameterName": "Device type",
+                "Description": "a;b",
+                "Unit": "mm",
+                "Multi": "first\nsecond",
+            },
+            "1000sub1": {"Empty": ""},
+        })
+
+    def test_read_sections_errors(self):
+        with self.assertRaises(configparser.MissingSectionHeaderError):
+            read_sections(io.StringIO("Key=1\n"))
+        with self.assertRaises(configparser.DuplicateSectionError):
+            read_sections(io.StringIO("[1000]\n[1000]\n"))
+        with self.assertRaises(configparser.DuplicateOptionError):
+            read_sections(io.StringIO("[1000]\nKey=1\nKey=2\n"))
+
+    def test_split_sections(self):
+        for filename in SAMPLE_EDS, DATATYPES_EDS:
+            with self.subTest(filename=filename):
+                with open(filename) as fp:
+                    text = fp.read()
+                expected = read_sections(text.splitlines())
+                texts = split_sections(text)
+                self.assertEqual(list(texts), list(expected))
+                for section, section_text in texts.items():
+                    self.assertEqual(read_sections(section_text.splitlines()),
+                                     {section: expected[section]})
+
+    def test_split_sections_syntax(self):
+        text = (
+            "; Comment\n"
+            "[1000] ; inline comment\n"
+            "Multi=first\n"
+            "  [second]\n"
+            "  [1001]\n"
+            "[1000sub1]\n"
+            "Empty=\n"
+        )
+        self.assertEqual(list(split_sections(text)), ["1000", "1000sub1"])
+        texts = split_sections("[1000] ; comment\nKey=1\n")
+        self.assertEqual(read_sections(texts["1000"].splitlines()), {"1000": {"Key": "1"}})
+        self.assertEqual(list(split_sections(text.replace("  [1001]", "[1001]"))),
+                         ["1000", "1001", "1000sub1"])
+        with self.assertRaises(configparser.MissingSectionHeaderError):
+            split_sections("Key=1\n[1000]\n")
+        with self.assertRaises(configparser.DuplicateSectionError):
+            split_sections("[1000]\n[1000]\n")
+
     def test_array_compact_subobj(self):
         array = self.od[0x1003]
         self.assertIsInstance(array, canopen.objectdictionary.ODArray)
@@ -484,5 +571,240 @@ class TestEDS(unittest.TestCase):
                 self.assertEqual(self.od.comments, exported_od.comments)
 
 
+class TestObjectDictionaryCache(unittest.TestCase):
+
+    def assertSameObjects(self, od, expected):
+        self.assertEqual(list(od.indices), list(expected.indices))
+        self.assertEqual(od.node_id, expected.node_id)
+        self.assertEqual(od.bitrate, expected.bitrate)
+        self.assertEqual(od.comments, expected.comments)
+        for index in expected:
+            obj, expected_obj = od[index], expected[index]
+            self.assertIs(type(obj), type(expected_obj))
+            if isinstance(obj, canopen.objectdictionary.ODVariable):
+                variables = [(obj, expected_obj)]
+            else:
+                self.assertEqual(obj.custom_options, expected_obj.custom_options)
+                variables = [(obj[i], expected_obj[i]) for i in expected_obj]
+            for var, expected_var in variables:
+                for attr in ("name", "subindex", "data_type", "access_type", "default",
+                             "value", "min", "max", "factor", "relative",
+                             "custom_options"):
+                    self.assertEqual(getattr(var, attr), getattr(expected_var, attr))
+
+    def test_memory_cache(self):
+        cache = ObjectDictionaryCache()
+        od1 = cache.import_od(SAMPLE_EDS, 1)
+        od2 = cache.import_od(SAMPLE_EDS, 2)
+        self.assertSameObjects(od1, canopen.import_od(SAMPLE_EDS, 1))
+        self.assertSameObjects(od2, canopen.import_od(SAMPLE_EDS, 2))
+        self.assertSameObjects(cache.import_od(SAMPLE_EDS), canopen.import_od(SAMPLE_EDS))
+        # Objects not depending on the node ID are shared
+        self.assertIs(od1[0x1018], od2[0x1018])
+        self.assertEqual(od1[0x1400][1].default, 0x200 + 1)
+        self.assertEqual(od2[0x1400][1].default, 0x200 + 2)
+        self.assertIs(od2[0x1400].parent, od2)
+        self.assertIs(od2[0x1400][1].parent, od2[0x1400])
+        # Not shared between object dictionaries
+        del od1[0x1018]
+        self.assertIn(0x1018, od2)
+
+    def test_same_lines_as_import_od(self):
+        with open(SAMPLE_EDS, "rb") as f:
+            data = f.read()
+        # Line breaks are only split like when reading the file directly
+        data = data.replace(b"test description", b"test\x0cdescription")
+        data = data.replace(b"\n", b"\r\n")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sample.eds")
+            with open(path, "wb") as f:
+                f.write(data)
+            od = ObjectDictionaryCache().import_od(path, 2)
+            expected = canopen.import_od(path, 2)
+        self.assertSameObjects(od, expected)
+        self.assertEqual(od[0x3050][1].description, "This is the a test\x0cdescription")
+        self.assertEqual(od[0x3050][1].description, expected[0x3050][1].description)
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            expected = ObjectDictionaryCache(directory).import_od(DATATYPES_EDS, 3)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            with unittest.mock.patch("canopen.objectdictionary.eds.import_sections") as parse:
+                od = ObjectDictionaryCache(directory).import_od(DATATYPES_EDS, 3)
+                parse.assert_not_called()
+            self.assertSameObjects(od, expected)
+            self.assertEqual(od.device_information.vendor_name,
+                             expected.device_information.vendor_name)
+
+    def test_disk_cache_invalid_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ObjectDictionaryCache(directory).import_od(DATATYPES_EDS)
+            path, = (os.path.join(directory, name) for name in os.listdir(directory))
+            with open(path, "w") as f:
+                f.write("{")
+            with self.assertLogs(level="WARNING"):
+                od = ObjectDictionaryCache(directory).import_od(DATATYPES_EDS)
+            self.assertSameObjects(od, canopen.import_od(DATATYPES_EDS))
+
+    def test_import_od_with_cache(self):
+        cache = ObjectDictionaryCache()
+        od1 = canopen.import_od(SAMPLE_EDS, 1, cache=cache)
+        od2 = canopen.import_od(SAMPLE_EDS, 2, cache=cache)
+        self.assertIs(od1[0x1000], od2[0x1000])
+        with unittest.mock.patch.object(od_cache, "default_cache", cache):
+            od3 = canopen.RemoteNode(3, SAMPLE_EDS).object_dictionary
+        self.assertIs(od1[0x1000], od3[0x1000])
+        self.assertEqual(od3[0x1400][1].default, 0x200 + 3)
+
+
+class TestObjectDictionaryTemplate(unittest.TestCase):
+
+    def setUp(self):
+        self.template = ObjectDictionaryTemplate.from_eds(SAMPLE_EDS)
+
+    def test_relative_values(self):
+        # Stored without the node ID
+        self.assertEqual(self.template.od[0x1400][1].default, 0x200)
+        self.assertIn(0x1400, self.template.relative)
+        self.assertNotIn(0x1018, self.template.relative)
+        od = self.template.for_node(3)
+        self.assertEqual(od[0x1400][1].default, 0x203)
+        self.assertEqual(od["Receive PDO 0 Communication Parameter.COB-ID use by RPDO 1"].default,
+                         0x203)
+        self.assertEqual(self.template.for_node()[0x1400][1].default, 0x200 + 0x10)
+        self.assertEqual(self.template.od[0x1400][1].default, 0x200)
+
+    def test_same_as_import(self):
+        for node_id in None, 5:
+            od = self.template.for_node(node_id)
+            expected = canopen.import_od(SAMPLE_EDS, node_id)
+            self.assertEqual(od.node_id, expected.node_id)
+            self.assertEqual(list(od), list(expected))
+            self.assertEqual(sorted(od.names), sorted(expected.names))
+            for index in expected:
+                obj, expected_obj = od[index], expected[index]
+                if isinstance(obj, canopen.objectdictionary.ODVariable):
+                    obj, expected_obj = {0: obj}, {0: expected_obj}
+                for subindex in expected_obj:
+                    self.assertEqual(obj[subindex].name, expected_obj[subindex].name)
+                    self.assertEqual(obj[subindex].default, expected_obj[subindex].default)
+                    self.assertEqual(obj[subindex].value, expected_obj[subindex].value)
+
+    def test_shared_objects(self):
+        od1 = self.template.for_node(1)
+        od2 = self.template.for_node(2)
+        self.assertIs(od1[0x1018], od2[0x1018])
+        self.assertIs(od1[0x1018], self.template.od[0x1018])
+        self.assertIsNot(od1[0x1400], od2[0x1400])
+        # Resolved once per node
+        self.assertIs(od1[0x1400], od1[0x1400])
+        self.assertIs(od1[0x1400].parent, od1)
+        self.assertIs(od1[0x1400][2], od2[0x1400][2])
+
+    def test_modify_node(self):
+        od1 = self.template.for_node(1)
+        od2 = self.template.for_node(2)
+        var = canopen.objectdictionary.ODVariable("Extra", 0x2FFF)
+        od1.add_object(var)
+        self.assertIs(od1["Extra"], var)
+        self.assertNotIn(0x2FFF, od2)
+        del od1[0x1018]
+        del od1[0x1400]
+        self.assertNotIn(0x1018, od1)
+        self.assertNotIn(0x1400, od1)
+        self.assertIn(0x1018, od2)
+        self.assertIn(0x1018, self.template.od)
+        self.assertEqual(len(od1), len(od2) - 1)
+        self.assertNotIn("Identity object", od1)
+        self.assertNotIn(0x1018, list(od1))
+        with self.assertRaises(KeyError):
+            od1[0x1018]
+        # Other objects are still shared with the template
+        self.assertIs(od1[0x1000], self.template.od[0x1000])
+        self.assertIs(od1.indices.maps[1], self.template.od.indices)
+        od1.add_object(self.template.od[0x1018])
+        self.assertIs(od1[0x1018], od2[0x1018])
+
+    def test_remote_node(self):
+        node = canopen.RemoteNode(7, self.template.for_node(7))
+        canopen.Network().add_node(node)
+        node.tpdo.read(from_od=True)
+        self.assertEqual(node.tpdo[1].cob_id, 0x180 + 7)
+
+
+class TestLazyObjectDictionary(unittest.TestCase):
+
+    def setUp(self):
+        self.od = canopen.import_od(SAMPLE_EDS, 3, lazy=True)
+
+    def test_same_as_import(self):
+        for filename in SAMPLE_EDS, DATATYPES_EDS:
+            with self.subTest(filename=filename):
+                od = canopen.import_od(filename, 2, lazy=True)
+                expected = canopen.import_od(filename, 2)
+                self.assertIsInstance(od, LazyObjectDictionary)
+                self.assertEqual(len(od), len(expected))
+                self.assertEqual(list(od), list(expected))
+                self.assertEqual(od.node_id, expected.node_id)
+                self.assertEqual(od.device_information.vendor_name,
+                                 expected.device_information.vendor_name)
+                for index in expected:
+                    obj, expected_obj = od[index], expected[index]
+                    self.assertIs(type(obj), type(expected_obj))
+                    self.assertIs(obj.parent, od)
+                    if isinstance(obj, canopen.objectdictionary.ODVariable):
+                        obj, expected_obj = {0: obj}, {0: expected_obj}
+                    self.assertEqual(list(obj), list(expected_obj))
+                    for subindex in expected_obj:
+                        var, expected_var = obj[subindex], expected_obj[subindex]
+                        for attr in ("name", "data_type", "access_type", "default",
+                                     "value", "min", "max", "factor", "custom_options"):
+                            self.assertEqual(getattr(var, attr), getattr(expected_var, attr))
+                self.assertEqual(sorted(od.names), sorted(expected.names))
+
+    def test_created_on_access(self):
+        self.assertNotIn(0x1018, self.od.indices)
+        record = self.od[0x1018]
+        self.assertIn(0x1018, self.od.indices)
+        self.assertIs(self.od[0x1018], record)
+        self.assertIs(self.od["Identity object"], record)
+        self.assertIs(self.od["Identity object.Vendor-ID"], record[1])
+        self.assertEqual(self.od[0x1400][1].default, 0x200 + 3)
+        self.assertNotIn(0x1001, self.od.indices)
+
+    def test_not_found(self):
+        self.assertNotIn(0x9999, self.od)
+        self.assertNotIn("Nonexistent", self.od)
+        with self.assertRaises(KeyError):
+            self.od[0x9999]
+        with self.assertRaises(KeyError):
+            self.od["Nonexistent"]
+        self.assertIn(0x1018, self.od)
+        self.assertIn("Identity object", self.od)
+
+    def test_modify(self):
+        length = len(self.od)
+        var = canopen.objectdictionary.ODVariable("Identity object", 0x1018)
+        self.od.add_object(var)
+        self.assertIs(self.od[0x1018], var)
+        self.assertIs(self.od["Identity object"], var)
+        self.assertEqual(len(self.od), length)
+        del self.od[0x1400]
+        self.assertNotIn(0x1400, self.od)
+        self.assertEqual(len(self.od), length - 1)
+
+    def test_remote_node(self):
+        node = canopen.RemoteNode(3, self.od)
+        canopen.Network().add_node(node)
+        node.tpdo.read(from_od=True)
+        self.assertEqual(node.tpdo[1].cob_id, 0x180 + 3)
+
+    def test_ignores_cache(self):
+        cache = ObjectDictionaryCache()
+        od = canopen.import_od(SAMPLE_EDS, 1, cache=cache, lazy=True)
+        self.assertIsInstance(od, LazyObjectDictionary)
+        self.assertEqual(cache._templates, {})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,11 @@
+import io
+import os
+import tempfile
 import time
 import unittest
+from unittest.mock import ANY, patch
+
+import can
 
 import canopen
 
@@ -94,6 +100,66 @@ class TestSDO(unittest.TestCase):
         value = self.local_node.sdo[0x2000].data
         self.assertEqual(value, b"Another cool device")
 
+    def test_download_file(self):
+        data = b"A firmware image spanning several segments"
+        progress = []
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "image.bin")
+            with open(path, "wb") as f:
+                f.write(data)
+            rate = self.remote_node.sdo.download_file(
+                0x2000, 0, path, block_transfer=False,
+                progress=lambda sent, size: progress.append((sent, size)),
+                chunk_size=16)
+        self.assertGreater(rate, 0)
+        self.assertEqual(self.local_node.sdo[0x2000].data, data)
+        self.assertEqual(progress[-1], (len(data), len(data)))
+        self.assertEqual(len(progress), 3)
+
+        # File objects are read from the current position
+        f = io.BytesIO(b"skipped" + data[:20])
+        f.seek(7)
+        self.remote_node.sdo.download_file(0x2000, 0, f, block_transfer=False)
+        self.assertEqual(self.local_node.sdo[0x2000].data, data[:20])
+
+        # Data after the given size is left in the file
+        f = io.BytesIO(data)
+        self.remote_node.sdo.download_file(0x2000, 0, f, block_transfer=False, size=10)
+        self.assertEqual(self.local_node.sdo[0x2000].data, data[:10])
+        self.assertEqual(f.tell(), 10)
+
+    def test_download_file_too_short(self):
+        self.local_node.sdo[0x2000].data = b"Old image"
+        f = io.BytesIO(b"A truncated image")
+        with self.assertRaises(ValueError):
+            self.remote_node.sdo.download_file(0x2000, 0, f, block_transfer=False, size=30)
+        # Transfer was aborted before the last segment
+        self.assertEqual(self.local_node.sdo[0x2000].data, b"Old image")
+
+    def test_upload_to(self):
+        data = b"A log buffer spanning several segments"
+        self.local_node.sdo[0x2000].data = data
+
+        buffer = bytearray(b"old contents")
+        progress = []
+        rate = self.remote_node.sdo.upload_to(
+            0x2000, 0, buffer,
+            progress=lambda received, size: progress.append((received, size)),
+            chunk_size=16)
+        self.assertGreater(rate, 0)
+        self.assertEqual(buffer, data)
+        self.assertEqual(progress[-1], (len(data), len(data)))
+
+        f = io.BytesIO()
+        self.remote_node.sdo.upload_to(0x2000, 0, f, chunk_size=10)
+        self.assertEqual(f.getvalue(), data)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "log.bin")
+            self.remote_node.sdo.upload_to(0x1017, 0, path)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), self.remote_node.sdo.upload(0x1017, 0))
+
     def test_slave_send_heartbeat(self):
         # Setting the heartbeat time should trigger heartbeating
         # to start
@@ -139,6 +205,86 @@ class TestSDO(unittest.TestCase):
         device_name = self.remote_node2.sdo["Manufacturer device name"].data
         self.assertEqual(device_name, b"Some cool device2")
 
+    def test_sdo_read_many(self):
+        self.local_node.sdo[0x1017].raw = 200
+        self.local_node2.sdo[0x1017].raw = 300
+        results = self.network1.sdo_read_many(0x1017)
+        self.assertEqual(results, {2: b"\xc8\x00", 3: b"\x2c\x01"})
+
+        self.local_node.sdo["Manufacturer device name"].raw = "Segmented name 2"
+        self.local_node2.sdo["Manufacturer device name"].raw = "Segmented name 3"
+        results = self.network1.sdo_read_many(0x1008, node_ids=[3, 2])
+        self.assertEqual(list(results), [3, 2])
+        self.assertEqual(results[2], b"Segmented name 2")
+        self.assertEqual(results[3], b"Segmented name 3")
+
+        results = self.network1.sdo_read_many(0x1018, 100)
+        for node_id in (2, 3):
+            with self.subTest(node_id=node_id):
+                self.assertIsInstance(results[node_id], canopen.SdoAbortedError)
+                self.assertEqual(results[node_id].code, 0x06090011)
+
+    def test_sdo_write_many(self):
+        results = self.network1.sdo_write_many(0x1017, 0, b"\x10\x00")
+        self.assertEqual(results, {2: None, 3: None})
+        self.assertEqual(self.local_node.sdo[0x1017].raw, 16)
+        self.assertEqual(self.local_node2.sdo[0x1017].raw, 16)
+
+        results = self.network1.sdo_write_many(
+            0x2000, 0, {2: b"Segmented value 2", 3: b"Segmented value 3"})
+        self.assertEqual(results, {2: None, 3: None})
+        self.assertEqual(self.local_node.sdo[0x2000].raw, "Segmented value 2")
+        self.assertEqual(self.local_node2.sdo[0x2000].raw, "Segmented value 3")
+
+        results = self.network1.sdo_write_many(0x1000, 0, b"\x00\x00\x00\x00", [2])
+        self.assertEqual(list(results), [2])
+        self.assertEqual(results[2].code, 0x06010002)
+
+    def test_upload_many(self):
+        self.local_node.sdo[0x1017].raw = 200
+        self.local_node.sdo["Manufacturer device name"].raw = "Segmented name"
+        objects = [(0x1017, 0), (0x1008, 0), (0x1400, 1)]
+        results = self.remote_node.sdo.upload_many(objects)
+        expected = [self.remote_node.sdo.upload(*obj) for obj in objects]
+        self.assertEqual(results, expected)
+        self.assertEqual(results[:2], [b"\xc8\x00", b"Segmented name"])
+
+        with self.assertRaises(canopen.SdoAbortedError) as cm:
+            self.remote_node.sdo.upload_many([(0x1017, 0), (0x1234, 0)])
+        self.assertEqual(cm.exception.code, 0x06020000)
+
+    def test_upload_many_channels(self):
+        # Use the server of another node as a second SDO channel
+        channel = self.remote_node.add_sdo(0x603, 0x583)
+        self.addCleanup(self.remote_node.sdo_channels.remove, channel)
+        self.addCleanup(self.network1.unsubscribe, 0x583, channel.on_response)
+        self.local_node.sdo[0x1017].raw = 200
+        self.local_node2.sdo[0x1017].raw = 300
+
+        results = self.remote_node.sdo.upload_many(
+            [(0x1017, 0)] * 5, channels=self.remote_node.sdo_channels)
+        self.assertEqual(results, [b"\xc8\x00", b"\x2c\x01"] * 2 + [b"\xc8\x00"])
+
+        # The other channel completes its transfer when one of them fails
+        self.local_node2.sdo["Manufacturer device name"].raw = "Segmented name"
+        with self.assertRaises(canopen.SdoAbortedError) as cm:
+            self.remote_node.sdo.upload_many(
+                [(0x1234, 0), (0x1008, 0)], channels=self.remote_node.sdo_channels)
+        self.assertEqual(cm.exception.code, 0x06020000)
+        self.assertTrue(channel.responses.empty())
+        self.assertEqual(channel.upload(0x1017, 0), b"\x2c\x01")
+
+        # Also when sending fails on one of the channels
+        with patch.object(self.remote_node.sdo, "_end_upload",
+                          side_effect=can.CanError("Send failed")), \
+                patch.object(channel, "_end_upload", wraps=channel._end_upload) as end:
+            with self.assertRaises(can.CanError):
+                self.remote_node.sdo.upload_many(
+                    [(0x1017, 0), (0x1008, 0)], channels=self.remote_node.sdo_channels)
+        end.assert_called_once_with(0x1008, 0, ANY)
+        self.assertTrue(channel.responses.empty())
+        self.assertEqual(channel.upload(0x1017, 0), b"\x2c\x01")
+
     def test_abort(self):
         with self.assertRaises(canopen.SdoAbortedError) as cm:
             _ = self.remote_node.sdo.upload(0x1234, 0)
@@ -177,6 +323,28 @@ class TestSDO(unittest.TestCase):
         self.assertEqual(self._kwargs["subindex"], 0)
         self.assertEqual(self._kwargs["data"], b"\x03\x04")
 
+    def test_store_callbacks(self):
+        stored = []
+
+        def on_store(index, subindex, od, data):
+            stored.append((index, subindex, self.local_node.data_store[index][subindex]))
+
+        def reject(index, subindex, od, data):
+            raise canopen.SdoAbortedError(0x06090030)
+
+        self.local_node.add_store_callback(on_store)
+        self.addCleanup(self.local_node.remove_store_callback, on_store)
+        self.remote_node.sdo.download(0x2001, 0, b"\x05\x06")
+        # Called after the data is stored
+        self.assertEqual(stored, [(0x2001, 0, b"\x05\x06")])
+
+        self.local_node.add_write_callback(reject)
+        with self.assertRaises(canopen.SdoAbortedError):
+            self.remote_node.sdo.download(0x2001, 0, b"\x07\x08")
+        self.local_node.remove_write_callback(reject)
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(self.local_node.sdo[0x2001].raw, 0x0605)
+
 
 class TestPDO(unittest.TestCase):
     """
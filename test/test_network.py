@@ -1,4 +1,5 @@
 import logging
+import threading
 import time
 import unittest
 
@@ -119,6 +120,42 @@ class TestNetwork(unittest.TestCase):
         self.assertEqual(msg.arbitration_id, 0x12345)
         self.assertTrue(msg.is_extended_id)
 
+    def test_network_send_messages(self):
+        bus = can.interface.Bus(interface="virtual")
+        self.addCleanup(bus.shutdown)
+
+        self.network.connect(interface="virtual")
+        self.addCleanup(self.network.disconnect)
+
+        self.network.send_messages(0x602, [b"\x01", b"\x02", b"\x83"])
+        for data in (b"\x01", b"\x02", b"\x83"):
+            msg = bus.recv(1)
+            self.assertIsNotNone(msg)
+            self.assertEqual(msg.arbitration_id, 0x602)
+            self.assertEqual(msg.data, data)
+
+    def test_network_send_messages_overridden(self):
+        sent = []
+        self.network.send_message = lambda can_id, data: sent.append((can_id, data))
+        self.network.send_messages(0x602, [b"\x01", b"\x82"])
+        self.assertEqual(sent, [(0x602, b"\x01"), (0x602, b"\x82")])
+
+    def test_network_send_batch(self):
+        bus = can.interface.Bus(interface="virtual")
+        self.addCleanup(bus.shutdown)
+
+        self.network.connect(interface="virtual")
+        self.addCleanup(self.network.disconnect)
+
+        frames = [(0x181, b"\x01"), (0x281, b"\x02\x03"), (0x1FFFFFFF, b"")]
+        self.network.send_batch(frames)
+        for can_id, data in frames:
+            msg = bus.recv(1)
+            self.assertIsNotNone(msg)
+            self.assertEqual(msg.arbitration_id, can_id)
+            self.assertEqual(msg.is_extended_id, can_id > 0x7FF)
+            self.assertEqual(msg.data, data)
+
     def test_network_subscribe_unsubscribe(self):
         N_HOOKS = 3
         accumulators = [] * N_HOOKS
@@ -202,6 +239,144 @@ class TestNetwork(unittest.TestCase):
         self.assertEqual(accumulators[1], BATCH1)
         self.assertEqual(accumulators[2], BATCH1 + [BATCH2] + [BATCH3])
 
+    def test_network_subscribe_extended_id(self):
+        acc = []
+        def hook(*args):
+            acc.append(args)
+        self.network.subscribe(0x12345, hook)
+        self.network.notify(0x12345, bytes([1, 2]), 3000)
+        self.network.notify(0x345, bytes([3, 4]), 3001)
+        self.assertEqual(acc, [(0x12345, bytes([1, 2]), 3000)])
+
+        self.network.unsubscribe(0x12345, hook)
+        self.network.notify(0x12345, bytes([5, 6]), 3002)
+        self.assertEqual(len(acc), 1)
+        self.assertNotIn(0x12345, self.network.subscribers)
+
+    def test_network_notify_many(self):
+        single = []
+        batches = []
+        self.network.subscribe(0x20, lambda *args: single.append(args))
+        self.network.subscribe_batch(0x20, lambda *args: batches.append(args))
+        self.network.subscribe_batch(0x21, lambda *args: batches.append(args))
+
+        self.network.notify_many([
+            (0x20, bytes([1]), 1000),
+            (0x21, bytes([2]), 1001),
+            (0x20, bytes([3]), 1002),
+            (0x702, bytes([5]), 1003),
+        ])
+        self.assertEqual(single, [
+            (0x20, bytes([1]), 1000),
+            (0x20, bytes([3]), 1002),
+        ])
+        # Runs are only formed by consecutive messages
+        self.assertEqual(batches, [
+            (0x20, [(bytes([1]), 1000)]),
+            (0x21, [(bytes([2]), 1001)]),
+            (0x20, [(bytes([3]), 1002)]),
+        ])
+        self.assertListEqual(self.network.scanner.nodes, [2])
+
+        batches.clear()
+        self.network.notify_many([
+            (0x20, bytes([6]), 1006),
+            (0x20, bytes([7]), 1007),
+            (0x21, bytes([8]), 1008),
+        ])
+        self.assertEqual(batches, [
+            (0x20, [(bytes([6]), 1006), (bytes([7]), 1007)]),
+            (0x21, [(bytes([8]), 1008)]),
+        ])
+
+        # Batch subscribers also receive single notifications.
+        batches.clear()
+        self.network.notify(0x21, bytes([4]), 1004)
+        self.assertEqual(batches, [(0x21, [(bytes([4]), 1004)])])
+
+        # Unsubscribing all callbacks includes batch callbacks.
+        batches.clear()
+        self.network.unsubscribe(0x21)
+        self.network.notify(0x21, bytes([5]), 1005)
+        self.network.notify_many([(0x21, bytes([6]), 1006)])
+        self.assertEqual(batches, [])
+
+    def test_network_notify_many_order(self):
+        received = []
+        self.network.subscribe(0x80, lambda can_id, *args: received.append(can_id))
+        self.network.subscribe(0x201, lambda can_id, *args: received.append(can_id))
+        self.network.subscribe_batch(
+            0x181, lambda can_id, run: received.append((can_id, len(run))))
+        self.network.notify_many([
+            (0x201, bytes([1]), 1000),
+            (0x80, bytes(), 1001),
+            (0x181, bytes([2]), 1002),
+            (0x181, bytes([3]), 1003),
+            (0x201, bytes([4]), 1004),
+            (0x80, bytes(), 1005),
+        ])
+        # Messages with different CAN IDs keep the order of reception
+        self.assertEqual(received, [0x201, 0x80, (0x181, 2), 0x201, 0x80])
+
+    def test_network_notify_many_callback_error(self):
+        received = []
+        batches = []
+
+        def failing(can_id, data, timestamp):
+            if data == bytes([1]):
+                raise ValueError("Bad data")
+            received.append(data)
+
+        def failing_batch(can_id, group):
+            raise ValueError("Bad batch")
+
+        self.network.subscribe(0x20, failing)
+        self.network.subscribe_batch(0x20, failing_batch)
+        self.network.subscribe_batch(0x20, lambda *args: batches.append(args))
+        self.network.subscribe_batch(0x21, lambda *args: batches.append(args))
+        with self.assertLogs("canopen.network", "ERROR") as logs:
+            self.network.notify_many([
+                (0x20, bytes([1]), 1000),
+                (0x20, bytes([2]), 1001),
+                (0x21, bytes([3]), 1002),
+            ])
+        self.assertEqual(len(logs.output), 2)
+        # The rest of the batch is still dispatched
+        self.assertEqual(received, [bytes([2])])
+        self.assertEqual(batches, [
+            (0x20, [(bytes([1]), 1000), (bytes([2]), 1001)]),
+            (0x21, [(bytes([3]), 1002)]),
+        ])
+
+    def test_network_batch_notifier(self):
+        self.network.NOTIFIER_BATCH_SIZE = 16
+        bus = can.Bus(interface="virtual")
+        self.addCleanup(bus.shutdown)
+        self.network.connect(interface="virtual")
+        self.addCleanup(self.network.disconnect)
+        self.assertIsInstance(self.network.notifier, canopen.network.BatchNotifier)
+
+        received = threading.Event()
+        batches = []
+        def hook(can_id, frames):
+            batches.extend(frames)
+            if len(batches) == 3:
+                received.set()
+        self.network.subscribe_batch(0x123, hook)
+        for i in range(3):
+            bus.send(can.Message(arbitration_id=0x123, data=[i], is_extended_id=False))
+        self.assertTrue(received.wait(1))
+        self.assertEqual([bytes(data) for data, _ in batches], [b"\x00", b"\x01", b"\x02"])
+
+    def test_network_notify_scanner_disabled(self):
+        self.network.scanner.enabled = False
+        self.network.notify(0x702, b'\x05', 1473418396.0)
+        self.assertListEqual(self.network.scanner.nodes, [])
+        self.network.scanner.enabled = True
+        self.network.notify(0x702, b'\x05', 1473418396.0)
+        self.network.notify(0x582, b'\x05', 1473418396.0)
+        self.assertListEqual(self.network.scanner.nodes, [2])
+
     def test_network_context_manager(self):
         with self.network.connect(interface="virtual"):
             pass
@@ -286,6 +461,90 @@ class TestNetwork(unittest.TestCase):
         if msg is not None:
             self.assertIsNone(bus.recv(PERIOD))
 
+    def test_network_send_periodic_shared(self):
+        PERIOD = 0.01
+        TIMEOUT = PERIOD * 10
+        self.network.PERIODIC_BACKEND = "shared"
+        self.network.connect(interface="virtual")
+        self.addCleanup(self.network.disconnect)
+
+        bus = can.Bus(interface="virtual")
+        self.addCleanup(bus.shutdown)
+
+        threads = set(threading.enumerate())
+        task1 = self.network.send_periodic(0x123, b"\x01", PERIOD)
+        task2 = self.network.send_periodic(0x124, b"\x02", PERIOD * 2)
+        task3 = self.network.send_periodic(0x125, b"\x03", PERIOD)
+        # All tasks share the network scheduler thread
+        new_threads = set(threading.enumerate()) - threads
+        self.assertEqual(new_threads, {self.network.scheduler._thread})
+
+        def receive(count):
+            msgs = []
+            for _ in range(count):
+                msg = bus.recv(TIMEOUT)
+                self.assertIsNotNone(msg)
+                msgs.append(msg)
+            return msgs
+
+        # Messages with aligned deadlines are transmitted together
+        groups = []
+        for msg in receive(15):
+            if not groups or msg.timestamp - groups[-1][0] > PERIOD / 2:
+                groups.append((msg.timestamp, set()))
+            groups[-1][1].add(msg.arbitration_id)
+        # Skip groups which may be incomplete
+        sets = [ids for _, ids in groups[1:-1]]
+        self.assertGreaterEqual(len(sets), 3)
+        for ids in sets:
+            self.assertIn(ids, ({0x123, 0x125}, {0x123, 0x124, 0x125}))
+        self.assertNotEqual(sets[0], sets[1])
+        deltas = [b[0] - a[0] for a, b in zip(groups, groups[1:])]
+        self.assertAlmostEqual(sum(deltas) / len(deltas), PERIOD, delta=PERIOD / 2)
+
+        task1.update(b"\x04")
+        task2.stop()
+        data = {}
+        for msg in receive(6):
+            data.setdefault(msg.arbitration_id, []).append(bytes(msg.data))
+        self.assertEqual(sorted(data), [0x123, 0x125])
+        self.assertEqual(data[0x123][-1], b"\x04")
+
+        task1.stop()
+        task3.stop()
+        msg = bus.recv(PERIOD)
+        if msg is not None:
+            self.assertIsNone(bus.recv(PERIOD * 2))
+
+    def test_network_send_periodic_shared_restart(self):
+        PERIOD = 0.02
+        self.network.PERIODIC_BACKEND = "shared"
+        self.network.connect(interface="virtual")
+        self.addCleanup(self.network.disconnect)
+
+        bus = can.Bus(interface="virtual")
+        self.addCleanup(bus.shutdown)
+
+        task = self.network.send_periodic(0x123, b"\x01", PERIOD)
+        # Removed and added again before the first transmission
+        scheduler = self.network.periodic_scheduler
+        scheduler.remove(task)
+        scheduler.add(task)
+        time.sleep(PERIOD * 5)
+        # The entry from before was dropped instead of transmitted as well
+        self.assertEqual(len(scheduler._queue), 1)
+        task.stop()
+        count = 0
+        while bus.recv(PERIOD * 2) is not None:
+            count += 1
+        self.assertGreater(count, 0)
+        self.assertLessEqual(count, 6)
+
+    def test_network_send_periodic_unknown_backend(self):
+        self.network.PERIODIC_BACKEND = "unknown"
+        with self.assertRaises(ValueError):
+            self.network.send_periodic(0x123, b"", 0.01)
+
     def test_network_connect_does_not_recreate_notifier(self):
         self.network.connect(interface="virtual")
         self.addCleanup(self.network.disconnect)
@@ -345,6 +604,9 @@ class TestScanner(unittest.TestCase):
         self.scanner.nodes = [1, 2, 3]  # Mock scan.
         self.scanner.reset()
         self.assertListEqual(self.scanner.nodes, [])
+        # Previously found nodes must be detected again after reset.
+        self.scanner.on_message_received(0x701)
+        self.assertListEqual(self.scanner.nodes, [1])
 
     def test_scanner_search_no_network(self):
         with self.assertRaisesRegex(RuntimeError, "No actual Network object was assigned"):
@@ -1,3 +1,4 @@
+import copy
 import unittest
 
 from canopen import objectdictionary as od
@@ -351,6 +352,50 @@ class TestArray(unittest.TestCase):
         self.assertEqual(array[3].name, "Test Variable_3")
 
 
+class TestCompactVariable(unittest.TestCase):
+
+    def test_mappings_created_on_use(self):
+        var = od.ODVariable("Test Variable", 0x1000)
+        var.data_type = od.UNSIGNED8
+        with self.assertRaises(od.ObjectDictionaryError):
+            var.decode_desc(1)
+        self.assertIsNone(var._value_descriptions)
+        var.add_value_description(1, "One")
+        var.add_bit_definition("BIT 0", [0])
+        var.custom_options["Category"] = "Test"
+        self.assertEqual(var.decode_desc(1), "One")
+        self.assertEqual(var.bit_definitions, {"BIT 0": [0]})
+        self.assertEqual(var.custom_options, {"Category": "Test"})
+        # Other variables are not affected
+        other = od.ODVariable("Other Variable", 0x1001)
+        self.assertEqual(other.value_descriptions, {})
+        self.assertEqual(other.bit_definitions, {})
+        self.assertEqual(other.custom_options, {})
+
+    def test_array_members_share_template_mappings(self):
+        array = od.ODArray("Test Array", 0x1000)
+        template = od.ODVariable("Test Variable", 0x1000, 1)
+        template.add_value_description(0, "Off")
+        array.add_member(template)
+        self.assertIs(array[2].value_descriptions, template.value_descriptions)
+        self.assertIsNone(array[2]._custom_options)
+
+    def test_copy(self):
+        var = od.ODVariable("Test Variable", 0x1000)
+        var.default_raw = "$NODEID+0x180"
+        var.add_value_description(1, "One")
+        copied = copy.copy(var)
+        self.assertEqual(copied.name, "Test Variable")
+        self.assertEqual(copied.default_raw, "$NODEID+0x180")
+        self.assertEqual(copied.value_descriptions, {1: "One"})
+
+    def test_extra_attributes(self):
+        var = od.ODVariable("Test Variable", 0x1000)
+        self.assertIsNone(var.value_raw)
+        var.application_data = 42
+        self.assertEqual(var.application_data, 42)
+
+
 class TestEquality(unittest.TestCase):
 
     def test_record_eq_wrong_type(self):
@@ -1,8 +1,9 @@
 import unittest
 from unittest.mock import MagicMock
 
-from canopen.objectdictionary import ODVariable, ObjectDictionary
-from canopen.objectdictionary.datatypes import INTEGER8, UNSIGNED16, UNSIGNED32
+from canopen.objectdictionary import ODRecord, ODVariable, ObjectDictionary
+from canopen.objectdictionary.datatypes import INTEGER8, UNSIGNED8, UNSIGNED16, UNSIGNED32
+from canopen.pdo.base import PdoCodec, PdoSnapshot, PdoVariable
 from canopen.profiles.p402 import BaseNode402, OperationMode, State402
 
 
@@ -39,10 +40,11 @@ def _make_od():
 
 def _inject_tpdo(node, index, value):
     """Simulate TPDO reception for a single OD object."""
-    fake_obj = MagicMock(index=index, raw=value)
-    fake_map = MagicMock()
-    fake_map.__iter__ = lambda s: iter([fake_obj])
-    node.on_TPDOs_update_callback(fake_map)
+    var = PdoVariable(node.object_dictionary[index])
+    var.offset = 0
+    codec = PdoCodec([var], len(var.od) // 8)
+    snapshot = PdoSnapshot(codec, var.od.encode_raw(value), 0.0)
+    node.on_TPDOs_update_callback(MagicMock(snapshot=snapshot))
 
 
 class _FakeRpdoVar:
@@ -165,6 +167,54 @@ class TestBaseNode402State(unittest.TestCase):
         self._inject_statusword(0x0040)  # SWITCH ON DISABLED
         self.assertFalse(self.node.is_faulted())
 
+    def test_tpdo_values_decoded_on_lookup(self):
+        self._inject_statusword(0x0027)
+        self.assertIsInstance(self.node.tpdo_values._values[0x6041].snapshot, PdoSnapshot)
+        self.assertEqual(self.node.tpdo_values[0x6041], 0x0027)
+        self.assertEqual(self.node.tpdo_values.get(0x6041), 0x0027)
+        self.assertEqual(list(self.node.tpdo_values.items()), [(0x6041, 0x0027)])
+        self.node.tpdo_values[0x6041] = 0x0040
+        self.assertEqual(self.node.statusword, 0x0040)
+
+    def test_tpdo_values_last_subindex_wins(self):
+        # Two sub-indices of the same object mapped into one TPDO
+        od = self.node.object_dictionary
+        record = ODRecord("Record", 0x2100)
+        for subindex in (1, 2):
+            var = ODVariable(f"Sub{subindex}", 0x2100, subindex)
+            var.data_type = UNSIGNED8
+            record.add_member(var)
+        od.add_object(record)
+        variables = []
+        for offset, subindex in ((0, 1), (8, 2)):
+            var = PdoVariable(record[subindex])
+            var.offset = offset
+            variables.append(var)
+        snapshot = PdoSnapshot(PdoCodec(variables, 2), b"\x01\x02", 0.0)
+        self.node.on_TPDOs_update_callback(MagicMock(snapshot=snapshot))
+        self.assertEqual(self.node.tpdo_values[0x2100], 2)
+        # The snapshot itself finds the first one, like PdoMap
+        self.assertEqual(snapshot[0x2100], 1)
+
+    def test_tpdo_values_without_snapshot(self):
+        var = MagicMock(index=0x6041, raw=0x0027)
+        self.node.on_TPDOs_update_callback(MagicMock(snapshot=None, __iter__=lambda _: iter([var])))
+        self.assertEqual(self.node.tpdo_values[0x6041], 0x0027)
+
+    def test_tpdo_values_copies_are_decoded(self):
+        self._inject_statusword(0x0027)
+        values = self.node.tpdo_values
+        self.assertEqual(dict(values), {0x6041: 0x0027})
+        self.assertEqual({**values}, {0x6041: 0x0027})
+        self.assertEqual(values, {0x6041: 0x0027})
+        self.assertNotEqual(values, {0x6041: 0x0040})
+        copy = values.copy()
+        self.assertEqual(copy, {0x6041: 0x0027})
+        # The copy is not changed by later updates
+        self._inject_statusword(0x0040)
+        self.assertEqual(copy[0x6041], 0x0027)
+        self.assertEqual(values[0x6041], 0x0040)
+
     def test_controlword_read_raises(self):
         with self.assertRaises(RuntimeError):
             _ = self.node.controlword
@@ -1,4 +1,8 @@
+import time
 import unittest
+from unittest.mock import MagicMock
+
+import can
 
 import canopen
 
@@ -39,6 +43,189 @@ class TestPDO(unittest.TestCase):
         self.assertEqual(pdo['BOOLEAN value'].raw, False)
         self.assertEqual(pdo['BOOLEAN value 2'].raw, True)
 
+    def test_pdo_map_decode(self):
+        values = self.pdo.decode()
+        self.assertEqual(values, {
+            'INTEGER16 value': -3,
+            'UNSIGNED8 value': 0xf,
+            'INTEGER8 value': -2,
+            'INTEGER32 value': 0x01020304,
+            'BOOLEAN value': False,
+            'BOOLEAN value 2': True,
+        })
+        self.assertIs(values['BOOLEAN value 2'], True)
+        for name, value in values.items():
+            self.assertEqual(self.pdo[name].raw, value)
+        values = self.pdo.decode(b'\x00\x80\x08\xff\xff\xff\xff\x01')
+        self.assertEqual(values['INTEGER16 value'], -0x8000)
+        self.assertEqual(values['UNSIGNED8 value'], 0x8)
+        self.assertEqual(values['INTEGER8 value'], 0)
+        self.assertEqual(values['INTEGER32 value'], -1)
+        self.assertIs(values['BOOLEAN value'], True)
+
+    def test_pdo_map_encode(self):
+        pdo = self.pdo
+        data = bytes(pdo.data)
+        pdo.data[:] = bytes(len(pdo.data))
+        pdo.encode([-3, 0xf, -2, 0x01020304, False, True])
+        self.assertEqual(pdo.data, data)
+        pdo.encode({'INTEGER8 value': -8, 'BOOLEAN value': True})
+        self.assertEqual(pdo['INTEGER8 value'].raw, -8)
+        self.assertEqual(pdo['BOOLEAN value'].raw, True)
+        self.assertEqual(pdo['UNSIGNED8 value'].raw, 0xf)
+        self.assertEqual(pdo['INTEGER32 value'].raw, 0x01020304)
+
+    def test_pdo_map_minimum_signed(self):
+        # The sign bit alone, 1 << (length - 1), is the most negative value
+        pdo = self.pdo
+        pdo['INTEGER8 value'].raw = -8
+        self.assertEqual(pdo['INTEGER8 value'].raw, -8)
+        self.assertEqual(pdo.decode()['INTEGER8 value'], -8)
+        pdo['INTEGER8 value'].raw = 7
+        self.assertEqual(pdo['INTEGER8 value'].raw, 7)
+
+    def test_pdo_map_codec_invalidated(self):
+        pdo = self.pdo
+        self.assertEqual(len(pdo.decode()), 6)
+        pdo.clear()
+        pdo.add_variable('INTEGER16 value')
+        pdo['INTEGER16 value'].raw = 0x1234
+        self.assertEqual(pdo.decode(), {'INTEGER16 value': 0x1234})
+
+    def test_pdo_codec_unmapped_variable(self):
+        var = canopen.pdo.PdoVariable(self.node.object_dictionary['INTEGER16 value'])
+        with self.assertRaises(ValueError):
+            canopen.pdo.base.PdoCodec([var], 2)
+
+    def test_pdo_map_snapshot(self):
+        pdo = self.pdo
+        pdo.cob_id = 0x181
+        received = []
+        pdo.add_callback(lambda m: received.append(m.snapshot))
+        data = bytearray(b'\x00\x80\x08\xff\xff\xff\xff\x01')
+        pdo.on_message(0x181, data, 12.5)
+        snapshot = received[0]
+        self.assertIs(pdo.snapshot, snapshot)
+        self.assertEqual(snapshot.timestamp, 12.5)
+        data[:] = bytes(8)  # Snapshot keeps its own copy
+        self.assertEqual(snapshot['INTEGER16 value'], -0x8000)
+        self.assertEqual(snapshot[0x2002], 0x8)
+        self.assertEqual(snapshot['INTEGER32 value'], -1)
+        self.assertIs(snapshot['BOOLEAN value'], True)
+        self.assertEqual(dict(snapshot), pdo.decode(snapshot.data))
+        self.assertIn(0x2004, snapshot)
+        self.assertNotIn('DOES NOT EXIST', snapshot)
+        self.assertRaises(KeyError, lambda: snapshot['DOES NOT EXIST'])
+
+    def test_pdo_recorder(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise unittest.SkipTest("The PDO recorder API requires numpy")
+
+        pdo = self.pdo
+        pdo.cob_id = 0x181
+        recorder = canopen.pdo.PdoRecorder([pdo], capacity=3)
+        with recorder:
+            for i in range(5):
+                pdo.on_message(0x181, bytearray([i, 0, 0x8f, i, 0, 0, 0x80, 1]), i * 0.1)
+        pdo.on_message(0x181, bytearray(8), 1.0)  # Not recorded
+        self.assertEqual(recorder.count(pdo), 3)
+        self.assertNotIn(recorder.on_pdo, pdo.callbacks)
+
+        columns = recorder.columns(pdo)
+        np.testing.assert_allclose(columns['timestamp'], [0.2, 0.3, 0.4])
+        self.assertEqual(columns['INTEGER16 value'].tolist(), [2, 3, 4])
+        self.assertEqual(columns['UNSIGNED8 value'].tolist(), [0xf] * 3)
+        self.assertEqual(columns['INTEGER8 value'].tolist(), [-8] * 3)
+        self.assertEqual(columns['INTEGER32 value'].tolist(), [-0x80000000 + i for i in (2, 3, 4)])
+        self.assertEqual(columns['BOOLEAN value'].tolist(), [True] * 3)
+        self.assertEqual(columns['BOOLEAN value 2'].tolist(), [False] * 3)
+        frames, _ = recorder.frames(pdo)
+        for i, row in enumerate(frames):
+            for name, value in pdo.decode(row.tobytes()).items():
+                self.assertEqual(columns[name][i], value)
+
+        with tmp_file(suffix=".npz") as tmp:
+            recorder.save_npz(tmp.name)
+            with np.load(tmp.name) as npz:
+                self.assertEqual(npz['TxPDO1_node1/INTEGER16 value'].tolist(), [2, 3, 4])
+
+        recorder.clear()
+        self.assertEqual(recorder.count(pdo), 0)
+        self.assertEqual(len(recorder.columns(pdo)['timestamp']), 0)
+
+    def test_pdo_log_decoder(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise unittest.SkipTest("The PDO log decoder API requires numpy")
+        from canopen.pdo.logdecoder import PdoLogDecoder
+
+        od = canopen.import_od(SAMPLE_EDS, 2)
+        # Configure TPDO1 like a DCF would
+        od[0x1800][1].value = 0x182
+        od[0x1A00][0].value = 2
+        od[0x1A00][1].value = 0x20010010  # INTEGER16 value
+        od[0x1A00][2].value = 0x30500120  # FactorAndDescription
+        self.pdo.cob_id = 0x181
+        decoder = PdoLogDecoder([self.pdo])
+        node = decoder.add_node(2, od)
+        self.assertIs(decoder.pdo_maps[0x182], node.tpdo[1])
+
+        with tmp_file(suffix=".log") as tmp:
+            with open(tmp.name, "w") as f:
+                for i in range(5):
+                    f.write(f"({i}.000000) can0 182#{i:02X}00{i * 10:02X}000080\n")
+                    f.write(f"({i}.500000) can0 701#05\n")
+                f.write("(6.000000) can0 181#FDFFEF0403020102\n")
+            results = decoder.decode(tmp.name, phys=True, chunk_size=2)
+
+        columns = results["TxPDO1_node2"]
+        self.assertEqual(columns["timestamp"].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(columns["INTEGER16 value"].tolist(), [0, 1, 2, 3, 4])
+        np.testing.assert_allclose(
+            columns["EDS file extensions.FactorAndDescription"],
+            [(-0x80000000 + i * 10) * 0.1 for i in range(5)])
+        columns = results["TxPDO1_node1"]
+        self.assertEqual(columns["timestamp"].tolist(), [6.0])
+        self.assertEqual({name: values[0] for name, values in columns.items()
+                          if name != "timestamp"}, self.pdo.decode())
+
+    def test_pdo_map_batch(self):
+        pdo = self.pdo
+        pdo.cob_id = 0x181
+        network = pdo.pdo_node.network = MagicMock()
+        with pdo.batch(transmit=True) as batch:
+            self.assertIs(batch, pdo)
+            pdo['INTEGER16 value'].raw = 1
+            pdo['INTEGER32 value'].raw = 2
+            with pdo.batch(transmit=True):
+                pdo['BOOLEAN value'].raw = True
+            network.send_message.assert_not_called()
+        network.send_message.assert_called_once_with(0x181, pdo.data)
+        self.assertEqual(pdo.data, b'\x01\x00\xef\x02\x00\x00\x00\x03')
+
+        # Periodic transmission is updated once without transmitting
+        network.reset_mock()
+        task = pdo._task = MagicMock()
+        pdo.set_values({'INTEGER16 value': 3, 0x2004: 4}, transmit=True)
+        task.update.assert_called_once_with(pdo.data)
+        network.send_message.assert_not_called()
+        self.assertEqual(pdo['INTEGER16 value'].raw, 3)
+        self.assertEqual(pdo['INTEGER32 value'].raw, 4)
+
+        # Failed batch is rolled back
+        task.reset_mock()
+        data = bytes(pdo.data)
+        with self.assertRaises(KeyError):
+            pdo.set_values({'INTEGER16 value': 5, 'DOES NOT EXIST': 6})
+        self.assertEqual(pdo.data, data)
+        task.update.assert_not_called()
+        pdo['INTEGER16 value'].raw = 5
+        task.update.assert_called_once_with(pdo.data)
+        pdo._task = None
+
     def test_pdo_getitem(self):
         node = self.node
         self.assertEqual(node.tpdo[1]['INTEGER16 value'].raw, -3)
@@ -140,5 +327,190 @@ class TestPDO(unittest.TestCase):
                         self.assertIn("Frame Name", header)
 
 
+class TestTpdoProducer(unittest.TestCase):
+    def setUp(self):
+        self.network = canopen.Network()
+        self.network.NOTIFIER_SHUTDOWN_TIMEOUT = 0.0
+        self.network.connect(interface="virtual")
+        self.rxbus = can.Bus(interface="virtual")
+        node = canopen.LocalNode(1, SAMPLE_EDS)
+        self.network.add_node(node)
+        pdo = node.tpdo[1]
+        pdo.clear()
+        pdo.add_variable('INTEGER16 value')
+        pdo.add_variable('UNSIGNED8 value')
+        pdo.cob_id = 0x181
+        pdo.enabled = True
+        pdo.trans_type = 254
+        node.sdo['INTEGER16 value'].raw = 5
+        node.nmt.state = 'OPERATIONAL'
+        self.node = node
+        self.pdo = pdo
+
+    def tearDown(self):
+        self.network.disconnect()
+        self.rxbus.shutdown()
+
+    def recv(self, timeout=0.5):
+        while True:
+            msg = self.rxbus.recv(timeout)
+            if msg is None or msg.arbitration_id == 0x181:
+                return msg
+
+    def test_change_of_state(self):
+        self.node.tpdo_producer.start()
+        self.assertEqual(self.pdo['INTEGER16 value'].raw, 5)
+        self.node.sdo['INTEGER16 value'].raw = 6
+        msg = self.recv()
+        self.assertEqual(msg.data, b'\x06\x00\x00')
+        # Unchanged value is not transmitted
+        self.node.sdo['INTEGER16 value'].raw = 6
+        self.node.sdo['UNSIGNED8 value'].raw = 7
+        msg = self.recv()
+        self.assertEqual(msg.data, b'\x06\x00\x07')
+        self.assertIsNone(self.recv(0.05))
+
+        self.node.tpdo_producer.stop()
+        self.node.sdo['UNSIGNED8 value'].raw = 8
+        self.assertIsNone(self.recv(0.05))
+
+    def test_inhibit_time(self):
+        self.pdo.inhibit_time = 1000  # 100 ms
+        self.node.tpdo_producer.start()
+        start = time.monotonic()
+        self.node.sdo['INTEGER16 value'].raw = 1
+        self.node.sdo['INTEGER16 value'].raw = 2
+        self.node.sdo['UNSIGNED8 value'].raw = 3
+        self.assertEqual(self.recv().data, b'\x01\x00\x00')
+        # Changes are combined at the end of the inhibit time
+        self.assertEqual(self.recv().data, b'\x02\x00\x03')
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        self.assertIsNone(self.recv(0.15))
+
+    def test_event_timer(self):
+        self.pdo.event_timer = 20
+        self.node.tpdo_producer.start()
+        start = time.monotonic()
+        self.assertEqual(self.recv().data, b'\x05\x00\x00')
+        self.assertEqual(self.recv().data, b'\x05\x00\x00')
+        self.assertGreaterEqual(time.monotonic() - start, 0.035)
+
+    def test_rejected_write(self):
+        def reject(index, subindex, od, data):
+            if data == b'\x09\x00':
+                raise canopen.SdoAbortedError(0x06090030)
+
+        self.node.add_write_callback(reject)
+        self.node.tpdo_producer.start()
+        with self.assertRaises(canopen.SdoAbortedError):
+            self.node.sdo['INTEGER16 value'].raw = 9
+        # Nothing is transmitted for a write which was not stored
+        self.assertIsNone(self.recv(0.05))
+        self.assertEqual(self.pdo['INTEGER16 value'].raw, 5)
+        self.node.remove_write_callback(reject)
+        self.node.sdo['INTEGER16 value'].raw = 9
+        self.assertEqual(self.recv().data, b'\x09\x00\x00')
+
+    def test_not_operational(self):
+        self.node.tpdo_producer.start()
+        self.node.nmt.state = 'PRE-OPERATIONAL'
+        self.node.sdo['INTEGER16 value'].raw = 1
+        self.assertIsNone(self.recv(0.05))
+        self.node.nmt.state = 'OPERATIONAL'
+        self.node.tpdo_producer.trigger(self.pdo)
+        self.assertEqual(self.recv().data, b'\x01\x00\x00')
+
+
+class TestSyncPdoEngine(unittest.TestCase):
+    def setUp(self):
+        self.network = canopen.Network()
+        self.network.NOTIFIER_SHUTDOWN_TIMEOUT = 0.0
+        self.network.connect(interface="virtual")
+        self.bus = can.Bus(interface="virtual", receive_own_messages=True)
+        node = canopen.LocalNode(1, SAMPLE_EDS)
+        self.network.add_node(node)
+        rpdo = node.rpdo[1]
+        rpdo.clear()
+        rpdo.add_variable('INTEGER16 value')
+        rpdo.cob_id = 0x201
+        rpdo.enabled = True
+        rpdo.trans_type = 1
+        tpdo = node.tpdo[1]
+        tpdo.clear()
+        tpdo.add_variable('INTEGER16 value')
+        tpdo.add_variable('UNSIGNED8 value')
+        tpdo.cob_id = 0x181
+        tpdo.enabled = True
+        tpdo.trans_type = 2
+        acyclic = node.tpdo[2]
+        acyclic.clear()
+        acyclic.add_variable('UNSIGNED8 value')
+        acyclic.cob_id = 0x281
+        acyclic.enabled = True
+        acyclic.trans_type = 0
+        node.sdo['INTEGER16 value'].raw = 0
+        node.sdo['UNSIGNED8 value'].raw = 0
+        node.nmt.state = 'OPERATIONAL'
+        self.node = node
+
+    def tearDown(self):
+        self.node.sync_engine.stop()
+        self.network.disconnect()
+        self.bus.shutdown()
+
+    def send(self, can_id, data=b""):
+        self.bus.send(can.Message(arbitration_id=can_id, data=data, is_extended_id=False))
+
+    def sync(self, counter=None):
+        """Send a SYNC and return all PDOs transmitted in response."""
+        self.send(0x80, b"" if counter is None else bytes([counter]))
+        received = {}
+        while True:
+            msg = self.bus.recv(0.05)
+            if msg is None:
+                return received
+            if msg.arbitration_id in (0x181, 0x281):
+                received[msg.arbitration_id] = bytes(msg.data)
+
+    def test_sync_cycle(self):
+        steps = []
+        self.node.sync_engine.add_callback(steps.append)
+        self.node.sync_engine.start()
+        self.assertEqual(self.sync(), {0x281: b'\x00'})
+
+        # RPDO is only applied on SYNC
+        self.send(0x201, b'\x07\x00')
+        time.sleep(0.05)
+        self.assertEqual(self.node.sdo['INTEGER16 value'].raw, 0)
+        self.assertEqual(self.sync(), {0x181: b'\x07\x00\x00'})
+        self.assertEqual(self.node.sdo['INTEGER16 value'].raw, 7)
+        self.assertEqual(steps, [None, None])
+
+        # Every second SYNC for the cyclic TPDO, on change for the acyclic one
+        self.node.sdo['UNSIGNED8 value'].raw = 3
+        self.assertEqual(self.sync(), {0x281: b'\x03'})
+        self.assertEqual(self.sync(), {0x181: b'\x07\x00\x03'})
+        self.node.sync_engine.trigger(self.node.tpdo[2])
+        self.assertEqual(self.sync(), {0x281: b'\x03'})
+
+        self.node.nmt.state = 'PRE-OPERATIONAL'
+        self.assertEqual(self.sync(), {})
+        self.node.sync_engine.stop()
+        self.node.nmt.state = 'OPERATIONAL'
+        self.assertEqual(self.sync(), {})
+
+    def test_sync_start_value(self):
+        self.node.tpdo[2].enabled = False
+        self.node.tpdo[1].sync_start_value = 3
+        self.node.sync_engine.start()
+        self.assertEqual(self.sync(1), {})
+        self.assertEqual(self.sync(2), {})
+        self.assertEqual(self.sync(3), {0x181: b'\x00\x00\x00'})
+        self.assertEqual(self.sync(4), {})
+        self.assertEqual(self.sync(5), {0x181: b'\x00\x00\x00'})
+        self.assertEqual(self.node.sync_engine.sync.counter, 5)
+        self.assertEqual(self.node.sync_engine.sync.count, 5)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,66 @@
+import threading
+import time
+import unittest
+
+from canopen.scheduler import Scheduler
+
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = Scheduler()
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def test_scheduler_order(self):
+        calls = []
+        done = threading.Event()
+        now = time.monotonic()
+        self.scheduler.call_at(now + 0.02, lambda: calls.append(2))
+        self.scheduler.call_at(now + 0.01, lambda: calls.append(1))
+        self.scheduler.call_at(now + 0.02, lambda: (calls.append(3), done.set()))
+        self.assertTrue(done.wait(1))
+        self.assertEqual(calls, [1, 2, 3])
+        self.assertGreaterEqual(time.monotonic(), now + 0.02)
+
+    def test_scheduler_earlier_deadline(self):
+        calls = []
+        done = threading.Event()
+        self.scheduler.call_later(0.5, lambda: calls.append("late"))
+        self.scheduler.call_later(0.01, lambda: (calls.append("early"), done.set()))
+        self.assertTrue(done.wait(0.2))
+        self.assertEqual(calls, ["early"])
+
+    def test_scheduler_cancel(self):
+        calls = []
+        done = threading.Event()
+        handle = self.scheduler.call_later(0.01, lambda: calls.append(1))
+        handle.cancel()
+        self.scheduler.call_later(0.02, done.set)
+        self.assertTrue(done.wait(1))
+        self.assertEqual(calls, [])
+
+    def test_scheduler_error_in_callback(self):
+        done = threading.Event()
+
+        def fail():
+            raise RuntimeError("Failure")
+
+        with self.assertLogs("canopen.scheduler", "ERROR"):
+            self.scheduler.call_later(0, fail)
+            self.scheduler.call_later(0.01, done.set)
+            self.assertTrue(done.wait(1))
+
+    def test_scheduler_stop_restart(self):
+        calls = []
+        self.scheduler.call_later(0.05, lambda: calls.append(1))
+        self.scheduler.stop()
+        done = threading.Event()
+        self.scheduler.call_later(0, done.set)
+        self.assertTrue(done.wait(1))
+        time.sleep(0.1)
+        self.assertEqual(calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
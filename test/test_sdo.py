@@ -1,4 +1,10 @@
+import asyncio
+import io
+import logging
+import queue
+import threading
 import unittest
+from unittest.mock import patch
 
 import canopen
 import canopen.objectdictionary.datatypes as dt
@@ -58,6 +64,53 @@ class TestSDOVariables(unittest.TestCase):
         self.assertIsNone(self.sdo_node.get_variable(0x9999))
 
 
+class TestResponseMailbox(unittest.TestCase):
+
+    def test_get_in_order(self):
+        mailbox = canopen.sdo.client.ResponseMailbox()
+        self.assertTrue(mailbox.empty())
+        mailbox.put(b"\x01")
+        mailbox.put(b"\x02")
+        self.assertFalse(mailbox.empty())
+        self.assertEqual(mailbox.wait(0), b"\x01")
+        self.assertEqual(mailbox.drain(), [b"\x02"])
+        self.assertTrue(mailbox.empty())
+
+    def test_get_timeout(self):
+        mailbox = canopen.sdo.client.ResponseMailbox()
+        self.assertIsNone(mailbox.wait(0.01))
+
+    def test_get_from_other_thread(self):
+        mailbox = canopen.sdo.client.ResponseMailbox()
+        timer = threading.Timer(0.01, mailbox.put, (b"\x03",))
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertEqual(mailbox.wait(1.0), b"\x03")
+
+    def test_queue_interface(self):
+        mailbox = canopen.sdo.client.ResponseMailbox()
+        mailbox.put_nowait(b"\x01")
+        mailbox.put(b"\x02", block=True, timeout=1.0)
+        self.assertEqual(mailbox.qsize(), 2)
+        self.assertEqual(mailbox.get(), b"\x01")
+        self.assertEqual(mailbox.get(block=True, timeout=0.01), b"\x02")
+        with self.assertRaises(queue.Empty):
+            mailbox.get(block=True, timeout=0.01)
+        with self.assertRaises(queue.Empty):
+            mailbox.get(block=False)
+        with self.assertRaises(queue.Empty):
+            mailbox.get_nowait()
+        with self.assertRaises(ValueError):
+            mailbox.get(timeout=-1)
+
+    def test_client_responses(self):
+        sdo = canopen.sdo.SdoClient(0x601, 0x581, canopen.ObjectDictionary())
+        sdo.on_response(0x581, bytearray(b"\x60\x00\x20\x00\x00\x00\x00\x00"), 0.0)
+        self.assertFalse(sdo.responses.empty())
+        self.assertEqual(sdo.responses.get(timeout=0.1), b"\x60\x00\x20\x00\x00\x00\x00\x00")
+        self.assertTrue(sdo.responses.empty())
+
+
 class TestSDO(unittest.TestCase):
     """
     Test SDO traffic by example. Most are taken from
@@ -132,6 +185,49 @@ class TestSDO(unittest.TestCase):
         self.network[2].sdo[0x1017].raw = 4000
         self.assertTrue(self.message_sent)
 
+    def test_expedited_reused_request(self):
+        # Data of a previous download must not leak into the next request
+        self.data = [
+            (TX, b'\x2b\x17\x10\x00\xa0\x0f\x00\x00'),
+            (RX, b'\x60\x17\x10\x00\x00\x00\x00\x00'),
+            (TX, b'\x40\x17\x10\x00\x00\x00\x00\x00'),
+            (RX, b'\x4b\x17\x10\x00\xa0\x0f\x00\x00'),
+        ]
+        self.network[2].sdo[0x1017].raw = 4000
+        self.assertEqual(self.network[2].sdo[0x1017].raw, 4000)
+        self.assertEqual(self.data, [])
+
+    def test_expedited_object_segmented_response(self):
+        # Servers may choose a segmented transfer even for small objects
+        self.data = [
+            (TX, b'\x40\x17\x10\x00\x00\x00\x00\x00'),
+            (RX, b'\x41\x17\x10\x00\x02\x00\x00\x00'),
+            (TX, b'\x60\x00\x00\x00\x00\x00\x00\x00'),
+            (RX, b'\x0b\xa0\x0f\x00\x00\x00\x00\x00'),
+        ]
+        self.assertEqual(self.network[2].sdo[0x1017].raw, 4000)
+        self.assertEqual(self.data, [])
+
+    def test_stale_response_discarded(self):
+        self.data = [
+            (TX, b'\x40\x18\x10\x01\x00\x00\x00\x00'),
+            (RX, b'\x43\x18\x10\x01\x04\x00\x00\x00'),
+            (TX, b'\x40\x17\x10\x00\x00\x00\x00\x00'),
+            (RX, b'\x43\x18\x10\x01\x04\x00\x00\x00'),  # late duplicate response
+            (RX, b'\x4b\x17\x10\x00\xa0\x0f\x00\x00'),
+        ]
+        self.assertEqual(self.network[2].sdo[0x1018][1].raw, 4)
+        self.assertEqual(self.network[2].sdo[0x1017].raw, 4000)
+        self.assertEqual(self.data, [])
+
+    def test_other_client_response(self):
+        self.data = [
+            (TX, b'\x40\x17\x10\x00\x00\x00\x00\x00'),
+            (RX, b'\x4b\x18\x10\x01\x04\x00\x00\x00'),
+        ]
+        with self.assertRaisesRegex(canopen.SdoCommunicationError, "another SDO client"):
+            self.network[2].sdo[0x1017].raw
+
     def test_segmented_upload(self):
         self.data = [
             (TX, b'\x40\x08\x10\x00\x00\x00\x00\x00'),
@@ -215,6 +311,24 @@ class TestSDO(unittest.TestCase):
             data = fp.read()
         self.assertEqual(data, 'Tiny Node - Mega Domains !')
 
+    def test_upload_to_block(self):
+        self.data = [
+            (TX, b'\xa4\x08\x10\x00\x7f\x00\x00\x00'),
+            (RX, b'\xc6\x08\x10\x00\x1a\x00\x00\x00'),
+            (TX, b'\xa3\x00\x00\x00\x00\x00\x00\x00'),
+            (RX, b'\x01\x54\x69\x6e\x79\x20\x4e\x6f'),
+            (RX, b'\x02\x64\x65\x20\x2d\x20\x4d\x65'),
+            (RX, b'\x03\x67\x61\x20\x44\x6f\x6d\x61'),
+            (RX, b'\x84\x69\x6e\x73\x20\x21\x00\x00'),
+            (TX, b'\xa2\x04\x7f\x00\x00\x00\x00\x00'),
+            (RX, b'\xc9\x40\xe1\x00\x00\x00\x00\x00'),
+            (TX, b'\xa1\x00\x00\x00\x00\x00\x00\x00')
+        ]
+        buffer = bytearray()
+        self.network[2].sdo.upload_to(0x1008, 0, buffer, block_transfer=True)
+        self.assertEqual(buffer, b'Tiny Node - Mega Domains !')
+        self.assertEqual(self.data, [])
+
     def test_sdo_block_upload_retransmit(self):
         """Trigger a retransmit by only validating a block partially."""
         self.data = [
@@ -520,6 +634,85 @@ class TestSDO(unittest.TestCase):
             data = fp.read()
         self.assertEqual(data, 39 * 'the crazy fox jumps over the lazy dog\n')
 
+    def test_block_upload_adaptive(self):
+        self.network[2].sdo.ADAPTIVE_BLOCK_SIZE = True
+        self.data = [
+            (TX, b'\xa4\x08\x10\x00\x7f\x00\x00\x00'),
+            (RX, b'\xc0\x08\x10\x00\x00\x00\x00\x00'),
+            (TX, b'\xa3\x00\x00\x00\x00\x00\x00\x00'),
+            (RX, b'\x01\x54\x69\x6e\x79\x20\x4e\x6f'),
+            (RX, b'\x03\x67\x61\x20\x44\x6f\x6d\x61'),  # --> Lost seqno 2
+            (TX, b'\xa2\x01\x3f\x00\x00\x00\x00\x00'),  # --> Block size halved
+            (RX, b'\x01\x64\x65\x20\x2d\x20\x4d\x65'),
+            (RX, b'\x02\x67\x61\x20\x44\x6f\x6d\x61'),
+            (RX, b'\x83\x69\x6e\x73\x20\x21\x00\x00'),
+            (TX, b'\xa2\x03\x4f\x00\x00\x00\x00\x00'),  # --> Block size grows again
+            (RX, b'\xc9\x00\x00\x00\x00\x00\x00\x00'),
+            (TX, b'\xa1\x00\x00\x00\x00\x00\x00\x00')
+        ]
+        with self.network[2].sdo[0x1008].open('r', block_transfer=True) as fp:
+            data = fp.read()
+            self.assertEqual(fp.buffer.raw.retransmissions, 1)
+            self.assertGreater(fp.buffer.raw.bytes_per_second, 0)
+        self.assertEqual(data, 'Tiny Node - Mega Domains !')
+
+    def test_download_file_block(self):
+        self.data = [
+            (TX, b'\xc6\x00\x20\x00\x1e\x00\x00\x00'),
+            (RX, b'\xa4\x00\x20\x00\x7f\x00\x00\x00'),
+            (TX, b'\x01\x41\x20\x72\x65\x61\x6c\x6c'),
+            (TX, b'\x02\x79\x20\x72\x65\x61\x6c\x6c'),
+            (TX, b'\x03\x79\x20\x6c\x6f\x6e\x67\x20'),
+            (TX, b'\x04\x73\x74\x72\x69\x6e\x67\x2e'),
+            (TX, b'\x85\x2e\x2e\x00\x00\x00\x00\x00'),
+            (RX, b'\xa2\x05\x7f\x00\x00\x00\x00\x00'),
+            (TX, b'\xd5\x45\x69\x00\x00\x00\x00\x00'),
+            (RX, b'\xa1\x00\x00\x00\x00\x00\x00\x00')
+        ]
+        fp = io.BytesIO(b'A really really long string...')
+        # Buffer size not a multiple of the segment size
+        self.network[2].sdo.download_file(0x2000, 0, fp, chunk_size=10)
+        self.assertEqual(self.data, [])
+
+    def test_download_file_too_short(self):
+        self.data = [
+            (TX, b'\xc6\x00\x20\x00\x1e\x00\x00\x00'),
+            (RX, b'\xa4\x00\x20\x00\x7f\x00\x00\x00'),
+            # Pending sub-block is dropped, no end of transfer
+            (TX, b'\x80\x00\x00\x00\x13\x00\x07\x06'),
+        ]
+        fp = io.BytesIO(b'A really')
+        with self.assertRaises(ValueError):
+            self.network[2].sdo.download_file(0x2000, 0, fp, size=30)
+        self.assertEqual(self.data, [])
+
+    def test_block_download_batched(self):
+        acks = [
+            b'\xa2\x03\x03\x00\x00\x00\x00\x00',
+            b'\xa2\x02\x03\x00\x00\x00\x00\x00',
+        ]
+        sent = []
+
+        def send_messages(can_id, frames):
+            sent.append([bytes(frame[:1]) for frame in frames])
+            self.network.notify(0x582, acks.pop(0), 0.0)
+
+        self.network.send_messages = send_messages
+        self.data = [
+            (TX, b'\xc6\x00\x20\x00\x1e\x00\x00\x00'),
+            (RX, b'\xa4\x00\x20\x00\x03\x00\x00\x00'),  # block size 3
+            (TX, b'\xd5\x45\x69\x00\x00\x00\x00\x00'),
+            (RX, b'\xa1\x00\x00\x00\x00\x00\x00\x00'),
+        ]
+        data = b'A really really long string...'
+        with self.network[2].sdo['Writable string'].open(
+            'wb', size=len(data), block_transfer=True) as fp:
+            fp.write(data)
+        # Each sub-block is sent at once
+        self.assertEqual(sent, [[b'\x01', b'\x02', b'\x03'], [b'\x01', b'\x82']])
+        self.assertEqual(fp.raw.retransmissions, 0)
+        self.assertEqual(self.data, [])
+
     def test_writable_file(self):
         self.data = [
             (TX, b'\x20\x00\x20\x00\x00\x00\x00\x00'),
@@ -553,6 +746,70 @@ class TestSDO(unittest.TestCase):
         self.assertIn(client, self.network[2].sdo_channels)
 
 
+class TestAsyncSDO(unittest.IsolatedAsyncioTestCase):
+    """Test the asynchronous SDO client API against local nodes."""
+
+    async def asyncSetUp(self):
+        self.server_network = canopen.Network()
+        self.server_network.NOTIFIER_SHUTDOWN_TIMEOUT = 0.0
+        self.server_network.connect("test_async", interface="virtual")
+        self.addCleanup(self.server_network.disconnect)
+        self.local_nodes = [self.server_network.create_node(n, SAMPLE_EDS)
+                            for n in (2, 3)]
+
+        self.network = canopen.AsyncNetwork()
+        self.network.NOTIFIER_SHUTDOWN_TIMEOUT = 0.0
+        self.network.connect("test_async", interface="virtual")
+        self.addCleanup(self.network.disconnect)
+        self.remote_nodes = [self.network.add_node(n, SAMPLE_EDS) for n in (2, 3)]
+
+    async def test_expedited(self):
+        local, remote = self.local_nodes[0], self.remote_nodes[0]
+        await remote.sdo.adownload(0x1400, 1, b"\x99\x02\x00\x00")
+        self.assertEqual(local.sdo[0x1400][1].raw, 0x299)
+        data = await remote.sdo.aupload(0x1400, 1)
+        self.assertEqual(data, b"\x99\x02\x00\x00")
+
+    async def test_segmented(self):
+        local, remote = self.local_nodes[0], self.remote_nodes[0]
+        await remote.sdo["Writable string"].aset_raw("A long string of text")
+        self.assertEqual(local.sdo["Writable string"].raw, "A long string of text")
+        value = await remote.sdo["Writable string"].aget_raw()
+        self.assertEqual(value, "A long string of text")
+
+    async def test_concurrent_nodes(self):
+        for node_id, local in enumerate(self.local_nodes, start=2):
+            local.sdo[0x1017].raw = 100 * node_id
+        results = await asyncio.gather(
+            *(remote.sdo[0x1017].aget_raw() for remote in self.remote_nodes),
+            self.remote_nodes[0].sdo[0x1017].aget_raw(),
+        )
+        self.assertEqual(results, [200, 300, 200])
+
+    async def test_abort(self):
+        remote = self.remote_nodes[0]
+        with self.assertRaises(canopen.SdoAbortedError) as cm:
+            await remote.sdo.aupload(0x1234, 0)
+        self.assertEqual(cm.exception.code, 0x06020000)
+
+    async def test_timeout(self):
+        remote = self.network.add_node(10, SAMPLE_EDS)
+        remote.sdo.RESPONSE_TIMEOUT = 0.01
+        with self.assertRaises(canopen.SdoCommunicationError):
+            with self.assertLogs(level=logging.ERROR):
+                await remote.sdo.aupload(0x1000, 0)
+
+    async def test_abort_does_not_block(self):
+        remote = self.network.add_node(10, SAMPLE_EDS)
+        remote.sdo.RESPONSE_TIMEOUT = 0.01
+        remote.sdo.PAUSE_BEFORE_SEND = 0.001
+        with patch("canopen.sdo.client.time.sleep") as sleep:
+            with self.assertRaises(canopen.SdoCommunicationError):
+                with self.assertLogs(level=logging.ERROR):
+                    await remote.sdo.aupload(0x1000, 0)
+        sleep.assert_not_called()
+
+
 class TestSDOClientDatatypes(unittest.TestCase):
     """Test the SDO client uploads with the different data types in CANopen."""
 
@@ -84,6 +84,86 @@ class TestSync(unittest.TestCase):
         self.sync.stop()
         self.sync.start(PERIOD)
 
+    def test_sync_producer_precise(self):
+        self.sync.counter_overflow = 3
+        pdo = canopen.pdo.PdoMap(None, None, None)
+        pdo.cob_id = 0x201
+        pdo.data = bytearray(b"\x01\x02")
+        self.sync.add_pdo(pdo)
+        self.sync.start(PERIOD, busy_wait=0.001)
+        self.addCleanup(self.sync.stop)
+        frames = []
+        while len(frames) < 8:
+            msg = self.rxbus.recv(TIMEOUT)
+            self.assertIsNotNone(msg)
+            frames.append((msg.arbitration_id, bytes(msg.data)))
+        self.sync.stop()
+        # Each SYNC is followed by the PDO
+        self.assertEqual(frames[:8], [
+            (0x80, b"\x01"), (0x201, b"\x01\x02"),
+            (0x80, b"\x02"), (0x201, b"\x01\x02"),
+            (0x80, b"\x03"), (0x201, b"\x01\x02"),
+            (0x80, b"\x01"), (0x201, b"\x01\x02"),
+        ])
+        stats = self.sync.statistics
+        self.assertGreaterEqual(stats.count, 4)
+        self.assertEqual(sum(stats.jitter.counts), stats.count)
+        self.assertEqual(stats.periods.count, stats.count - 1)
+        self.assertGreaterEqual(stats.jitter.min, 0.0)
+        self.assertAlmostEqual(stats.periods.mean, PERIOD, delta=PERIOD / 2)
+        stats.reset()
+        self.assertEqual(stats.count, 0)
+
+    def test_sync_producer_precise_stop_timeout(self):
+        entered = threading.Event()
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def transmit(count):
+            entered.set()
+            release.wait(TIMEOUT)
+
+        self.sync._transmit_fused = transmit
+        self.sync.start(PERIOD, precise=True)
+        thread = self.sync._task
+        self.assertTrue(entered.wait(TIMEOUT))
+        # Stopping does not block on a stuck transmission
+        with self.assertLogs("canopen.sync", "ERROR"):
+            thread.stop(timeout=0.01)
+        release.set()
+        thread._thread.join(TIMEOUT)
+        self.assertFalse(thread._thread.is_alive())
+        self.sync._task = None
+
+    def test_histogram(self):
+        hist = canopen.sync.Histogram(0.0, 1.0, 3)
+        for value in (-1.0, 0.5, 1.5, 1.2, 7.0):
+            hist.add(value)
+        self.assertEqual(hist.counts, [2, 2, 1])
+        self.assertEqual(hist.edges, [0.0, 1.0, 2.0])
+        self.assertEqual(hist.count, 5)
+        self.assertEqual(hist.min, -1.0)
+        self.assertEqual(hist.max, 7.0)
+        self.assertAlmostEqual(hist.mean, 1.84)
+
+
+class TestSyncConsumer(unittest.TestCase):
+    def test_sync_consumer(self):
+        network = canopen.Network()
+        consumer = canopen.sync.SyncConsumer(network)
+        received = []
+        consumer.add_callback(lambda counter, ts: received.append((counter, ts)))
+        consumer.start()
+        network.notify(0x80, bytearray(), 1.0)
+        network.notify(0x80, bytearray(b"\x05"), 2.0)
+        self.assertEqual(received, [(None, 1.0), (5, 2.0)])
+        self.assertEqual(consumer.count, 2)
+        self.assertEqual(consumer.counter, 5)
+        self.assertEqual(consumer.timestamp, 2.0)
+        consumer.stop()
+        network.notify(0x80, bytearray(), 3.0)
+        self.assertEqual(consumer.count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()